@@ -369,12 +369,7 @@ class DecisionService:
 
     def _sign_response(self, response: DecisionResponse) -> None:
         """Sign the decision response."""
-        import base64
-
-        decision_hash = response.decision_hash
-        message = decision_hash.encode()
-        signature_bytes = self.identity.key_manager.private_key.sign(message)
-        response.signature = base64.b64encode(signature_bytes).decode()
+        response.signature = self.identity.key_manager.sign_bytes(response.decision_hash.encode())
 
     def evaluate(
         self,
@@ -11,9 +11,127 @@ Creates ZIP archives containing:
 import hashlib
 import io
 import json
+import sys
+import threading
 import zipfile
+import zlib
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from lexecon.ledger.chain import LedgerEntry
+
+# Optional ISA-L deflate backend (SIMD-accelerated, zlib stream compatible)
+try:
+    from isal import isal_zlib
+
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
+
+# Deflate level for the JSON files. The indented output repeats the same
+# keys (and many nulls) for every event, so zlib's "fastest" level already
+# removes most of the redundancy at a fraction of the default level's CPU.
+JSON_COMPRESSLEVEL = 1
+
+# summary.md is plain prose and tables; it is worth the default level.
+# With the ISA-L backend levels are clamped to 0-3, so this acts as 3.
+SUMMARY_COMPRESSLEVEL = 6
+
+# Low-cardinality ledger data fields that repeat across entries ("allow",
+# "read", "high", ...). Interned once so counting and comparisons hash and
+# compare shared string objects.
+INTERNED_DATA_FIELDS = ('decision', 'action', 'risk_level')
+
+# summary.md table row templates
+OUTCOME_ROW = "| {} | {} | {:.1f}% |\n"
+COUNT_ROW = "| {} | {} |\n"
+POLICY_ROW = "- `{}...`\n"
+
+
+class _IsalDeflate:
+    """zlib stand-in for :mod:`zipfile` that deflates with ISA-L.
+
+    ``zipfile`` has no pluggable compressor and looks up ``zlib.compressobj``
+    at write time, so this shim forwards everything to the stdlib ``zlib``
+    module. Only threads registered in ``threads`` (those currently inside
+    :func:`_isal_deflate`) get ISA-L compressors; ISA-L supports levels 0-3,
+    so their zlib levels are clamped into that range.
+    """
+
+    def __init__(self) -> None:
+        self.threads: Set[int] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(zlib, name)
+
+    def compressobj(self, level: int = zlib.Z_DEFAULT_COMPRESSION, *args: Any, **kwargs: Any) -> Any:
+        if threading.get_ident() not in self.threads:
+            return zlib.compressobj(level, *args, **kwargs)
+        if level < 0:
+            level = isal_zlib.ISAL_DEFAULT_COMPRESSION
+        return isal_zlib.compressobj(min(level, isal_zlib.ISAL_BEST_COMPRESSION), *args, **kwargs)
+
+
+_isal_shim = _IsalDeflate()
+_isal_lock = threading.Lock()
+
+
+@contextmanager
+def _isal_deflate() -> Iterator[None]:
+    """Deflate ZIP members written by the current thread with ISA-L.
+
+    The shim is installed on :mod:`zipfile` only while at least one export
+    is inside this block and is removed again afterwards. No-op when isal
+    is not installed or another library has already replaced ``zipfile.zlib``.
+    """
+    # zipfile's stub does not declare its zlib attribute, hence the ignores
+    with _isal_lock:
+        active = ISAL_AVAILABLE and zipfile.zlib in (zlib, _isal_shim)  # type: ignore[attr-defined]
+        if active:
+            _isal_shim.threads.add(threading.get_ident())
+            zipfile.zlib = _isal_shim  # type: ignore[attr-defined]
+    try:
+        yield
+    finally:
+        if active:
+            with _isal_lock:
+                _isal_shim.threads.discard(threading.get_ident())
+                if not _isal_shim.threads and zipfile.zlib is _isal_shim:  # type: ignore[attr-defined]
+                    zipfile.zlib = zlib  # type: ignore[attr-defined]
+
+
+def _entry_attr(entry: Any, name: str) -> Any:
+    """Read a field from a ``LedgerEntry`` or its dict form."""
+    return entry.get(name) if isinstance(entry, dict) else getattr(entry, name)
+
+
+def _expected_hash(entry: Any) -> str:
+    """Recompute the hash a ledger entry should carry."""
+    if isinstance(entry, dict):
+        entry = LedgerEntry(
+            entry_id=entry.get('entry_id', ''),
+            event_type=entry.get('event_type', ''),
+            data=entry.get('data', {}),
+            timestamp=entry.get('timestamp', ''),
+            previous_hash=entry.get('previous_hash', ''),
+        )
+    ledger_entry: LedgerEntry = entry
+    return ledger_entry.calculate_hash()
+
+
+def _intern_fields(entry: Dict[str, Any]) -> None:
+    """Intern the repeated string fields of a ledger entry dict in place."""
+    event_type = entry.get('event_type')
+    if type(event_type) is str:
+        entry['event_type'] = sys.intern(event_type)
+    data = entry.get('data')
+    if not data:
+        return
+    for key in INTERNED_DATA_FIELDS:
+        value = data.get(key)
+        if type(value) is str:
+            data[key] = sys.intern(value)
 
 
 class EvidenceBundle:
@@ -27,6 +145,7 @@ class EvidenceBundle:
         ledger_entries: List[Dict] = None,
         verification_report: Dict = None,
         policies: List[Dict] = None,
+        exported_at: Optional[str] = None,
     ):
         self.tenant_id = tenant_id
         self.start_time = start_time
@@ -34,13 +153,16 @@ class EvidenceBundle:
         self.ledger_entries = ledger_entries or []
         self.verification_report = verification_report or {}
         self.policies = policies or []
-        self.exported_at = datetime.now(timezone.utc).isoformat()
+        self._sorted_policy_hashes: Optional[List[str]] = None
+        self.exported_at = exported_at or datetime.now(timezone.utc).isoformat()
 
     def to_zip_bytes(self, signature_service=None) -> bytes:
         """Generate ZIP archive as bytes."""
         buffer = io.BytesIO()
         
-        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with _isal_deflate(), zipfile.ZipFile(
+            buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=JSON_COMPRESSLEVEL
+        ) as zf:
             files_manifest = []
             
             # 1. ledger_events.json
@@ -69,7 +191,7 @@ class EvidenceBundle:
             
             # 4. summary.md
             summary_content = self._generate_summary_md()
-            zf.writestr('summary.md', summary_content)
+            zf.writestr('summary.md', summary_content, compresslevel=SUMMARY_COMPRESSLEVEL)
             files_manifest.append({
                 'path': 'summary.md',
                 'sha256': hashlib.sha256(summary_content.encode()).hexdigest()
@@ -122,15 +244,17 @@ class EvidenceBundle:
 
     def _generate_verification_report_json(self) -> str:
         """Generate verification_report.json content."""
-        report = self.verification_report or {}
+        report = self.verification_report
+        checked = report.get('entries_checked', 0)
         
         payload = {
             'tenant_id': self.tenant_id,
             'exported_at': self.exported_at,
-            'verified': report.get('valid', True),
-            'checked_count': report.get('entries_checked', len(self.ledger_entries)),
-            'failed_count': report.get('entries_checked', 0) - report.get('entries_verified', 0),
-            'failures': [],  # Populate if verification finds issues
+            # None when verification was not requested for this export
+            'verified': report.get('valid') if report else None,
+            'checked_count': checked,
+            'failed_count': checked - report.get('entries_verified', 0),
+            'failures': report.get('failures', []),
             'method': {
                 'chain_verification': True,
                 'hash_algorithm': 'sha256',
@@ -140,22 +264,30 @@ class EvidenceBundle:
         }
         return json.dumps(payload, indent=2)
 
+    def _policy_hashes(self) -> List[str]:
+        """Sorted unique policy version hashes referenced by the entries.
+
+        Shared by policies.json and summary.md, so the entries are only
+        scanned once per bundle.
+        """
+        if self._sorted_policy_hashes is None:
+            policy_hashes = set()
+            for entry in self.ledger_entries:
+                data = entry.get('data', {})
+                if data.get('policy_version_hash'):
+                    policy_hashes.add(data['policy_version_hash'])
+            self._sorted_policy_hashes = sorted(policy_hashes)
+        return self._sorted_policy_hashes
+
     def _generate_policies_json(self) -> str:
         """Generate policies.json content."""
-        # Extract unique policy hashes from ledger entries
-        policy_hashes = set()
-        for entry in self.ledger_entries:
-            data = entry.get('data', {})
-            if data.get('policy_version_hash'):
-                policy_hashes.add(data['policy_version_hash'])
-        
         policy_versions = [
             {
                 'policy_version_hash': h,
                 'policy_id': None,
                 'name': None,
             }
-            for h in sorted(policy_hashes)
+            for h in self._policy_hashes()
         ]
         
         payload = {
@@ -187,13 +319,6 @@ class EvidenceBundle:
             risk = data.get('risk_level', 'unknown')
             risk_levels[risk] = risk_levels.get(risk, 0) + 1
         
-        # Policy hashes
-        policy_hashes = set()
-        for entry in self.ledger_entries:
-            data = entry.get('data', {})
-            if data.get('policy_version_hash'):
-                policy_hashes.add(data['policy_version_hash'][:16] + '...')
-        
         md = f"""# Lexecon Evidence Export Summary
 
 **Tenant:** {self.tenant_id}  
@@ -208,7 +333,7 @@ class EvidenceBundle:
 |--------|-------|
 | Total Ledger Entries | {total} |
 | Decision Events | {len(decisions)} |
-| Verification Status | {'✅ VERIFIED' if self.verification_report.get('valid') else '❌ FAILED'} |
+| Verification Status | {self._verification_status()} |
 
 ---
 
@@ -217,9 +342,9 @@ class EvidenceBundle:
 | Outcome | Count | Percentage |
 |---------|-------|------------|
 """
+        inv_decisions = 100.0 / len(decisions) if decisions else 0.0
         for outcome, count in sorted(outcomes.items()):
-            pct = (count / len(decisions) * 100) if decisions else 0
-            md += f"| {outcome.upper()} | {count} | {pct:.1f}% |\n"
+            md += OUTCOME_ROW.format(outcome.upper(), count, count * inv_decisions)
         
         md += f"""
 ---
@@ -230,7 +355,7 @@ class EvidenceBundle:
 |--------|-------|
 """
         for action, count in sorted(actions.items(), key=lambda x: -x[1])[:10]:
-            md += f"| {action} | {count} |\n"
+            md += COUNT_ROW.format(action, count)
         
         md += f"""
 ---
@@ -241,7 +366,7 @@ class EvidenceBundle:
 |------------|-------|
 """
         for risk, count in sorted(risk_levels.items()):
-            md += f"| {risk.upper()} | {count} |\n"
+            md += COUNT_ROW.format(risk.upper(), count)
         
         md += f"""
 ---
@@ -249,8 +374,8 @@ class EvidenceBundle:
 ## Policy Versions Referenced
 
 """
-        for h in sorted(policy_hashes):
-            md += f"- `{h}`\n"
+        for h in self._policy_hashes():
+            md += POLICY_ROW.format(h[:16])
         
         md += f"""
 ---
@@ -283,31 +408,42 @@ To verify independently:
 """
         return md
 
+    def _verification_status(self) -> str:
+        """Human-readable chain verification status for summary.md."""
+        if not self.verification_report:
+            return '⏭️ SKIPPED'
+        return '✅ VERIFIED' if self.verification_report.get('valid') else '❌ FAILED'
+
     def _generate_manifest_json(self, files: List[Dict], signature_service=None) -> str:
         """Generate signed manifest.json."""
         # Compute bundle hash (hash of concatenated file hashes)
         file_hashes = ''.join(f['sha256'] for f in sorted(files, key=lambda x: x['path']))
         bundle_hash = hashlib.sha256(file_hashes.encode()).hexdigest()
         
-        # Sign if service available
-        signature = None
-        if signature_service:
-            try:
-                signature = signature_service.sign(bundle_hash)
-            except Exception:
-                pass
-        
         manifest = {
             'tenant_id': self.tenant_id,
             'exported_at': self.exported_at,
             'bundle_files': files,
             'bundle_hash': bundle_hash,
-            'signature': signature,
-            'signing_key_id': 'lexecon_root_001' if signature else None,
+            'signature': None,
+            'signing_key_id': None,
             'format_version': '1.0.0',
         }
+        if signature_service is not None:
+            self._sign_manifest(manifest, signature_service)
         return json.dumps(manifest, indent=2)
 
+    @staticmethod
+    def _sign_manifest(manifest: Dict[str, Any], signature_service: Any) -> None:
+        """Fill in the manifest signature fields; left unset if signing fails."""
+        try:
+            signature = signature_service.sign(manifest['bundle_hash'])
+        except Exception:
+            return
+        if signature:
+            manifest['signature'] = signature
+            manifest['signing_key_id'] = 'lexecon_root_001'
+
 
 class EvidenceExportService:
     """Service for generating evidence export bundles."""
@@ -323,15 +459,17 @@ class EvidenceExportService:
         end_time: Optional[str] = None,
         limit: int = 1000,
         include_verification: bool = True,
+        exported_at: Optional[str] = None,
     ) -> bytes:
-        """Generate evidence export bundle as ZIP bytes."""
-        # Filter entries by time range
-        entries = self._filter_entries(start_time, end_time, limit)
-        
-        # Get verification report
-        verification_report = {}
-        if include_verification and self.ledger:
-            verification_report = self.ledger.verify_integrity()
+        """Generate evidence export bundle as ZIP bytes.
+
+        ``exported_at`` lets batch callers stamp many bundles with one
+        ISO timestamp; it defaults to the current UTC time.
+        """
+        # Filter entries by time range, verifying the chain in the same pass
+        entries, verification_report = self._filter_entries(
+            start_time, end_time, limit, verify=include_verification
+        )
         
         # Create bundle
         bundle = EvidenceBundle(
@@ -340,6 +478,7 @@ class EvidenceExportService:
             end_time=end_time,
             ledger_entries=entries,
             verification_report=verification_report,
+            exported_at=exported_at,
         )
         
         return bundle.to_zip_bytes(self.signature_service)
@@ -349,11 +488,50 @@ class EvidenceExportService:
         start_time: Optional[str],
         end_time: Optional[str],
         limit: int,
-    ) -> List[Dict]:
-        """Filter ledger entries by time range."""
+        verify: bool = False,
+    ) -> Tuple[List[Dict], Dict[str, Any]]:
+        """Filter ledger entries by time range.
+
+        When ``verify`` is set, the whole chain (back to genesis) is checked
+        for entry hash integrity and linkage during the same walk, so the
+        ledger is not traversed a second time by ``verify_integrity``.
+
+        Returns:
+            Tuple of (filtered entries, verification report). The report is
+            empty when ``verify`` is False.
+        """
+        ledger_entries = self.ledger.entries
+        window_start = len(ledger_entries) - len(ledger_entries[-limit:])  # Most recent first
+        
         entries = []
+        failures = []
+        prev_hash = None
         
-        for entry in self.ledger.entries[-limit:]:  # Most recent first
+        # Verification checks the whole chain; otherwise only the window
+        # of the most recent entries is visited
+        if verify:
+            walk = enumerate(ledger_entries)
+        else:
+            walk = enumerate(ledger_entries[window_start:], window_start)
+
+        for i, entry in walk:
+            if verify:
+                entry_hash = _entry_attr(entry, 'entry_hash')
+                if entry_hash != _expected_hash(entry):
+                    failures.append({
+                        'entry_id': _entry_attr(entry, 'entry_id'),
+                        'error': f"Hash mismatch at entry {i}",
+                    })
+                elif i > 0 and _entry_attr(entry, 'previous_hash') != prev_hash:
+                    failures.append({
+                        'entry_id': _entry_attr(entry, 'entry_id'),
+                        'error': f"Chain break at entry {i}",
+                    })
+                prev_hash = entry_hash
+            
+            if i < window_start:
+                continue
+            
             entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
             
             # Time filtering (simple string comparison works for ISO format)
@@ -363,6 +541,17 @@ class EvidenceExportService:
             if end_time and ts > end_time:
                 continue
             
+            _intern_fields(entry_dict)
             entries.append(entry_dict)
         
-        return entries
+        if not verify:
+            return entries, {}
+        
+        checked = len(ledger_entries)
+        return entries, {
+            'valid': checked > 0 and not failures,
+            'entries_checked': checked,
+            'entries_verified': checked - len(failures),
+            'chain_intact': checked > 0 and not failures,
+            'failures': failures,
+        }
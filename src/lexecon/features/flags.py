@@ -5,6 +5,8 @@ Centralized flag definitions for easy reference and documentation.
 """
 
 from enum import Enum
+from types import MappingProxyType
+from typing import Any, Final, Mapping
 
 
 class FeatureFlag(str, Enum):
@@ -63,8 +65,54 @@ class FeatureFlag(str, Enum):
     BETA_FEATURES = "beta_features"
 
 
-# Default flag values (used for environment variable fallback)
-DEFAULT_FLAGS = {
+# Plain string flag keys for hot paths. Passing these to
+# ``FeatureFlagService`` skips the Enum attribute lookup on every call; the
+# ``FeatureFlag`` members remain the typed public API.
+
+# Security & Authentication
+MFA_REQUIRED: Final[str] = FeatureFlag.MFA_REQUIRED.value
+MFA_ENROLLMENT_MANDATORY: Final[str] = FeatureFlag.MFA_ENROLLMENT_MANDATORY.value
+PASSWORD_EXPIRATION_ENABLED: Final[str] = FeatureFlag.PASSWORD_EXPIRATION_ENABLED.value
+SESSION_TIMEOUT_STRICT: Final[str] = FeatureFlag.SESSION_TIMEOUT_STRICT.value
+
+# Rate Limiting
+RATE_LIMITING_STRICT: Final[str] = FeatureFlag.RATE_LIMITING_STRICT.value
+RATE_LIMIT_PER_USER: Final[str] = FeatureFlag.RATE_LIMIT_PER_USER.value
+RATE_LIMIT_GLOBAL: Final[str] = FeatureFlag.RATE_LIMIT_GLOBAL.value
+
+# Decision Engine
+NEW_DECISION_ENGINE: Final[str] = FeatureFlag.NEW_DECISION_ENGINE.value
+DECISION_CACHING_ENABLED: Final[str] = FeatureFlag.DECISION_CACHING_ENABLED.value
+DECISION_ASYNC_EVALUATION: Final[str] = FeatureFlag.DECISION_ASYNC_EVALUATION.value
+DECISION_BATCH_PROCESSING: Final[str] = FeatureFlag.DECISION_BATCH_PROCESSING.value
+
+# Ledger & Audit
+LEDGER_COMPRESSION_ENABLED: Final[str] = FeatureFlag.LEDGER_COMPRESSION_ENABLED.value
+LEDGER_ENCRYPTION_ENABLED: Final[str] = FeatureFlag.LEDGER_ENCRYPTION_ENABLED.value
+AUDIT_LOG_RETENTION_DAYS: Final[str] = FeatureFlag.AUDIT_LOG_RETENTION_DAYS.value
+
+# API Features
+API_VERSIONING_ENABLED: Final[str] = FeatureFlag.API_VERSIONING_ENABLED.value
+API_DEPRECATION_WARNINGS: Final[str] = FeatureFlag.API_DEPRECATION_WARNINGS.value
+GRAPHQL_ENABLED: Final[str] = FeatureFlag.GRAPHQL_ENABLED.value
+WEBHOOKS_ENABLED: Final[str] = FeatureFlag.WEBHOOKS_ENABLED.value
+
+# Observability
+METRICS_DETAILED: Final[str] = FeatureFlag.METRICS_DETAILED.value
+TRACING_ENABLED: Final[str] = FeatureFlag.TRACING_ENABLED.value
+PERFORMANCE_PROFILING: Final[str] = FeatureFlag.PERFORMANCE_PROFILING.value
+
+# Compliance
+GDPR_MODE_ENABLED: Final[str] = FeatureFlag.GDPR_MODE_ENABLED.value
+HIPAA_MODE_ENABLED: Final[str] = FeatureFlag.HIPAA_MODE_ENABLED.value
+DATA_RESIDENCY_ENFORCEMENT: Final[str] = FeatureFlag.DATA_RESIDENCY_ENFORCEMENT.value
+
+# Experimental
+EXPERIMENTAL_FEATURES: Final[str] = FeatureFlag.EXPERIMENTAL_FEATURES.value
+BETA_FEATURES: Final[str] = FeatureFlag.BETA_FEATURES.value
+
+
+_FLAGS = {
     # Security defaults (production-safe)
     FeatureFlag.MFA_REQUIRED: False,
     FeatureFlag.MFA_ENROLLMENT_MANDATORY: False,
@@ -100,3 +148,11 @@ DEFAULT_FLAGS = {
     FeatureFlag.EXPERIMENTAL_FEATURES: False,
     FeatureFlag.BETA_FEATURES: False,
 }
+
+# Default flag values (used for environment variable fallback). Keyed by the
+# plain flag key string and read-only, so it can be shared safely; since
+# FeatureFlag members hash and compare as their value, looking up by member
+# still works.
+DEFAULT_FLAGS: Mapping[str, Any] = MappingProxyType(
+    {flag.value: value for flag, value in _FLAGS.items()}
+)
@@ -8,12 +8,198 @@ Supports:
 - User targeting and segmentation
 """
 
+import hashlib
+import json
 import logging
+import math
 import os
-from typing import Any, Dict, Optional
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple, Type
+
+# Optional LaunchDarkly SDK
+try:
+    import ldclient
+    from ldclient import Context
+    from ldclient.client import LDClient
+    from ldclient.config import Config
+
+    LAUNCHDARKLY_AVAILABLE = True
+except ImportError:
+    LAUNCHDARKLY_AVAILABLE = False
+
+# Errors raised by the SDK while evaluating a flag; anything else is a bug
+# and should not be silently turned into the env fallback value.
+try:
+    from ldclient.impl.evaluator_common import EvaluationException
+    from ldclient.impl.util import UnsuccessfulResponseException
+
+    LD_EVALUATION_ERRORS: Tuple[Type[BaseException], ...] = (
+        EvaluationException,
+        UnsuccessfulResponseException,
+    )
+except ImportError:
+    # SDK missing, or its internal modules moved in another release
+    LD_EVALUATION_ERRORS = (Exception,)
 
 logger = logging.getLogger(__name__)
 
+# Env-var fallback mode, fixed for the lifetime of the process
+FEATURE_FLAGS_ENV_MODE = os.getenv("FEATURE_FLAGS_MODE", "env") == "env"
+
+# Environment variables read by the env fallback start with this prefix
+ENV_FLAG_PREFIX = "FEATURE_FLAG_"
+
+# Accepted (lowercased) spellings of an enabled boolean flag
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+# Marks a cached env lookup whose result is "use the caller's default"
+_USE_DEFAULT = object()
+
+# LaunchDarkly evaluation cache configuration
+FLAG_CACHE_TTL_MS = int(os.getenv("FEATURE_FLAG_CACHE_TTL_MS", "3000"))
+FLAG_CACHE_MAX = int(os.getenv("FEATURE_FLAG_CACHE_MAX", "50000"))
+CONTEXT_CACHE_MAX = 10000
+
+# Seconds between batched writes of the optional on-disk flag cache
+DISK_CACHE_FLUSH_INTERVAL = 0.5
+
+_MISS = object()
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Pass ``math.inf`` as the TTL for entries that only leave by eviction.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISS if absent or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return _MISS
+            if time.monotonic() >= item[0]:
+                del self._data[key]
+                return _MISS
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _hash_attrs(user_attributes: Optional[Dict[str, Any]]) -> str:
+    """Stable short hash of targeting attributes for cache keys."""
+    if not user_attributes:
+        return ""
+    canonical = json.dumps(user_attributes, sort_keys=True, default=str)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _disk_cache_user(user_key: str, attrs_hash: str, default: Any) -> str:
+    """Disk cache user column: user key, attributes hash and value type."""
+    return f"{user_key}|{attrs_hash}|{type(default).__name__}"
+
+
+class _FlagDiskCache:
+    """Last-known LaunchDarkly values persisted in SQLite for cold starts.
+
+    Rows are loaded into memory on startup; new values are written in
+    batches by a background thread.
+    """
+
+    def __init__(self, db_path: str, flush_interval: float = DISK_CACHE_FLUSH_INTERVAL):
+        self.db_path = db_path
+        self._values: Dict[Tuple[str, str], Any] = {}
+        self._pending: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS flags (
+                    key TEXT NOT NULL,
+                    user TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    ts REAL NOT NULL,
+                    PRIMARY KEY (key, user)
+                )
+            """)
+            for key, user, value in conn.execute("SELECT key, user, value FROM flags"):
+                self._values[(key, user)] = json.loads(value)
+
+        self._writer = threading.Thread(
+            target=self._run, args=(flush_interval,), name="feature-flag-disk-cache", daemon=True
+        )
+        self._writer.start()
+
+    def get(self, key: str, user: str) -> Any:
+        """Return the last-known value, or _MISS if none was stored."""
+        return self._values.get((key, user), _MISS)
+
+    def set(self, key: str, user: str, value: Any) -> None:
+        """Record a value; it reaches disk on the next flush."""
+        with self._lock:
+            if self._values.get((key, user), _MISS) == value:
+                return
+            self._values[(key, user)] = value
+            self._pending[(key, user)] = (value, time.time())
+
+    def flush(self) -> None:
+        """Write pending values to disk."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO flags (key, user, value, ts) VALUES (?, ?, ?, ?)",
+                    [
+                        (key, user, json.dumps(value), ts)
+                        for (key, user), (value, ts) in pending.items()
+                    ],
+                )
+
+    def close(self) -> None:
+        """Stop the writer thread and write anything still pending."""
+        self._stop.set()
+        self._writer.join()
+        self.flush()
+
+    def _run(self, flush_interval: float) -> None:
+        while not self._stop.wait(flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                logger.warning("Error writing feature flag disk cache: %s", e)
+
 
 class FeatureFlagService:
     """
@@ -34,32 +220,75 @@ class FeatureFlagService:
             sdk_key: LaunchDarkly SDK key. If not provided, falls back to LAUNCHDARKLY_SDK_KEY env var.
         """
         self.sdk_key = sdk_key or os.getenv("LAUNCHDARKLY_SDK_KEY")
-        self.client = None
-        self._env_fallback = os.getenv("FEATURE_FLAGS_MODE", "env") == "env"
-
-        if self.sdk_key and not self._env_fallback:
-            try:
-                import ldclient
-                from ldclient.config import Config
-
-                config = Config(sdk_key=self.sdk_key)
-                ldclient.set_config(config)
-                self.client = ldclient.get()
-
-                if self.client.is_initialized():
-                    logger.info("LaunchDarkly client initialized successfully")
-                else:
-                    logger.warning("LaunchDarkly client failed to initialize, using env fallback")
-                    self.client = None
-            except ImportError:
-                logger.warning("LaunchDarkly SDK not installed, using environment variable fallback")
-                self.client = None
-            except Exception as e:
-                logger.error(f"Error initializing LaunchDarkly: {e}, using env fallback")
-                self.client = None
+        self.client: Optional[LDClient] = None
+        self._env_fallback = FEATURE_FLAGS_ENV_MODE
+        # Whether evaluations go to LaunchDarkly; flipped once by the
+        # background init thread, env fallback serves flags until then
+        self._use_ld = False
+        self._ld_init_thread: Optional[threading.Thread] = None
+        # Last-known LaunchDarkly values served while the client is unavailable
+        self._disk_cache: Optional[_FlagDiskCache] = None
+
+        # Snapshot of FEATURE_FLAG_* environment variables, with values parsed
+        # once per flag and cached; both are rebuilt by reload_env()
+        self._env_view: Dict[str, str] = {}
+        self._env_cache: Dict[str, Tuple[type, Any]] = {}
+        self._env_key_cache: Dict[str, str] = {}
+        self.reload_env()
+
+        # Short-lived cache of LaunchDarkly evaluations
+        self._eval_cache = _TTLCache(FLAG_CACHE_MAX, FLAG_CACHE_TTL_MS / 1000.0)
+        # LaunchDarkly contexts per (user_id, attributes hash)
+        self._ctx_cache = _TTLCache(CONTEXT_CACHE_MAX, math.inf)
+
+        if self.sdk_key and not self._env_fallback and not LAUNCHDARKLY_AVAILABLE:
+            logger.warning("LaunchDarkly SDK not installed, using environment variable fallback")
+        elif self.sdk_key and not self._env_fallback:
+            disk_cache_path = os.getenv("FEATURE_FLAG_DISK_CACHE")
+            if disk_cache_path:
+                try:
+                    self._disk_cache = _FlagDiskCache(disk_cache_path)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning("Feature flag disk cache unavailable: %s", e)
+
+            # The SDK handshake blocks, so run it off the caller's thread
+            self._ld_init_thread = threading.Thread(
+                target=self._init_ld, args=(self.sdk_key,), name="launchdarkly-init", daemon=True
+            )
+            self._ld_init_thread.start()
         else:
             logger.info("Using environment variable fallback for feature flags")
 
+    def _init_ld(self, sdk_key: str) -> None:
+        """Connect to LaunchDarkly and switch evaluations over once it is ready."""
+        try:
+            config = Config(sdk_key=sdk_key)
+            ldclient.set_config(config)
+            client = ldclient.get()
+
+            if client.is_initialized():
+                self.client = client
+                self._use_ld = True
+                logger.info("LaunchDarkly client initialized successfully")
+            else:
+                logger.warning("LaunchDarkly client failed to initialize, using env fallback")
+        except Exception as e:
+            logger.error("Error initializing LaunchDarkly: %s, using env fallback", e)
+
+    def wait_for_initialization(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until background LaunchDarkly initialization has finished.
+
+        Args:
+            timeout: Maximum seconds to wait (optional)
+
+        Returns:
+            True if evaluations are served by LaunchDarkly
+        """
+        if self._ld_init_thread is not None:
+            self._ld_init_thread.join(timeout)
+        return self._use_ld
+
     def is_enabled(
         self,
         flag_key: str,
@@ -79,22 +308,35 @@ class FeatureFlagService:
         Returns:
             True if feature is enabled, False otherwise
         """
-        if self.client:
-            try:
-                from ldclient import Context
+        return self._variation(flag_key, user_id, user_attributes, default)
 
-                # Build context for user targeting
-                context_dict = {"kind": "user", "key": user_id or "anonymous"}
-                if user_attributes:
-                    context_dict.update(user_attributes)
+    def is_enabled_many(
+        self,
+        flag_keys: Iterable[str],
+        user_id: Optional[str] = None,
+        user_attributes: Optional[Dict[str, Any]] = None,
+        default: bool = False,
+    ) -> Dict[str, bool]:
+        """
+        Check several feature flags for the same user in one call.
 
-                context = Context.builder(user_id or "anonymous").build()
-                return self.client.variation(flag_key, context, default)
-            except Exception as e:
-                logger.error(f"Error evaluating LaunchDarkly flag {flag_key}: {e}")
-                return self._get_env_flag(flag_key, default)
-        else:
-            return self._get_env_flag(flag_key, default)
+        Args:
+            flag_keys: Feature flag keys to evaluate
+            user_id: User ID for targeting (optional)
+            user_attributes: Additional user attributes for targeting (optional)
+            default: Default value for flags that are not found
+
+        Returns:
+            Mapping of flag key to whether it is enabled
+        """
+        if self._use_ld or self._disk_cache is not None:
+            variation = self._variation
+            return {
+                key: variation(key, user_id, user_attributes, default) for key in flag_keys
+            }
+
+        get_env_flag = self._get_env_flag
+        return {key: get_env_flag(key, default) for key in flag_keys}
 
     def get_string(
         self,
@@ -115,17 +357,7 @@ class FeatureFlagService:
         Returns:
             String value of the feature flag
         """
-        if self.client:
-            try:
-                from ldclient import Context
-
-                context = Context.builder(user_id or "anonymous").build()
-                return self.client.variation(flag_key, context, default)
-            except Exception as e:
-                logger.error(f"Error evaluating LaunchDarkly flag {flag_key}: {e}")
-                return self._get_env_flag(flag_key, default)
-        else:
-            return self._get_env_flag(flag_key, default)
+        return self._variation(flag_key, user_id, user_attributes, default)
 
     def get_number(
         self,
@@ -146,17 +378,7 @@ class FeatureFlagService:
         Returns:
             Numeric value of the feature flag
         """
-        if self.client:
-            try:
-                from ldclient import Context
-
-                context = Context.builder(user_id or "anonymous").build()
-                return self.client.variation(flag_key, context, default)
-            except Exception as e:
-                logger.error(f"Error evaluating LaunchDarkly flag {flag_key}: {e}")
-                return self._get_env_flag(flag_key, default)
-        else:
-            return self._get_env_flag(flag_key, default)
+        return self._variation(flag_key, user_id, user_attributes, default)
 
     def get_json(
         self,
@@ -180,17 +402,69 @@ class FeatureFlagService:
         if default is None:
             default = {}
 
-        if self.client:
+        return self._variation(flag_key, user_id, user_attributes, default)
+
+    def _variation(
+        self,
+        flag_key: str,
+        user_id: Optional[str],
+        user_attributes: Optional[Dict[str, Any]],
+        default: Any,
+    ) -> Any:
+        """Shared evaluation path for is_enabled and the typed getters."""
+        client = self.client
+        if self._use_ld and client is not None:
             try:
-                from ldclient import Context
+                return self._ld_variation(client, flag_key, user_id, user_attributes, default)
+            except LD_EVALUATION_ERRORS as e:
+                logger.error("Error evaluating LaunchDarkly flag %s: %s", flag_key, e)
+
+        if self._disk_cache is not None:
+            user = _disk_cache_user(user_id or "anonymous", _hash_attrs(user_attributes), default)
+            value = self._disk_cache.get(flag_key, user)
+            if value is not _MISS:
+                return value
+        return self._get_env_flag(flag_key, default)
+
+    def _ld_variation(
+        self,
+        client: "LDClient",
+        flag_key: str,
+        user_id: Optional[str],
+        user_attributes: Optional[Dict[str, Any]],
+        default: Any,
+    ) -> Any:
+        """Evaluate a flag with LaunchDarkly, reusing recent identical evaluations."""
+        user_key = user_id or "anonymous"
+        attrs_hash = _hash_attrs(user_attributes)
+        cache_key = (flag_key, user_key, attrs_hash, type(default).__name__)
+        value = self._eval_cache.get(cache_key)
+        if value is not _MISS:
+            return value
+
+        context = self._get_ctx(user_key, attrs_hash, user_attributes)
+        value = client.variation(flag_key, context, default)
+        self._eval_cache.set(cache_key, value)
+        if self._disk_cache is not None:
+            self._disk_cache.set(flag_key, _disk_cache_user(user_key, attrs_hash, default), value)
+        return value
 
-                context = Context.builder(user_id or "anonymous").build()
-                return self.client.variation(flag_key, context, default)
-            except Exception as e:
-                logger.error(f"Error evaluating LaunchDarkly flag {flag_key}: {e}")
-                return self._get_env_flag(flag_key, default)
-        else:
-            return self._get_env_flag(flag_key, default)
+    def _get_ctx(
+        self,
+        user_key: str,
+        attrs_hash: str,
+        user_attributes: Optional[Dict[str, Any]],
+    ) -> Any:
+        """Return the LaunchDarkly user context for targeting, built once per user."""
+        ctx_key = (user_key, attrs_hash)
+        context = self._ctx_cache.get(ctx_key)
+        if context is _MISS:
+            builder = Context.builder(user_key)
+            for name, value in (user_attributes or {}).items():
+                builder.set(name, value)
+            context = builder.build()
+            self._ctx_cache.set(ctx_key, context)
+        return context
 
     def _get_env_flag(self, flag_key: str, default: Any) -> Any:
         """
@@ -198,6 +472,10 @@ class FeatureFlagService:
 
         Environment variable format: FEATURE_FLAG_<FLAG_KEY>=true/false/value
 
+        Values come from the snapshot taken at startup, and the parsed value
+        is cached per flag key and default type; call reload_env() after
+        changing the environment.
+
         Args:
             flag_key: Feature flag key
             default: Default value if env var not found
@@ -205,59 +483,99 @@ class FeatureFlagService:
         Returns:
             Feature flag value from environment or default
         """
-        env_key = f"FEATURE_FLAG_{flag_key.upper()}"
-        value = os.getenv(env_key)
+        default_type = type(default)
+        cached = self._env_cache.get(flag_key)
+        if cached is not None and cached[0] is default_type:
+            return default if cached[1] is _USE_DEFAULT else cached[1]
 
+        env_key = self._env_key_cache.get(flag_key)
+        if env_key is None:
+            env_key = self._env_key_cache[flag_key] = ENV_FLAG_PREFIX + flag_key.upper()
+        parsed = self._parse_env_value(env_key, self._env_view.get(env_key), default)
+
+        # JSON values are mutable, so they are re-parsed on every call
+        if not isinstance(default, dict):
+            self._env_cache[flag_key] = (default_type, parsed)
+        return default if parsed is _USE_DEFAULT else parsed
+
+    def _parse_env_value(self, env_key: str, value: Optional[str], default: Any) -> Any:
+        """Parse a raw environment variable value according to the default's type.
+
+        Returns _USE_DEFAULT when the variable is unset or cannot be parsed.
+        """
         if value is None:
-            return default
+            return _USE_DEFAULT
 
         # Handle boolean flags
         if isinstance(default, bool):
-            return value.lower() in ("true", "1", "yes", "on")
+            return value.lower() in _TRUTHY
 
         # Handle numeric flags
         if isinstance(default, (int, float)):
             try:
                 return float(value) if isinstance(default, float) else int(value)
             except ValueError:
-                logger.warning(f"Invalid numeric value for {env_key}: {value}")
-                return default
+                logger.warning("Invalid numeric value for %s: %s", env_key, value)
+                return _USE_DEFAULT
 
         # Handle JSON flags
         if isinstance(default, dict):
             try:
-                import json
-
                 return json.loads(value)
             except (ValueError, json.JSONDecodeError):
-                logger.warning(f"Invalid JSON value for {env_key}: {value}")
-                return default
+                logger.warning("Invalid JSON value for %s: %s", env_key, value)
+                return _USE_DEFAULT
 
         # Default to string
         return value
 
+    def reload_env(self) -> None:
+        """Re-read FEATURE_FLAG_* environment variables and forget parsed values."""
+        self._env_view = {
+            key: value for key, value in os.environ.items() if key.startswith(ENV_FLAG_PREFIX)
+        }
+        self._env_cache.clear()
+
+    def clear_evaluation_cache(self) -> None:
+        """Forget cached LaunchDarkly evaluations."""
+        self._eval_cache.clear()
+
     def close(self):
         """Close LaunchDarkly client connection."""
+        # Let a pending init finish so its client does not outlive close()
+        self.wait_for_initialization()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
         if self.client:
             try:
                 self.client.close()
                 logger.info("LaunchDarkly client closed")
             except Exception as e:
-                logger.error(f"Error closing LaunchDarkly client: {e}")
+                logger.error("Error closing LaunchDarkly client: %s", e)
 
 
 # Global feature flag service instance
 _feature_flags: Optional[FeatureFlagService] = None
+_feature_flags_lock = threading.Lock()
 
 
 def get_feature_flags() -> FeatureFlagService:
     """
     Get global feature flag service instance.
 
+    The instance never changes once created, so callers on hot paths may
+    keep the returned reference instead of calling this repeatedly.
+
     Returns:
         Singleton FeatureFlagService instance
     """
     global _feature_flags
-    if _feature_flags is None:
-        _feature_flags = FeatureFlagService()
-    return _feature_flags
+    flags = _feature_flags
+    if flags is not None:
+        return flags
+
+    with _feature_flags_lock:
+        # Re-check: another thread may have created it while we waited
+        if _feature_flags is None:
+            _feature_flags = FeatureFlagService()
+        return _feature_flags
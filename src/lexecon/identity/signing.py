@@ -3,14 +3,25 @@
 Manages key pairs for signing decisions and verifying integrity.
 """
 
-import base64
+import hashlib
 import json
+from binascii import a2b_base64, b2a_base64
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 
+# Shared encoder for the canonical signing form. json.dumps builds a new
+# JSONEncoder on every call when given non-default options; reusing one
+# produces the exact same bytes without that setup cost.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def canonical_json_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize data to the canonical JSON bytes that are signed and verified."""
+    return _CANONICAL_ENCODER.encode(data).encode()
+
 
 class NodeIdentity:
     """Represents a node's identity in the governance system.
@@ -47,14 +58,8 @@ class NodeIdentity:
         if self.key_manager.public_key is None:
             return False
         # For string data (like hashes), we need to verify against the string directly
-        try:
-            import base64
-            signature_bytes = base64.b64decode(signature)
-            message = data.encode() if isinstance(data, str) else str(data).encode()
-            self.key_manager.public_key.verify(signature_bytes, message)
-            return True
-        except Exception:
-            return False
+        message = data.encode() if isinstance(data, str) else str(data).encode()
+        return KeyManager.verify_bytes(message, signature, self.key_manager.public_key)
 
 
 class KeyManager:
@@ -66,6 +71,8 @@ class KeyManager:
     def __init__(self, private_key: Optional[Ed25519PrivateKey] = None):
         self.private_key = private_key
         self.public_key = private_key.public_key() if private_key else None
+        # (public key, fingerprint) memo; tied to the key object it was computed for
+        self._fingerprint: Optional[Tuple[Ed25519PublicKey, str]] = None
 
     @classmethod
     def generate(cls) -> "KeyManager":
@@ -109,20 +116,20 @@ class KeyManager:
     def sign(self, data: Dict[str, Any]) -> str:
         """Sign data using private key.
 
+        Returns base64-encoded signature.
+        """
+        return self.sign_bytes(canonical_json_bytes(data))
+
+    def sign_bytes(self, message: bytes) -> str:
+        """Sign an already-serialized message using private key.
+
         Returns base64-encoded signature.
         """
         if self.private_key is None:
             raise ValueError("No private key available for signing")
 
-        # Create canonical JSON representation
-        canonical_json = json.dumps(data, sort_keys=True, separators=(",", ":"))
-        message = canonical_json.encode()
-
-        # Sign
         signature = self.private_key.sign(message)
-
-        # Return base64-encoded signature
-        return base64.b64encode(signature).decode()
+        return b2a_base64(signature, newline=False).decode()
 
     @staticmethod
     def verify(data: Dict[str, Any], signature: str, public_key: Ed25519PublicKey) -> bool:
@@ -131,29 +138,55 @@ class KeyManager:
         Returns True if signature is valid, False otherwise.
         """
         try:
-            # Create canonical JSON representation
-            canonical_json = json.dumps(data, sort_keys=True, separators=(",", ":"))
-            message = canonical_json.encode()
+            message = canonical_json_bytes(data)
+        except Exception:
+            return False
+        return KeyManager.verify_bytes(message, signature, public_key)
 
-            # Decode signature
-            signature_bytes = base64.b64decode(signature)
+    @staticmethod
+    def verify_bytes(message: bytes, signature: str, public_key: Ed25519PublicKey) -> bool:
+        """Verify signature on an already-serialized message using public key.
 
+        Returns True if signature is valid, False otherwise.
+        """
+        try:
             # Verify (raises exception if invalid)
-            public_key.verify(signature_bytes, message)
+            public_key.verify(a2b_base64(signature), message)
             return True
         except Exception:
             return False
 
+    @staticmethod
+    def verify_batch(items: List[Tuple[Dict[str, Any], str, Ed25519PublicKey]]) -> List[bool]:
+        """Verify many (data, signature, public_key) triples, e.g. when replaying a log.
+
+        Returns one result per item, in order, with the same semantics as verify().
+        """
+        results: List[bool] = []
+        append = results.append
+        for data, signature, public_key in items:
+            try:
+                public_key.verify(a2b_base64(signature), canonical_json_bytes(data))
+                append(True)
+            except Exception:
+                append(False)
+        return results
+
     def get_public_key_fingerprint(self) -> str:
         """Get fingerprint of public key for identification."""
         if self.public_key is None:
             raise ValueError("No public key available")
 
-        public_pem = self.public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
+        if self._fingerprint is not None and self._fingerprint[0] is self.public_key:
+            return self._fingerprint[1]
 
-        import hashlib
+        # Hash the 32 raw key bytes; PEM would only add fixed ASN.1 framing
+        raw = self.public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw,
+        )
 
-        return hashlib.sha256(public_pem).hexdigest()[:16]
+        # An 8-byte BLAKE2b digest gives the 16 hex characters directly
+        fingerprint = hashlib.blake2b(raw, digest_size=8).hexdigest()
+        self._fingerprint = (self.public_key, fingerprint)
+        return fingerprint
@@ -45,85 +45,125 @@ Quick Start:
         ...
 """
 
-# Logging (backward compatible)
-# Circuit breaker (new)
-from .circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerConfig,
-    CircuitBreakerError,
-    CircuitBreakerRegistry,
-    circuit_breakers,
-    get_circuit_breaker,
-)
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
 
-# Context propagation (new)
-from .context import (
-    ObservabilityContext,
-    SpanContext,
-    create_context,
-    get_current_context,
-    hash_high_cardinality,
-    observe,
-    reset_context,
-    set_current_context,
-)
+# Submodules are imported on first attribute access (PEP 562) so that
+# processes needing only get_logger do not pay for prometheus_client,
+# OpenTelemetry and the rest of the stack at import time.
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    ".circuit_breaker": (
+        "CircuitBreaker",
+        "CircuitBreakerConfig",
+        "CircuitBreakerError",
+        "CircuitBreakerRegistry",
+        "circuit_breakers",
+        "get_circuit_breaker",
+    ),
+    ".context": (
+        "ObservabilityContext",
+        "SpanContext",
+        "create_context",
+        "get_current_context",
+        "hash_high_cardinality",
+        "observe",
+        "reset_context",
+        "set_current_context",
+    ),
+    ".errors": (
+        "ErrorCategory",
+        "ErrorCorrelator",
+        "ErrorRecord",
+        "ErrorSeverity",
+        "error_boundary",
+        "error_correlator",
+        "record_error",
+    ),
+    # Health checks - old and new
+    ".health": ("HealthCheck", "HealthStatus", "health_check"),
+    ".health_v2": (
+        "DependencyHealth",
+        "HealthCheckManager",
+        "HealthCheckResult",
+        "health_manager",
+        "liveness",
+        "readiness",
+        "startup",
+    ),
+    ".logging": (
+        "LoggerAdapter",
+        "StructuredFormatter",
+        "configure_logging",
+        "get_logger",
+        "request_id_var",
+        "user_id_var",
+    ),
+    # Metrics - old and new for backward compatibility
+    ".metrics": ("metrics", "record_decision", "record_policy_load"),
+    ".metrics_v2": (
+        "CircuitState",
+        "MetricsCollector",
+        "record_policies_loaded",
+        "record_tokens_issued",
+        "timed_operation",
+    ),
+    # Tracing - old and new for backward compatibility
+    ".tracing": ("trace_function", "tracer"),
+    ".tracing_v2": (
+        "Span",
+        "SpanContextManager",
+        "TracingManager",
+        "extract_trace_context",
+        "inject_trace_context",
+        "traced",
+        "traced_async",
+    ),
+}
 
-# Error correlation (new)
-from .errors import (
-    ErrorCategory,
-    ErrorCorrelator,
-    ErrorRecord,
-    ErrorSeverity,
-    error_boundary,
-    error_correlator,
-    record_error,
+_LAZY: Dict[str, Tuple[str, str]] = {
+    name: (module, name) for module, names in _EXPORTS.items() for name in names
+}
+_LAZY.update(
+    {
+        "HealthStatusV2": (".health_v2", "HealthStatus"),
+        "metrics_v2": (".metrics_v2", "metrics"),
+        "record_decision_v2": (".metrics_v2", "record_decision"),
+        "tracer_v2": (".tracing_v2", "tracer"),
+    }
 )
 
-# Health checks - import both old and new
-from .health import HealthCheck, HealthStatus, health_check
-from .health_v2 import (
-    DependencyHealth,
-    HealthCheckManager,
-    HealthCheckResult,
-    health_manager,
-    liveness,
-    readiness,
-    startup,
-)
-from .health_v2 import HealthStatus as HealthStatusV2
-from .logging import (
-    LoggerAdapter,
-    StructuredFormatter,
-    configure_logging,
-    get_logger,
-    request_id_var,
-    user_id_var,
-)
+# Exported names that are also submodule names. Importing the submodule
+# would otherwise bind the module object over the exported instance.
+_SHADOWED = frozenset(name for name in _LAZY if f".{name}" in _EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Metrics - import both old and new for backward compatibility
-from .metrics import metrics, record_decision, record_policy_load
-from .metrics_v2 import (
-    CircuitState,
-    MetricsCollector,
-    timed_operation,
-)
-from .metrics_v2 import metrics as metrics_v2
-from .metrics_v2 import record_decision as record_decision_v2
-
-# Tracing - import both old and new for backward compatibility
-from .tracing import trace_function, tracer
-from .tracing_v2 import (
-    Span,
-    SpanContextManager,
-    TracingManager,
-    extract_trace_context,
-    inject_trace_context,
-    traced,
-    traced_async,
-)
-from .tracing_v2 import tracer as tracer_v2
 
-__all__ = [
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(ModuleType):
+    """Package module that keeps exported names from being shadowed."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SHADOWED and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
+
+__all__ = (
     # Logging
     "configure_logging",
     "get_logger",
@@ -162,6 +202,8 @@ __all__ = [
     "MetricsCollector",
     "CircuitState",
     "timed_operation",
+    "record_policies_loaded",
+    "record_tokens_issued",
     # Health (backward compatible)
     "health_check",
     "HealthCheck",
@@ -190,7 +232,7 @@ __all__ = [
     "CircuitBreakerConfig",
     "CircuitBreakerError",
     "CircuitBreakerRegistry",
-]
+)
 
 
 def initialize_observability(
@@ -214,6 +256,11 @@ def initialize_observability(
         log_format: Log format (json or text)
         enable_tracing: Whether to enable distributed tracing
     """
+    from .health_v2 import health_manager
+    from .logging import configure_logging, get_logger
+    from .metrics_v2 import metrics as metrics_v2
+    from .tracing_v2 import tracer as tracer_v2
+
     # Configure logging
     configure_logging(level=log_level, format=log_format)
 
@@ -229,9 +276,7 @@ def initialize_observability(
         tracer_v2.initialize()
 
     # Update health manager
-    health_manager.service_name = service_name
-    health_manager._version = version
-    health_manager._environment = environment
+    health_manager.set_service_info(service_name, version, environment)
 
     logger = get_logger(__name__)
     logger.info(
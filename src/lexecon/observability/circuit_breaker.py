@@ -13,8 +13,9 @@ import time
 from dataclasses import dataclass, field
 from functools import wraps
 from threading import Lock
-from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
 
+from .context import DATACLASS_SLOTS
 from .metrics_v2 import CircuitState, metrics
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,10 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for metric recorders when metrics are disabled."""
+
+
 class CircuitBreakerError(Exception):
     """Raised when circuit breaker is open."""
 
@@ -31,7 +36,7 @@ class CircuitBreakerError(Exception):
         super().__init__(message or f"Circuit breaker for {service} is {state.value}")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CircuitBreakerConfig:
     """Configuration for circuit breaker behavior."""
 
@@ -58,7 +63,7 @@ class CircuitBreakerConfig:
     half_open_max_requests: int = 3
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CircuitBreakerState:
     """Internal state of circuit breaker."""
 
@@ -68,7 +73,11 @@ class CircuitBreakerState:
     last_failure_time: float = 0.0
     last_state_change: float = field(default_factory=time.time)
     half_open_requests: int = 0
-    failure_timestamps: list = field(default_factory=list)
+    # Rolling failure window: counts for the current and previous
+    # failure_window-sized time buckets
+    failure_bucket: int = 0
+    bucket_failures: int = 0
+    prev_bucket_failures: int = 0
 
 
 class CircuitBreaker(Generic[T]):
@@ -108,9 +117,19 @@ class CircuitBreaker(Generic[T]):
         self.config = config or CircuitBreakerConfig()
         self._state = CircuitBreakerState()
         self._lock = Lock()
+        # Exception filters as tuples for a single isinstance() check
+        self._exclude = tuple(self.config.exclude_exceptions)
+        self._trigger = tuple(self.config.trigger_exceptions)
+
+        # Bind metric recorders once so disabled metrics cost a no-op call
+        if metrics.enabled:
+            self._emit_request = metrics.record_circuit_request
+            self._emit_state_change = metrics.record_circuit_state_change
+        else:
+            self._emit_request = self._emit_state_change = _noop
 
         # Initialize metrics
-        metrics.record_circuit_state_change(
+        self._emit_state_change(
             service_name,
             CircuitState.CLOSED,
             CircuitState.CLOSED,
@@ -118,24 +137,27 @@ class CircuitBreaker(Generic[T]):
 
     @property
     def state(self) -> CircuitState:
-        """Get current circuit state."""
-        with self._lock:
-            return self._state.state
+        """Get current circuit state.
+
+        Read without the lock: the value is advisory and may change as soon
+        as it is returned, just as it could after releasing a lock.
+        """
+        return self._state.state
 
     @property
     def is_closed(self) -> bool:
         """Check if circuit is closed (normal operation)."""
-        return self.state == CircuitState.CLOSED
+        return self.state is CircuitState.CLOSED
 
     @property
     def is_open(self) -> bool:
         """Check if circuit is open (failing fast)."""
-        return self.state == CircuitState.OPEN
+        return self.state is CircuitState.OPEN
 
     @property
     def is_half_open(self) -> bool:
         """Check if circuit is half-open (testing recovery)."""
-        return self.state == CircuitState.HALF_OPEN
+        return self.state is CircuitState.HALF_OPEN
 
     def _should_trigger(self, exception: Exception) -> bool:
         """Check if exception should trigger circuit breaker.
@@ -147,27 +169,36 @@ class CircuitBreaker(Generic[T]):
             True if exception should trigger circuit breaker
         """
         # Check exclusions first
-        if self.config.exclude_exceptions:
-            for exc_type in self.config.exclude_exceptions:
-                if isinstance(exception, exc_type):
-                    return False
-
-        # Check triggers if specified
-        if self.config.trigger_exceptions:
-            for exc_type in self.config.trigger_exceptions:
-                if isinstance(exception, exc_type):
-                    return True
+        if self._exclude and isinstance(exception, self._exclude):
             return False
 
-        # Default: all exceptions trigger
+        # Check triggers if specified; otherwise all exceptions trigger
+        if self._trigger:
+            return isinstance(exception, self._trigger)
         return True
 
-    def _clean_failure_window(self) -> None:
-        """Remove failures outside the time window."""
-        cutoff = time.time() - self.config.failure_window
-        self._state.failure_timestamps = [
-            t for t in self._state.failure_timestamps if t > cutoff
-        ]
+    def _count_failure(self, now: float) -> float:
+        """Count a failure and estimate the failures within the time window.
+
+        Args:
+            now: Time of the failure
+
+        Returns:
+            Failures in the current bucket plus the previous bucket's,
+            weighted by how much of it still overlaps the window
+        """
+        window = self.config.failure_window
+        state = self._state
+        bucket = int(now // window)
+        if bucket != state.failure_bucket:
+            adjacent = bucket == state.failure_bucket + 1
+            state.prev_bucket_failures = state.bucket_failures if adjacent else 0
+            state.bucket_failures = 0
+            state.failure_bucket = bucket
+        state.bucket_failures += 1
+
+        overlap = 1.0 - (now - bucket * window) / window
+        return state.bucket_failures + state.prev_bucket_failures * overlap
 
     def _record_failure(self, exception: Exception) -> None:
         """Record a failure and potentially open circuit.
@@ -178,106 +209,112 @@ class CircuitBreaker(Generic[T]):
         if not self._should_trigger(exception):
             return
 
+        st = self._state
         with self._lock:
             now = time.time()
-            self._state.failure_timestamps.append(now)
-            self._state.last_failure_time = now
-            self._clean_failure_window()
-
-            failure_count = len(self._state.failure_timestamps)
-            self._state.failure_count = failure_count
+            st.last_failure_time = now
+            failure_count = self._count_failure(now)
+            st.failure_count = int(failure_count)
 
             # Record metric
-            metrics.record_circuit_request(self.service_name, "failure")
+            self._emit_request(self.service_name, "failure")
 
-            if self._state.state == CircuitState.CLOSED:
+            if st.state is CircuitState.CLOSED:
                 if failure_count >= self.config.failure_threshold:
-                    self._transition_to(CircuitState.OPEN)
+                    self._transition_to(CircuitState.OPEN, now)
 
-            elif self._state.state == CircuitState.HALF_OPEN:
+            elif st.state is CircuitState.HALF_OPEN:
                 # Any failure in half-open immediately opens circuit
-                self._transition_to(CircuitState.OPEN)
+                self._transition_to(CircuitState.OPEN, now)
 
     def _record_success(self) -> None:
         """Record a success and potentially close circuit."""
+        st = self._state
+        if st.state is CircuitState.CLOSED:
+            # Closed successes never change state, so skip the lock; the
+            # count is advisory here and may miss racing increments
+            st.success_count += 1
+            self._emit_request(self.service_name, "success")
+            return
+
         with self._lock:
-            self._state.success_count += 1
+            st.success_count += 1
 
             # Record metric
-            metrics.record_circuit_request(self.service_name, "success")
+            self._emit_request(self.service_name, "success")
 
-            if self._state.state == CircuitState.HALF_OPEN:
-                if self._state.success_count >= self.config.success_threshold:
+            if st.state is CircuitState.HALF_OPEN:
+                if st.success_count >= self.config.success_threshold:
                     self._transition_to(CircuitState.CLOSED)
 
-    def _transition_to(self, new_state: CircuitState) -> None:
+    def _transition_to(self, new_state: CircuitState, now: Optional[float] = None) -> None:
         """Transition to a new state.
 
         Args:
             new_state: Target state
+            now: Time of the transition, if the caller already read the clock
         """
-        old_state = self._state.state
+        st = self._state
+        old_state = st.state
 
-        if old_state == new_state:
+        if old_state is new_state:
             return
 
         logger.info(
-            f"Circuit breaker [{self.service_name}] transitioning from "
-            f"{old_state.value} to {new_state.value}",
+            "Circuit breaker [%s] transitioning from %s to %s",
+            self.service_name,
+            old_state.value,
+            new_state.value,
         )
 
         # Record state change metric
-        metrics.record_circuit_state_change(self.service_name, old_state, new_state)
+        self._emit_state_change(self.service_name, old_state, new_state)
 
         # Update state
-        self._state.state = new_state
-        self._state.last_state_change = time.time()
+        st.state = new_state
+        st.last_state_change = time.time() if now is None else now
 
         # Reset counters based on new state
-        if new_state == CircuitState.CLOSED:
-            self._state.failure_count = 0
-            self._state.success_count = 0
-            self._state.failure_timestamps = []
+        if new_state is CircuitState.CLOSED:
+            st.failure_count = 0
+            st.success_count = 0
+            st.bucket_failures = 0
+            st.prev_bucket_failures = 0
 
-        elif new_state == CircuitState.HALF_OPEN:
-            self._state.success_count = 0
-            self._state.half_open_requests = 0
+        elif new_state is CircuitState.HALF_OPEN:
+            st.success_count = 0
+            st.half_open_requests = 0
 
-        elif new_state == CircuitState.OPEN:
-            self._state.success_count = 0
+        elif new_state is CircuitState.OPEN:
+            st.success_count = 0
 
-    def _check_state(self) -> None:
-        """Check and potentially update circuit state."""
-        with self._lock:
-            if self._state.state == CircuitState.OPEN:
-                # Check if recovery timeout has passed
-                elapsed = time.time() - self._state.last_state_change
-                if elapsed >= self.config.recovery_timeout:
-                    self._transition_to(CircuitState.HALF_OPEN)
+    def _admit(self, now: float) -> bool:
+        """Check if a call can be executed, moving an expired open circuit to half-open.
 
-    def _can_execute(self) -> bool:
-        """Check if a call can be executed.
+        Args:
+            now: Current time
 
         Returns:
             True if call is allowed
         """
-        self._check_state()
-
+        st = self._state
+        cfg = self.config
         with self._lock:
-            if self._state.state == CircuitState.CLOSED:
+            state = st.state
+            if state is CircuitState.CLOSED:
                 return True
 
-            if self._state.state == CircuitState.OPEN:
-                return False
-
-            if self._state.state == CircuitState.HALF_OPEN:
-                # Limit requests in half-open state
-                if self._state.half_open_requests >= self.config.half_open_max_requests:
+            if state is CircuitState.OPEN:
+                # Check if recovery timeout has passed
+                if now - st.last_state_change < cfg.recovery_timeout:
                     return False
-                self._state.half_open_requests += 1
-                return True
+                self._transition_to(CircuitState.HALF_OPEN, now)
 
-            return False
+            # Limit requests in half-open state
+            if st.half_open_requests >= cfg.half_open_max_requests:
+                return False
+            st.half_open_requests += 1
+            return True
 
     def call(
         self,
@@ -296,19 +333,44 @@ class CircuitBreaker(Generic[T]):
         Raises:
             CircuitBreakerError: If circuit is open and no fallback
         """
-        if not self._can_execute():
-            metrics.record_circuit_request(self.service_name, "rejected")
+        return self.call_with_args(func, (), {}, fallback)
+
+    def call_with_args(
+        self,
+        func: Callable[..., T],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        fallback: Optional[Callable[[], T]] = None,
+    ) -> T:
+        """Execute func(*args, **kwargs) with circuit breaker protection.
+
+        Lets decorators pass their arguments through without wrapping the
+        call in a closure.
+
+        Args:
+            func: Function to execute
+            args: Positional arguments for func
+            kwargs: Keyword arguments for func
+            fallback: Optional fallback function if circuit is open
+
+        Returns:
+            Function result
+
+        Raises:
+            CircuitBreakerError: If circuit is open and no fallback
+        """
+        # A closed circuit admits every call; only other states need the lock
+        if self._state.state is not CircuitState.CLOSED and not self._admit(time.time()):
+            self._emit_request(self.service_name, "rejected")
 
             if fallback:
-                logger.debug(
-                    f"Circuit [{self.service_name}] is open, using fallback",
-                )
+                logger.debug("Circuit [%s] is open, using fallback", self.service_name)
                 return fallback()
 
             raise CircuitBreakerError(self.service_name, self._state.state)
 
         try:
-            result = func()
+            result = func(*args, **kwargs)
             self._record_success()
             return result
 
@@ -333,21 +395,71 @@ class CircuitBreaker(Generic[T]):
         Raises:
             CircuitBreakerError: If circuit is open and no fallback
         """
-        if not self._can_execute():
-            metrics.record_circuit_request(self.service_name, "rejected")
+        return await self.call_async_with_args(func, (), {}, fallback)
+
+    async def call_async_with_args(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        fallback: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Execute await func(*args, **kwargs) with circuit breaker protection.
+
+        Args:
+            func: Async function to execute
+            args: Positional arguments for func
+            kwargs: Keyword arguments for func
+            fallback: Optional fallback function
+
+        Returns:
+            Function result
+
+        Raises:
+            CircuitBreakerError: If circuit is open and no fallback
+        """
+        return await self._call_async(func, args, kwargs, fallback, None)
+
+    async def _call_async(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        fallback: Optional[Callable[[], Any]],
+        fallback_is_coro: Optional[bool],
+    ) -> Any:
+        """Execute await func(*args, **kwargs) with a pre-inspected fallback.
+
+        Args:
+            func: Async function to execute
+            args: Positional arguments for func
+            kwargs: Keyword arguments for func
+            fallback: Optional fallback function
+            fallback_is_coro: Whether fallback is a coroutine function, or None
+                to inspect it only if the call is rejected
+
+        Returns:
+            Function result
+
+        Raises:
+            CircuitBreakerError: If circuit is open and no fallback
+        """
+        # A closed circuit admits every call; only other states need the lock
+        if self._state.state is not CircuitState.CLOSED and not self._admit(time.time()):
+            self._emit_request(self.service_name, "rejected")
 
             if fallback:
-                logger.debug(
-                    f"Circuit [{self.service_name}] is open, using fallback",
-                )
-                if asyncio.iscoroutinefunction(fallback):
+                logger.debug("Circuit [%s] is open, using fallback", self.service_name)
+                if fallback_is_coro is None:
+                    fallback_is_coro = asyncio.iscoroutinefunction(fallback)
+                if fallback_is_coro:
                     return await fallback()
                 return fallback()
 
             raise CircuitBreakerError(self.service_name, self._state.state)
 
         try:
-            result = await func()
+            result = await func(*args, **kwargs)
             self._record_success()
             return result
 
@@ -366,7 +478,7 @@ class CircuitBreaker(Generic[T]):
         """
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            return self.call(lambda: func(*args, **kwargs))
+            return self.call_with_args(func, args, kwargs)
 
         return wrapper
 
@@ -381,7 +493,7 @@ class CircuitBreaker(Generic[T]):
         """
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await self.call_async(lambda: func(*args, **kwargs))
+            return await self.call_async_with_args(func, args, kwargs)
 
         return wrapper
 
@@ -400,7 +512,31 @@ class CircuitBreaker(Generic[T]):
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> T:
-                return self.call(lambda: func(*args, **kwargs), fallback)
+                return self.call_with_args(func, args, kwargs, fallback)
+
+            return wrapper
+
+        return decorator
+
+    def protect_async_with_fallback(
+        self,
+        fallback: Callable[[], Any],
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator to protect an async function with fallback on circuit open.
+
+        Args:
+            fallback: Sync or async fallback function to call when circuit is open
+
+        Returns:
+            Decorator function
+        """
+        # Inspect the fallback once here rather than on every rejected call
+        fallback_is_coro = asyncio.iscoroutinefunction(fallback)
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            @wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await self._call_async(func, args, kwargs, fallback, fallback_is_coro)
 
             return wrapper
 
@@ -412,15 +548,16 @@ class CircuitBreaker(Generic[T]):
         Returns:
             Status dictionary
         """
+        st = self._state
         with self._lock:
             return {
                 "service": self.service_name,
-                "state": self._state.state.value,
-                "failure_count": self._state.failure_count,
-                "success_count": self._state.success_count,
-                "last_failure_time": self._state.last_failure_time,
-                "last_state_change": self._state.last_state_change,
-                "time_in_state": time.time() - self._state.last_state_change,
+                "state": st.state.value,
+                "failure_count": st.failure_count,
+                "success_count": st.success_count,
+                "last_failure_time": st.last_failure_time,
+                "last_state_change": st.last_state_change,
+                "time_in_state": time.time() - st.last_state_change,
             }
 
     def reset(self) -> None:
@@ -451,10 +588,18 @@ class CircuitBreakerRegistry:
         Returns:
             CircuitBreaker instance
         """
+        # Lock-free fast path: dict reads are atomic, and breakers are never removed
+        cb = self._breakers.get(service_name)
+        if cb is not None:
+            return cb
+
         with self._lock:
-            if service_name not in self._breakers:
-                self._breakers[service_name] = CircuitBreaker(service_name, config)
-            return self._breakers[service_name]
+            # Re-check: another thread may have created it while we waited
+            cb = self._breakers.get(service_name)
+            if cb is None:
+                cb = CircuitBreaker(service_name, config)
+                self._breakers[service_name] = cb
+            return cb
 
     def get(self, service_name: str) -> Optional[CircuitBreaker]:
         """Get circuit breaker by name.
@@ -465,8 +610,7 @@ class CircuitBreakerRegistry:
         Returns:
             CircuitBreaker or None
         """
-        with self._lock:
-            return self._breakers.get(service_name)
+        return self._breakers.get(service_name)
 
     def get_all_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all circuit breakers.
@@ -475,16 +619,35 @@ class CircuitBreakerRegistry:
             Dict mapping service names to status
         """
         with self._lock:
-            return {
-                name: cb.get_status()
-                for name, cb in self._breakers.items()
-            }
+            breakers = list(self._breakers.items())
+        return {name: cb.get_status() for name, cb in breakers}
+
+    def get_open_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of the circuit breakers that are currently open.
+
+        Closed and half-open breakers are skipped without building their
+        status, so the cost follows the number of open circuits.
+
+        Returns:
+            Dict mapping service names to status
+        """
+        with self._lock:
+            breakers = list(self._breakers.items())
+        open_status = {}
+        for name, cb in breakers:
+            if cb.is_open:
+                status = cb.get_status()
+                # The state may have moved on since the lock-free check
+                if status["state"] == CircuitState.OPEN.value:
+                    open_status[name] = status
+        return open_status
 
     def reset_all(self) -> None:
         """Reset all circuit breakers."""
         with self._lock:
-            for cb in self._breakers.values():
-                cb.reset()
+            breakers = list(self._breakers.values())
+        for cb in breakers:
+            cb.reset()
 
 
 # Global registry
@@ -5,11 +5,15 @@ implementing W3C Trace Context standard for distributed tracing correlation.
 """
 
 import hashlib
-import secrets
+import os
+import sys
 import time
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
 
 # W3C Trace Context format: version-trace_id-parent_id-flags
 # https://www.w3.org/TR/trace-context/
@@ -17,16 +21,45 @@ TRACE_CONTEXT_VERSION = "00"
 TRACE_FLAG_SAMPLED = "01"
 TRACE_FLAG_NOT_SAMPLED = "00"
 
+# Per-request dataclasses use __slots__ where dataclasses support it (3.10+)
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Read-only baggage shared by every span that carries none
+_EMPTY_BAGGAGE: Mapping[str, str] = MappingProxyType({})
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SpanContext:
-    """Immutable span context for W3C Trace Context propagation."""
+    """Immutable span context for W3C Trace Context propagation.
+
+    Header values are serialized once at construction; baggage is
+    read-only and spans without baggage share one empty mapping.
+    """
 
     trace_id: str
     span_id: str
     parent_span_id: Optional[str] = None
     is_sampled: bool = True
-    baggage: Dict[str, str] = field(default_factory=dict)
+    baggage: Mapping[str, str] = field(default_factory=lambda: _EMPTY_BAGGAGE)
+    _traceparent: str = field(init=False, repr=False, compare=False)
+    _tracestate: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        flags = TRACE_FLAG_SAMPLED if self.is_sampled else TRACE_FLAG_NOT_SAMPLED
+        object.__setattr__(
+            self,
+            "_traceparent",
+            f"{TRACE_CONTEXT_VERSION}-{self.trace_id}-{self.span_id}-{flags}",
+        )
+        baggage = self.baggage
+        if not baggage:
+            tracestate = ""
+        elif len(baggage) == 1:
+            ((key, value),) = baggage.items()
+            tracestate = f"lexecon={key}={value}"
+        else:
+            tracestate = ",".join([f"lexecon={k}={v}" for k, v in baggage.items()])
+        object.__setattr__(self, "_tracestate", tracestate)
 
     def to_traceparent(self) -> str:
         """Serialize to W3C traceparent header format.
@@ -34,8 +67,7 @@ class SpanContext:
         Returns:
             traceparent header value: {version}-{trace_id}-{span_id}-{flags}
         """
-        flags = TRACE_FLAG_SAMPLED if self.is_sampled else TRACE_FLAG_NOT_SAMPLED
-        return f"{TRACE_CONTEXT_VERSION}-{self.trace_id}-{self.span_id}-{flags}"
+        return self._traceparent
 
     def to_tracestate(self) -> str:
         """Serialize baggage to W3C tracestate header format.
@@ -43,9 +75,7 @@ class SpanContext:
         Returns:
             tracestate header value
         """
-        if not self.baggage:
-            return ""
-        return ",".join(f"lexecon={k}={v}" for k, v in self.baggage.items())
+        return self._tracestate
 
     @classmethod
     def from_traceparent(cls, traceparent: str, tracestate: Optional[str] = None) -> Optional["SpanContext"]:
@@ -58,50 +88,51 @@ class SpanContext:
         Returns:
             SpanContext if valid, None otherwise
         """
-        try:
-            parts = traceparent.split("-")
-            if len(parts) != 4:
-                return None
-
-            version, trace_id, parent_id, flags = parts
-
-            # Validate format
-            if version != TRACE_CONTEXT_VERSION:
-                return None
-            if len(trace_id) != 32 or len(parent_id) != 16:
-                return None
-
-            is_sampled = flags == TRACE_FLAG_SAMPLED
-
-            # Parse tracestate baggage
-            baggage: Dict[str, str] = {}
-            if tracestate:
-                for item in tracestate.split(","):
-                    if item.startswith("lexecon="):
-                        kv = item[8:].split("=", 1)
-                        if len(kv) == 2:
-                            baggage[kv[0]] = kv[1]
-
-            return cls(
-                trace_id=trace_id,
-                span_id=_generate_span_id(),  # Generate new span ID for this service
-                parent_span_id=parent_id,
-                is_sampled=is_sampled,
-                baggage=baggage,
-            )
-        except (ValueError, IndexError):
+        # partition() walks the header once without building a list of parts
+        version, sep, rest = traceparent.partition("-")
+        if not sep or version != TRACE_CONTEXT_VERSION:
+            return None
+        trace_id, sep, rest = rest.partition("-")
+        if not sep or len(trace_id) != 32:
+            return None
+        parent_id, sep, flags = rest.partition("-")
+        if not sep or len(parent_id) != 16 or len(flags) != 2:
             return None
 
+        is_sampled = flags == TRACE_FLAG_SAMPLED
+
+        # Parse tracestate baggage
+        baggage: Mapping[str, str] = _EMPTY_BAGGAGE
+        if tracestate and "lexecon=" in tracestate:
+            parsed: Dict[str, str] = {}
+            for item in tracestate.split(","):
+                if item.startswith("lexecon="):
+                    key, sep, value = item[8:].partition("=")
+                    if sep:
+                        parsed[key] = value
+            baggage = parsed or _EMPTY_BAGGAGE
+
+        return cls(
+            trace_id=trace_id,
+            span_id=_generate_span_id(),  # Generate new span ID for this service
+            parent_span_id=parent_id,
+            is_sampled=is_sampled,
+            baggage=baggage,
+        )
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ObservabilityContext:
     """Complete observability context for a request/operation.
 
     Combines tracing, logging, and metrics context for unified observability.
+    The tracing and request identity fields are fixed once the context is
+    created; only attributes and error state change afterwards.
     """
 
-    # Tracing context
+    # Tracing context; unsampled contexts carry no span
     span_context: Optional[SpanContext] = None
+    is_sampled: bool = True
 
     # Request context
     request_id: Optional[str] = None
@@ -122,6 +153,23 @@ class ObservabilityContext:
     error: Optional[Exception] = None
     error_recorded: bool = False
 
+    # Correlation IDs for log records, built once from the fields above
+    _log_base: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        span = self.span_context
+        base: Dict[str, Any] = {}
+        if span:
+            base["trace_id"] = span.trace_id
+            base["span_id"] = span.span_id
+        if self.request_id:
+            base["request_id"] = self.request_id
+        if self.user_id:
+            base["user_id"] = self.user_id
+        if self.operation_name:
+            base["operation"] = self.operation_name
+        self._log_base = base
+
     @property
     def trace_id(self) -> Optional[str]:
         """Get trace ID for correlation."""
@@ -153,21 +201,15 @@ class ObservabilityContext:
         Returns:
             Dict with trace correlation IDs and context
         """
-        ctx: Dict[str, Any] = {}
+        return {**self._log_base, **self.attributes}
 
-        if self.trace_id:
-            ctx["trace_id"] = self.trace_id
-        if self.span_id:
-            ctx["span_id"] = self.span_id
-        if self.request_id:
-            ctx["request_id"] = self.request_id
-        if self.user_id:
-            ctx["user_id"] = self.user_id
-        if self.operation_name:
-            ctx["operation"] = self.operation_name
+    def iter_log_items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over log context items without building a dict.
 
-        ctx.update(self.attributes)
-        return ctx
+        Returns:
+            Iterator of the same (key, value) pairs as get_log_context
+        """
+        return chain(self._log_base.items(), self.attributes.items())
 
 
 # Context variable for current observability context (async-safe)
@@ -176,17 +218,17 @@ _current_context: ContextVar[Optional[ObservabilityContext]] = ContextVar("obs_c
 
 def _generate_trace_id() -> str:
     """Generate a 128-bit trace ID as 32 hex characters."""
-    return secrets.token_hex(16)
+    return os.urandom(16).hex()
 
 
 def _generate_span_id() -> str:
     """Generate a 64-bit span ID as 16 hex characters."""
-    return secrets.token_hex(8)
+    return os.urandom(8).hex()
 
 
 def _generate_request_id() -> str:
     """Generate a unique request ID."""
-    return f"req_{secrets.token_hex(12)}"
+    return "req_" + os.urandom(12).hex()
 
 
 def get_current_context() -> Optional[ObservabilityContext]:
@@ -242,6 +284,21 @@ def create_context(
     Returns:
         New ObservabilityContext
     """
+    sampled = parent_context.is_sampled if parent_context else is_sampled
+    if not sampled and not traceparent:
+        # Unsampled traces are never exported, so skip generating span and
+        # request IDs; only explicitly passed or inherited values are kept
+        if parent_context:
+            request_id = request_id or parent_context.request_id
+            user_id = user_id or parent_context.user_id
+        return ObservabilityContext(
+            is_sampled=False,
+            request_id=request_id,
+            user_id=user_id,
+            operation_name=operation_name,
+            attributes=attributes,
+        )
+
     # Determine span context
     span_context: Optional[SpanContext] = None
 
@@ -257,7 +314,7 @@ def create_context(
             span_id=_generate_span_id(),
             parent_span_id=parent.span_id,
             is_sampled=parent.is_sampled,
-            baggage=parent.baggage.copy(),
+            baggage=dict(parent.baggage) if parent.baggage else _EMPTY_BAGGAGE,
         )
 
     if not span_context:
@@ -275,6 +332,7 @@ def create_context(
 
     return ObservabilityContext(
         span_context=span_context,
+        is_sampled=span_context.is_sampled,
         request_id=request_id or _generate_request_id(),
         user_id=user_id,
         operation_name=operation_name,
@@ -282,11 +340,13 @@ def create_context(
     )
 
 
+@lru_cache(maxsize=4096)
 def hash_high_cardinality(value: str, prefix: str = "") -> str:
     """Hash a high-cardinality value for safe metric labeling.
 
     This prevents cardinality explosion in Prometheus by hashing
-    unbounded values like user IDs, IP addresses, etc.
+    unbounded values like user IDs, IP addresses, etc. Recent results
+    are cached, since the same values recur across metric records.
 
     Args:
         value: High-cardinality value to hash
@@ -295,7 +355,8 @@ def hash_high_cardinality(value: str, prefix: str = "") -> str:
     Returns:
         Hashed value safe for metric labels (8 char hex)
     """
-    h = hashlib.sha256(value.encode()).hexdigest()[:8]
+    # Not a security boundary: a 4-byte BLAKE2b digest is 8 hex chars as-is
+    h = hashlib.blake2b(value.encode(), digest_size=4).hexdigest()
     return f"{prefix}{h}" if prefix else h
 
 
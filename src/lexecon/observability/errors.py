@@ -10,19 +10,37 @@ with their trace context and system state.
 """
 
 import logging
+import os
+import queue
+import re
+import socket
+import sys
 import time
 import traceback
-from collections import deque
-from dataclasses import dataclass, field
+from collections import Counter, deque
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
-from threading import Lock
-from typing import Any, Callable, Deque, Dict, List, Optional, Type
+from functools import wraps
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Type
 
-from .context import ObservabilityContext, get_current_context
+from .context import DATACLASS_SLOTS, ObservabilityContext, get_current_context
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; every record carries this process's hostname
+_HOSTNAME = socket.gethostname()
+
+# Exception classes whose type-based classification is remembered per classifier
+CLASSIFY_TYPE_CACHE_SIZE = 256
+
+# Number of independently locked shards for per-category error counts
+ERROR_COUNT_SHARDS = 16
+
+# Records waiting for async callbacks; further records skip the callbacks
+CALLBACK_QUEUE_SIZE = 10000
+
 
 class ErrorSeverity(str, Enum):
     """Error severity levels for classification."""
@@ -34,6 +52,16 @@ class ErrorSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+# Logging level for each severity
+_SEVERITY_LEVELS: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.DEBUG: logging.DEBUG,
+    ErrorSeverity.INFO: logging.INFO,
+    ErrorSeverity.WARNING: logging.WARNING,
+    ErrorSeverity.ERROR: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+}
+
+
 class ErrorCategory(str, Enum):
     """Error categories for classification and routing."""
 
@@ -61,7 +89,33 @@ class ErrorCategory(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Upper-case log prefix for each category
+_CATEGORY_LABELS: Dict[ErrorCategory, str] = {
+    category: category.value.upper() for category in ErrorCategory
+}
+
+
+def _format_stack_trace(exception: Exception, severity: ErrorSeverity) -> Optional[str]:
+    """Format the exception's traceback for warnings and above.
+
+    Args:
+        exception: Exception being recorded
+        severity: Severity it is recorded at
+
+    Returns:
+        Formatted traceback, or None for debug/info records and for
+        exceptions that were never raised
+    """
+    if exception.__traceback__ is None:
+        return None
+    if _SEVERITY_LEVELS.get(severity, logging.ERROR) < logging.WARNING:
+        return None
+    return "".join(
+        traceback.format_exception(type(exception), exception, exception.__traceback__)
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ErrorRecord:
     """Structured error record with full context."""
 
@@ -91,26 +145,47 @@ class ErrorRecord:
     service_name: str = "lexecon"
     hostname: Optional[str] = None
 
+    # ISO 8601 timestamp, formatted on first use
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Get the timestamp in ISO 8601 format."""
+        iso = self._timestamp_iso
+        if iso is None:
+            iso = self._timestamp_iso = self.timestamp.isoformat()
+        return iso
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "error_id": self.error_id,
-            "timestamp": self.timestamp.isoformat(),
-            "error_type": self.error_type,
-            "message": self.message,
-            "severity": self.severity.value,
-            "category": self.category.value,
-            "trace_id": self.trace_id,
-            "span_id": self.span_id,
-            "request_id": self.request_id,
-            "user_id": self.user_id,
-            "operation": self.operation,
-            "stack_trace": self.stack_trace,
-            "cause": self.cause,
-            "attributes": self.attributes,
-            "service_name": self.service_name,
-            "hostname": self.hostname,
-        }
+        data = {name: getattr(self, name) for name in _ERROR_RECORD_FIELDS}
+        data["timestamp"] = self.timestamp_iso
+        data["severity"] = self.severity.value
+        data["category"] = self.category.value
+        return data
+
+
+_ERROR_RECORD_FIELDS = tuple(f.name for f in fields(ErrorRecord) if f.init)
+
+
+def _compile_patterns(
+    mappings: Dict[str, ErrorCategory],
+) -> "tuple[re.Pattern[str], tuple[ErrorCategory, ...]]":
+    """Compile message patterns into a single multi-pattern matcher.
+
+    Args:
+        mappings: Substring -> category, in priority order
+
+    Returns:
+        Tuple of (case-insensitive regex with one group per pattern, so a
+        match's lastindex is the pattern's 1-based priority; categories in
+        the same order)
+    """
+    regex = re.compile(
+        "|".join(f"({re.escape(pattern)})" for pattern in mappings),
+        re.IGNORECASE,
+    )
+    return regex, tuple(mappings.values())
 
 
 class ErrorClassifier:
@@ -148,10 +223,21 @@ class ErrorClassifier:
         "invalid": ErrorCategory.VALIDATION,
     }
 
+    _PATTERN_RE, _PATTERN_CATEGORIES = _compile_patterns(PATTERN_MAPPINGS)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Recompile the pattern matcher for subclasses with their own patterns."""
+        super().__init_subclass__(**kwargs)
+        if "PATTERN_MAPPINGS" in cls.__dict__:
+            cls._PATTERN_RE, cls._PATTERN_CATEGORIES = _compile_patterns(cls.PATTERN_MAPPINGS)
+
     def __init__(self) -> None:
         """Initialize classifier with default mappings."""
         self._custom_mappings: Dict[Type[Exception], ErrorCategory] = {}
         self._custom_severities: Dict[Type[Exception], ErrorSeverity] = {}
+        # Type-only classification per exception class; None means the
+        # message patterns decide
+        self._type_cache: Dict[type, Optional["tuple[ErrorCategory, ErrorSeverity]"]] = {}
 
     def register_mapping(
         self,
@@ -169,39 +255,81 @@ class ErrorClassifier:
         self._custom_mappings[exception_type] = category
         if severity:
             self._custom_severities[exception_type] = severity
+        self._type_cache = {}
 
-    def classify(self, exception: Exception) -> tuple[ErrorCategory, ErrorSeverity]:
-        """Classify an exception into category and severity.
+    def _classify_type(
+        self, exc_type: type
+    ) -> Optional["tuple[ErrorCategory, ErrorSeverity]"]:
+        """Classify an exception class from the type mappings alone.
 
         Args:
-            exception: Exception to classify
+            exc_type: Exception class to classify
 
         Returns:
-            Tuple of (category, severity)
+            Tuple of (category, severity), or None if no mapping applies
         """
-        exc_type = type(exception)
-
         # Check custom mappings first
         if exc_type in self._custom_mappings:
             category = self._custom_mappings[exc_type]
             severity = self._custom_severities.get(exc_type, ErrorSeverity.ERROR)
             return category, severity
 
-        # Check default mappings
-        for mapped_type, category in self.DEFAULT_MAPPINGS.items():
-            if isinstance(exception, mapped_type):
-                return category, ErrorSeverity.ERROR
+        # Check default mappings, most specific class first
+        for cls in exc_type.__mro__:
+            default_category = self.DEFAULT_MAPPINGS.get(cls)
+            if default_category is not None:
+                return default_category, ErrorSeverity.ERROR
+
+        return None
+
+    def classify(self, exception: Exception) -> tuple[ErrorCategory, ErrorSeverity]:
+        """Classify an exception into category and severity.
+
+        Args:
+            exception: Exception to classify
 
-        # Pattern matching on exception message
-        message = str(exception).lower()
-        for pattern, category in self.PATTERN_MAPPINGS.items():
-            if pattern in message:
-                return category, ErrorSeverity.ERROR
+        Returns:
+            Tuple of (category, severity)
+        """
+        exc_type = type(exception)
+        try:
+            by_type = self._type_cache[exc_type]
+        except KeyError:
+            by_type = self._classify_type(exc_type)
+            if len(self._type_cache) >= CLASSIFY_TYPE_CACHE_SIZE:
+                self._type_cache.clear()
+            self._type_cache[exc_type] = by_type
+        if by_type is not None:
+            return by_type
+
+        # Pattern matching on exception message in one pass; earlier patterns win
+        priority: Optional[int] = None
+        for match in self._PATTERN_RE.finditer(str(exception)):
+            index = match.lastindex
+            if index is not None and (priority is None or index < priority):
+                priority = index
+                if priority == 1:
+                    break
+        if priority is not None:
+            return self._PATTERN_CATEGORIES[priority - 1], ErrorSeverity.ERROR
 
         # Default
         return ErrorCategory.UNKNOWN, ErrorSeverity.ERROR
 
 
+class _ErrorCountShard:
+    """Error timestamps for the categories that hash to one lock."""
+
+    __slots__ = ("lock", "timestamps", "total")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # Category -> monotonic ns timestamps, oldest first
+        self.timestamps: Dict[str, Deque[int]] = {}
+        # Timestamps held across all categories in this shard
+        self.total = 0
+
+
 class ErrorCorrelator:
     """Correlates and tracks errors across the system.
 
@@ -224,19 +352,31 @@ class ErrorCorrelator:
             error_window_seconds: Time window for error rate calculation
         """
         self._classifier = ErrorClassifier()
-        self._history: Deque[ErrorRecord] = deque(maxlen=max_history)
-        self._lock = Lock()
+        # Recent errors in a fixed ring buffer; _history_next is the slot
+        # the next record overwrites
+        self._history: List[Optional[ErrorRecord]] = [None] * max_history
+        self._history_next = 0
+        self._history_len = 0
+        self._history_lock = Lock()
         self._error_window = error_window_seconds
+        self._error_window_ns = int(error_window_seconds * 1_000_000_000)
 
-        # Callbacks for error notifications
+        # Callbacks for error notifications, run on a background thread
+        # started when the first callback is registered
         self._callbacks: List[Callable[[ErrorRecord], None]] = []
+        self._dispatch_queue: "queue.Queue[Any]" = queue.Queue(maxsize=CALLBACK_QUEUE_SIZE)
+        self._dispatcher: Optional[Thread] = None
+        self._dispatcher_lock = Lock()
+        # Records whose callbacks were skipped because the queue was full
+        self.dropped_callbacks = 0
+
+        # Error times by category (for rate limiting), striped across
+        # shards so categories do not contend on one lock
+        self._count_shards: List[_ErrorCountShard] = [
+            _ErrorCountShard() for _ in range(ERROR_COUNT_SHARDS)
+        ]
 
-        # Error counters by category (for rate limiting)
-        self._error_counts: Dict[str, List[float]] = {}
-
-        # Import hostname
-        import socket
-        self._hostname = socket.gethostname()
+        self._hostname = _HOSTNAME
 
     def register_callback(self, callback: Callable[[ErrorRecord], None]) -> None:
         """Register callback to be notified of errors.
@@ -245,6 +385,47 @@ class ErrorCorrelator:
             callback: Function to call with ErrorRecord
         """
         self._callbacks.append(callback)
+        with self._dispatcher_lock:
+            if self._dispatcher is None:
+                self._dispatcher = Thread(
+                    target=self._dispatch_loop, name="error-callbacks", daemon=True
+                )
+                self._dispatcher.start()
+
+    def flush_callbacks(self, timeout: Optional[float] = None) -> bool:
+        """Wait until callbacks have run for every error recorded so far.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all queued callbacks ran within the timeout
+        """
+        if self._dispatcher is None:
+            return True
+        done = Event()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._dispatch_queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return done.wait(remaining)
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            item = self._dispatch_queue.get()
+            if isinstance(item, Event):
+                item.set()
+            else:
+                self._run_callbacks(item)
+
+    def _run_callbacks(self, record: ErrorRecord) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(record)
+            except Exception as e:
+                logger.warning("Error callback failed: %s", e)
 
     def record_error(
         self,
@@ -252,24 +433,26 @@ class ErrorCorrelator:
         context: Optional[ObservabilityContext] = None,
         severity: Optional[ErrorSeverity] = None,
         category: Optional[ErrorCategory] = None,
+        sync: bool = False,
         **attributes: Any,
     ) -> ErrorRecord:
         """Record an error with full context correlation.
 
+        Callbacks run on a background thread unless sync is set.
+
         Args:
             exception: Exception to record
             context: Optional observability context (uses current if not provided)
             severity: Optional severity override
             category: Optional category override
+            sync: Run callbacks on the calling thread before returning
             **attributes: Additional error attributes
 
         Returns:
             ErrorRecord with full context
         """
-        import secrets
-
         # Get context
-        ctx = context or get_current_context()
+        ctx = context if context is not None else get_current_context()
 
         # Classify error
         auto_category, auto_severity = self._classifier.classify(exception)
@@ -278,64 +461,123 @@ class ErrorCorrelator:
 
         # Extract cause if chained exception
         cause = None
-        if exception.__cause__:
-            cause = f"{type(exception.__cause__).__name__}: {exception.__cause__}"
+        exc_cause = exception.__cause__
+        if exc_cause is not None:
+            cause = f"{type(exc_cause).__name__}: {exc_cause}"
 
-        # Create error record
+        # Create error record; correlation fields default to None and are
+        # only filled in when there is a context
         record = ErrorRecord(
-            error_id=f"err_{secrets.token_hex(8)}",
-            timestamp=datetime.now(timezone.utc),
-            error_type=type(exception).__name__,
-            message=str(exception),
-            severity=final_severity,
-            category=final_category,
-            trace_id=ctx.trace_id if ctx else None,
-            span_id=ctx.span_id if ctx else None,
-            request_id=ctx.request_id if ctx else None,
-            user_id=ctx.user_id if ctx else None,
-            operation=ctx.operation_name if ctx else None,
-            stack_trace=traceback.format_exc(),
+            "err_" + os.urandom(8).hex(),
+            datetime.now(timezone.utc),
+            # Intern repeated names so records in history share one string each
+            sys.intern(type(exception).__name__),
+            str(exception),
+            final_severity,
+            final_category,
+            stack_trace=_format_stack_trace(exception, final_severity),
             cause=cause,
             attributes=attributes,
             hostname=self._hostname,
         )
+        if ctx is not None:
+            record.trace_id = ctx.trace_id
+            record.span_id = ctx.span_id
+            record.request_id = ctx.request_id
+            record.user_id = ctx.user_id
+            operation = ctx.operation_name
+            record.operation = sys.intern(operation) if operation else operation
 
         # Store in history
-        with self._lock:
-            self._history.append(record)
-            self._update_error_counts(final_category.value)
+        self._append_history(record)
+        self._update_error_counts(final_category.value)
 
         # Log the error with correlation context
         self._log_error(record)
 
         # Notify callbacks
-        for callback in self._callbacks:
-            try:
-                callback(record)
-            except Exception as e:
-                logger.warning(f"Error callback failed: {e}")
+        if self._callbacks:
+            if sync:
+                self._run_callbacks(record)
+            else:
+                self._enqueue_callbacks(record)
 
         return record
 
+    def _enqueue_callbacks(self, record: ErrorRecord) -> None:
+        """Queue a record for the dispatcher, dropping it if callbacks are backed up."""
+        try:
+            self._dispatch_queue.put_nowait(record)
+        except queue.Full:
+            with self._dispatcher_lock:
+                self.dropped_callbacks += 1
+                dropped = self.dropped_callbacks
+            if dropped == 1:
+                logger.warning(
+                    "Error callback queue full (%d records), dropping notifications",
+                    CALLBACK_QUEUE_SIZE,
+                )
+
+    def _append_history(self, record: ErrorRecord) -> None:
+        """Store a record, overwriting the oldest once the history is full.
+
+        Args:
+            record: ErrorRecord to store
+        """
+        size = len(self._history)
+        if not size:
+            return
+        with self._history_lock:
+            i = self._history_next
+            self._history[i] = record
+            self._history_next = (i + 1) % size
+            if self._history_len < size:
+                self._history_len += 1
+
+    def _iter_history_newest_first(self) -> Iterator[ErrorRecord]:
+        """Iterate stored records from newest to oldest; hold _history_lock."""
+        history = self._history
+        size = len(history)
+        i = self._history_next
+        for _ in range(self._history_len):
+            i = (i - 1) % size
+            yield history[i]  # type: ignore[misc]
+
     def _update_error_counts(self, category: str) -> None:
         """Update error counts for rate tracking.
 
         Args:
             category: Error category
         """
-        now = time.time()
-        cutoff = now - self._error_window
+        shard = self._count_shard(category)
+        with shard.lock:
+            now = time.monotonic_ns()
+            cutoff = now - self._error_window_ns
 
-        if category not in self._error_counts:
-            self._error_counts[category] = []
+            timestamps = shard.timestamps.get(category)
+            if timestamps is None:
+                timestamps = shard.timestamps[category] = deque()
 
-        # Remove old entries
-        self._error_counts[category] = [
-            t for t in self._error_counts[category] if t > cutoff
-        ]
+            # Remove old entries; timestamps are appended in order
+            expired = 0
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+                expired += 1
+
+            # Add new entry
+            timestamps.append(now)
+            shard.total += 1 - expired
 
-        # Add new entry
-        self._error_counts[category].append(now)
+    def _count_shard(self, category: str) -> "_ErrorCountShard":
+        """Get the shard holding a category's error counts.
+
+        Args:
+            category: Error category
+
+        Returns:
+            Shard for the category
+        """
+        return self._count_shards[hash(category) % ERROR_COUNT_SHARDS]
 
     def _log_error(self, record: ErrorRecord) -> None:
         """Log error with structured context.
@@ -343,13 +585,9 @@ class ErrorCorrelator:
         Args:
             record: ErrorRecord to log
         """
-        log_level = {
-            ErrorSeverity.DEBUG: logging.DEBUG,
-            ErrorSeverity.INFO: logging.INFO,
-            ErrorSeverity.WARNING: logging.WARNING,
-            ErrorSeverity.ERROR: logging.ERROR,
-            ErrorSeverity.CRITICAL: logging.CRITICAL,
-        }.get(record.severity, logging.ERROR)
+        log_level = _SEVERITY_LEVELS.get(record.severity, logging.ERROR)
+        if not logger.isEnabledFor(log_level):
+            return
 
         extra = {
             "error_id": record.error_id,
@@ -363,7 +601,10 @@ class ErrorCorrelator:
 
         logger.log(
             log_level,
-            f"[{record.category.value.upper()}] {record.error_type}: {record.message}",
+            "[%s] %s: %s",
+            _CATEGORY_LABELS[record.category],
+            record.error_type,
+            record.message,
             extra={"extra_fields": extra},
             exc_info=False,  # Stack trace already in record
         )
@@ -377,18 +618,16 @@ class ErrorCorrelator:
         Returns:
             Errors per second in the time window
         """
-        with self._lock:
-            if category:
-                counts = self._error_counts.get(category.value, [])
-            else:
-                counts = []
-                for cat_counts in self._error_counts.values():
-                    counts.extend(cat_counts)
-
-            if not counts:
-                return 0.0
+        if category:
+            shard = self._count_shard(category.value)
+            with shard.lock:
+                timestamps = shard.timestamps.get(category.value)
+                count = len(timestamps) if timestamps else 0
+        else:
+            # Each shard keeps a running total, so this is one read per shard
+            count = sum(shard.total for shard in self._count_shards)
 
-            return len(counts) / self._error_window
+        return count / self._error_window
 
     def get_recent_errors(
         self,
@@ -406,17 +645,23 @@ class ErrorCorrelator:
         Returns:
             List of ErrorRecords
         """
-        with self._lock:
-            records = list(self._history)
-
-        # Apply filters
-        if category:
-            records = [r for r in records if r.category == category]
-        if severity:
-            records = [r for r in records if r.severity == severity]
-
-        # Return most recent
-        return records[-limit:]
+        records: List[ErrorRecord] = []
+        if limit <= 0:
+            return records
+
+        # Scan newest first and stop once limit matches are found
+        with self._history_lock:
+            for record in self._iter_history_newest_first():
+                if category is not None and record.category is not category:
+                    continue
+                if severity is not None and record.severity is not severity:
+                    continue
+                records.append(record)
+                if len(records) >= limit:
+                    break
+
+        records.reverse()
+        return records
 
     def get_error_summary(self) -> Dict[str, Any]:
         """Get summary of recent errors.
@@ -424,30 +669,30 @@ class ErrorCorrelator:
         Returns:
             Summary dict with counts by category and severity
         """
-        with self._lock:
-            records = list(self._history)
-
-        by_category: Dict[str, int] = {}
-        by_severity: Dict[str, int] = {}
-
-        for record in records:
-            cat = record.category.value
-            sev = record.severity.value
+        with self._history_lock:
+            records = tuple(self._iter_history_newest_first())
 
-            by_category[cat] = by_category.get(cat, 0) + 1
-            by_severity[sev] = by_severity.get(sev, 0) + 1
+        # Count enum members, then convert the few distinct keys to values
+        by_category = Counter(record.category for record in records)
+        by_severity = Counter(record.severity for record in records)
 
         return {
             "total": len(records),
-            "by_category": by_category,
-            "by_severity": by_severity,
+            "by_category": {category.value: n for category, n in by_category.items()},
+            "by_severity": {severity.value: n for severity, n in by_severity.items()},
             "error_rate": self.get_error_rate(),
+            "dropped_callbacks": self.dropped_callbacks,
         }
 
 
 # Global error correlator instance
 error_correlator = ErrorCorrelator()
 
+# Set on an exception once an error boundary has recorded it, so outer
+# boundaries the same exception propagates through skip it. Built-in
+# exceptions cannot be weakly referenced, so this is an attribute.
+_BOUNDARY_RECORDED_ATTR = "_lexecon_boundary_recorded"
+
 
 def record_error(
     exception: Exception,
@@ -465,6 +710,20 @@ def record_error(
     return error_correlator.record_error(exception, **kwargs)
 
 
+def _record_boundary_error(
+    exception: Exception,
+    category: Optional[ErrorCategory],
+    severity: Optional[ErrorSeverity],
+    name: str,
+    module: str,
+) -> None:
+    """Record an error caught by a boundary unless an inner boundary already did."""
+    if getattr(exception, _BOUNDARY_RECORDED_ATTR, False):
+        return
+    setattr(exception, _BOUNDARY_RECORDED_ATTR, True)
+    record_error(exception, category=category, severity=severity, function=name, module=module)
+
+
 def error_boundary(
     category: Optional[ErrorCategory] = None,
     severity: Optional[ErrorSeverity] = None,
@@ -472,6 +731,9 @@ def error_boundary(
 ) -> Callable:
     """Decorator to create an error boundary with automatic recording.
 
+    The innermost boundary an error passes through records it; outer
+    boundaries skip that same exception, so each error is recorded once.
+
     Args:
         category: Error category for this boundary
         severity: Error severity for this boundary
@@ -481,17 +743,14 @@ def error_boundary(
         Decorator function
     """
     def decorator(func: Callable) -> Callable:
+        name, module = func.__name__, func.__module__
+
+        @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                record_error(
-                    e,
-                    category=category,
-                    severity=severity,
-                    function=func.__name__,
-                    module=func.__module__,
-                )
+                _record_boundary_error(e, category, severity, name, module)
                 if reraise:
                     raise
 
@@ -500,7 +759,7 @@ def error_boundary(
     return decorator
 
 
-async def async_error_boundary(
+def async_error_boundary(
     category: Optional[ErrorCategory] = None,
     severity: Optional[ErrorSeverity] = None,
     reraise: bool = True,
@@ -516,17 +775,14 @@ async def async_error_boundary(
         Decorator function
     """
     def decorator(func: Callable) -> Callable:
+        name, module = func.__name__, func.__module__
+
+        @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return await func(*args, **kwargs)
             except Exception as e:
-                record_error(
-                    e,
-                    category=category,
-                    severity=severity,
-                    function=func.__name__,
-                    module=func.__module__,
-                )
+                _record_boundary_error(e, category, severity, name, module)
                 if reraise:
                     raise
 
@@ -1,8 +1,17 @@
 """Health check endpoints for Lexecon."""
 
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from enum import Enum
-from typing import Any, Dict, List
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+# Seconds readiness waits for each check before reporting it unhealthy
+READINESS_CHECK_TIMEOUT = 2.0
+
+# Seconds a readiness result is reused before the checks run again
+READINESS_CACHE_TTL = 0.5
 
 
 class HealthStatus(str, Enum):
@@ -20,6 +29,12 @@ class HealthCheck:
         """Initialize health check manager."""
         self.start_time = time.time()
         self.checks: Dict[str, Any] = {}
+        # Run of each check still in flight, as (check_func, future); a hung
+        # check is awaited again by later probes instead of being restarted
+        self._running: Dict[str, Tuple[Any, Future[Any]]] = {}
+        # (monotonic time, result) of the last readiness run
+        self._last_ready: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._ready_lock = Lock()
 
     def add_check(self, name: str, check_func: Any) -> None:
         """Add a health check.
@@ -29,6 +44,7 @@ class HealthCheck:
             check_func: Function that returns (status, details)
         """
         self.checks[name] = check_func
+        self._last_ready = None
 
     def liveness(self) -> Dict[str, Any]:
         """Liveness probe - is the service running?
@@ -45,15 +61,41 @@ class HealthCheck:
     def readiness(self) -> Dict[str, Any]:
         """Readiness probe - is the service ready to accept traffic?
 
+        Checks run concurrently; any check still running after
+        READINESS_CHECK_TIMEOUT seconds is reported unhealthy. Results are
+        reused for READINESS_CACHE_TTL seconds, and concurrent probes on a
+        cache miss wait for a single run rather than each running the checks.
+
+        Returns:
+            Readiness status with component checks
+        """
+        cached = self._last_ready
+        if cached is not None and time.monotonic() - cached[0] < READINESS_CACHE_TTL:
+            return cached[1]
+
+        with self._ready_lock:
+            cached = self._last_ready
+            if cached is not None and time.monotonic() - cached[0] < READINESS_CACHE_TTL:
+                return cached[1]
+            result = self._run_checks()
+            self._last_ready = (time.monotonic(), result)
+            return result
+
+    def _run_checks(self) -> Dict[str, Any]:
+        """Run every registered check and aggregate their statuses.
+
         Returns:
             Readiness status with component checks
         """
         checks_results: List[Dict[str, Any]] = []
         overall_status = HealthStatus.HEALTHY
 
-        for name, check_func in self.checks.items():
+        futures = {name: self._submit(name, check_func) for name, check_func in self.checks.items()}
+        deadline = time.monotonic() + READINESS_CHECK_TIMEOUT
+
+        for name, future in futures.items():
             try:
-                status, details = check_func()
+                status, details = future.result(timeout=max(0.0, deadline - time.monotonic()))
                 checks_results.append({"name": name, "status": status, "details": details})
 
                 # Update overall status
@@ -62,6 +104,16 @@ class HealthCheck:
                 elif status == HealthStatus.DEGRADED and overall_status != HealthStatus.UNHEALTHY:
                     overall_status = HealthStatus.DEGRADED
 
+            except FutureTimeoutError:
+                checks_results.append(
+                    {
+                        "name": name,
+                        "status": HealthStatus.UNHEALTHY,
+                        "details": {"error": "timeout"},
+                    },
+                )
+                overall_status = HealthStatus.UNHEALTHY
+
             except Exception as e:
                 checks_results.append(
                     {
@@ -78,6 +130,36 @@ class HealthCheck:
             "checks": checks_results,
         }
 
+    def _submit(self, name: str, check_func: Any) -> "Future[Any]":
+        """Start a check on a daemon thread, or return its run still in flight.
+
+        Daemon threads keep a hung check from blocking interpreter exit.
+
+        Args:
+            name: Check name
+            check_func: Function that returns (status, details)
+
+        Returns:
+            Future resolving to the check's (status, details)
+        """
+        running = self._running.get(name)
+        if running is not None and running[0] is check_func and not running[1].done():
+            return running[1]
+
+        future: Future[Any] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(check_func())
+            except BaseException as e:
+                future.set_exception(e)
+
+        self._running[name] = (check_func, future)
+        Thread(target=run, name=f"health-check-{name}", daemon=True).start()
+        return future
+
     def startup(self) -> Dict[str, Any]:
         """Startup probe - has the service completed initialization?
 
@@ -10,16 +10,59 @@ Provides:
 import asyncio
 import logging
 import os
+import sqlite3
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+from threading import Lock
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from .circuit_breaker import circuit_breakers
+from .context import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# Last formatted second as (epoch seconds, ISO string); probes run many
+# times per second and all share one formatted timestamp
+_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _iso_timestamp(epoch: float) -> str:
+    """Format an epoch time as an ISO 8601 UTC string with 1s resolution.
+
+    Args:
+        epoch: Seconds since the epoch
+
+    Returns:
+        ISO 8601 timestamp
+    """
+    global _iso_cache
+    second = int(epoch)
+    cached = _iso_cache
+    if cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+        _iso_cache = cached
+    return cached[1]
+
+
+def _iso_now() -> str:
+    """Get the current time as an ISO 8601 UTC string with 1s resolution."""
+    return _iso_timestamp(time.time())
+
 
 class HealthStatus(str, Enum):
     """Health check status levels."""
@@ -30,7 +73,23 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Plain string value of each status. Responses carry these rather than the
+# members, whose str() and format() give "HealthStatus.HEALTHY"; a dict
+# lookup is also cheaper than the Enum.value descriptor.
+_STATUS_VALUES: Dict[HealthStatus, str] = {status: status.value for status in HealthStatus}
+
+# Severity rank of each status for aggregation; the overall readiness
+# status is the worst component's. UNKNOWN does not affect the result.
+_STATUS_RANK: Dict[HealthStatus, int] = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.UNKNOWN: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.UNHEALTHY: 2,
+}
+_RANKED_STATUSES = (HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.UNHEALTHY)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class HealthCheckResult:
     """Result of a health check."""
 
@@ -39,28 +98,28 @@ class HealthCheckResult:
     message: str = ""
     details: Dict[str, Any] = field(default_factory=dict)
     latency_ms: float = 0.0
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: float = field(default_factory=time.time)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "name": self.name,
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self.status],
             "message": self.message,
             "details": self.details,
             "latency_ms": self.latency_ms,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _iso_timestamp(self.timestamp),
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DependencyHealth:
     """Health status of a dependency."""
 
     name: str
     healthy: bool
     response_time_ms: float
-    last_check: datetime
+    last_check: float
     consecutive_failures: int = 0
     error_message: Optional[str] = None
 
@@ -79,6 +138,9 @@ HealthCheckFunc = Union[
     Callable[[], Coroutine[Any, Any, tuple[HealthStatus, Dict[str, Any]]]],
 ]
 
+# A check's result while it runs on the event loop or in an executor
+_CheckAwaitable = Awaitable[Tuple[HealthStatus, Dict[str, Any]]]
+
 
 class HealthCheckManager:
     """Comprehensive health check management.
@@ -95,24 +157,44 @@ class HealthCheckManager:
         self,
         service_name: str = "lexecon",
         cache_ttl_seconds: float = 5.0,
+        per_check_timeout_seconds: float = 2.0,
+        overall_timeout_seconds: float = 5.0,
+        history_size: int = 100,
     ) -> None:
         """Initialize health check manager.
 
         Args:
             service_name: Name of this service
             cache_ttl_seconds: How long to cache health results
+            per_check_timeout_seconds: Budget for a single async check
+            overall_timeout_seconds: Budget for a whole async readiness run
+            history_size: Number of recent results kept per check
         """
         self.service_name = service_name
         self.cache_ttl = cache_ttl_seconds
+        self.per_check_timeout = per_check_timeout_seconds
+        self.overall_timeout = overall_timeout_seconds
         self.start_time = time.time()
 
-        # Health checks
-        self._checks: Dict[str, HealthCheckFunc] = {}
+        # Health checks in registration order as (function, is_async);
+        # coroutine functions are detected once, in add_check()
+        self._checks: Dict[str, Tuple[HealthCheckFunc, bool]] = {}
+        self._has_async_checks = False
         self._dependencies: Dict[str, DependencyHealth] = {}
 
-        # Cached results
-        self._cached_readiness: Optional[Dict[str, Any]] = None
-        self._cache_time: float = 0.0
+        # Recent results per check, oldest first; the deques drop the
+        # oldest result once full
+        self.history_size = history_size
+        self._history: Dict[str, Deque[HealthCheckResult]] = {}
+
+        # Cached readiness as one (time, result) snapshot, so a reader
+        # never sees a result paired with another run's time
+        self._cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Held while recomputing so concurrent probes wait for one run;
+        # the asyncio lock is created per event loop
+        self._recompute_lock = Lock()
+        self._async_recompute_lock: Optional[asyncio.Lock] = None
+        self._async_lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Initialization tracking
         self._initialized = False
@@ -121,6 +203,34 @@ class HealthCheckManager:
         # Version info
         self._version = os.getenv("LEXECON_VERSION", "0.1.0")
         self._environment = os.getenv("LEXECON_ENV", "development")
+        self._build_probe_bases()
+
+    def _build_probe_bases(self) -> None:
+        """Build the fixed parts of the liveness and readiness responses."""
+        self._liveness_base: Dict[str, Any] = {
+            "status": HealthStatus.HEALTHY.value,
+            "service": self.service_name,
+            "version": self._version,
+        }
+        self._readiness_base: Dict[str, Any] = {
+            "service": self.service_name,
+            "version": self._version,
+            "environment": self._environment,
+        }
+
+    def set_service_info(self, service_name: str, version: str, environment: str) -> None:
+        """Update the service identity reported by the probes.
+
+        Args:
+            service_name: Name of this service
+            version: Service version
+            environment: Deployment environment
+        """
+        self.service_name = service_name
+        self._version = version
+        self._environment = environment
+        self._build_probe_bases()
+        self._cache = None
 
     def add_check(
         self,
@@ -135,10 +245,22 @@ class HealthCheckManager:
             check_func: Function returning (HealthStatus, details)
             required_for_startup: Whether this check is required for startup
         """
-        self._checks[name] = check_func
+        self._checks[name] = (check_func, asyncio.iscoroutinefunction(check_func))
+        self._has_async_checks = any(is_async for _, is_async in self._checks.values())
         if required_for_startup:
             self._initialization_checks[name] = False
 
+    def get_history(self, name: str) -> List[HealthCheckResult]:
+        """Get recent results of a health check.
+
+        Args:
+            name: Check name
+
+        Returns:
+            Up to history_size results, oldest first
+        """
+        return list(self._history.get(name, ()))
+
     def register_dependency(
         self,
         name: str,
@@ -154,7 +276,7 @@ class HealthCheckManager:
             name=name,
             healthy=initial_healthy,
             response_time_ms=0.0,
-            last_check=datetime.now(timezone.utc),
+            last_check=time.time(),
         )
 
     def update_dependency_health(
@@ -178,7 +300,7 @@ class HealthCheckManager:
         dep = self._dependencies[name]
         dep.healthy = healthy
         dep.response_time_ms = response_time_ms
-        dep.last_check = datetime.now(timezone.utc)
+        dep.last_check = time.time()
         dep.error_message = error_message
 
         if healthy:
@@ -208,17 +330,16 @@ class HealthCheckManager:
         Returns 200 if the process is running.
         Used to detect deadlocks/hangs - should restart pod if fails.
 
+        Never runs checks or touches dependencies.
+
         Returns:
             Liveness status
         """
-        uptime = time.time() - self.start_time
-
+        now = time.time()
         return {
-            "status": HealthStatus.HEALTHY.value,
-            "service": self.service_name,
-            "version": self._version,
-            "uptime_seconds": round(uptime, 2),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **self._liveness_base,
+            "uptime_seconds": round(now - self.start_time, 2),
+            "timestamp": _iso_timestamp(now),
         }
 
     def readiness(self) -> Dict[str, Any]:
@@ -226,74 +347,128 @@ class HealthCheckManager:
 
         Returns 200 if service can accept traffic.
         Used for load balancing - traffic removed if fails.
+        Async code should call readiness_async() so async checks can run.
 
         Returns:
             Readiness status with component checks
         """
-        # Check cache
+        cached = self._fresh_readiness()
+        if cached is not None:
+            return cached
+
+        with self._recompute_lock:
+            cached = self._fresh_readiness()
+            if cached is not None:
+                return cached
+            return self._compute_readiness()
+
+    def _fresh_readiness(self) -> Optional[Dict[str, Any]]:
+        """Get the cached readiness result if it is within the cache TTL.
+
+        Returns:
+            Cached readiness status, or None if missing or expired
+        """
+        cache = self._cache
+        if cache is not None and time.time() - cache[0] < self.cache_ttl:
+            return cache[1]
+        return None
+
+    def _compute_readiness(self) -> Dict[str, Any]:
+        """Run all readiness checks and cache the result.
+
+        Async checks need an event loop. With none running in this thread,
+        every check runs through the async path; inside a running loop,
+        async checks are reported unhealthy and callers should use
+        readiness_async() instead.
+
+        Returns:
+            Readiness status with component checks
+        """
+        if self._has_async_checks:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._compute_readiness_async())
+
         now = time.time()
-        if self._cached_readiness and (now - self._cache_time) < self.cache_ttl:
-            return self._cached_readiness
+        results = [
+            self._run_check(name, check_func, is_async)
+            for name, (check_func, is_async) in self._checks.items()
+        ]
+        return self._finish_readiness(now, results)
 
-        checks_results: List[Dict[str, Any]] = []
-        overall_status = HealthStatus.HEALTHY
+    def _finish_readiness(
+        self,
+        now: float,
+        results: List[HealthCheckResult],
+    ) -> Dict[str, Any]:
+        """Combine check results with dependency and circuit breaker state.
 
-        # Run health checks
-        for name, check_func in self._checks.items():
-            result = self._run_check(name, check_func)
-            checks_results.append(result.to_dict())
+        Args:
+            now: Time the checks started
+            results: Results of the registered checks
 
-            # Update overall status
-            if result.status == HealthStatus.UNHEALTHY:
-                overall_status = HealthStatus.UNHEALTHY
-            elif result.status == HealthStatus.DEGRADED:
-                if overall_status == HealthStatus.HEALTHY:
-                    overall_status = HealthStatus.DEGRADED
+        Returns:
+            Readiness status with component checks, also stored in the cache
+        """
+        checks_results: List[Dict[str, Any]] = []
+        append = checks_results.append
+        rank = _STATUS_RANK
+        worst = 0
+        history = self._history
+
+        for result in results:
+            recent = history.get(result.name)
+            if recent is None:
+                recent = history[result.name] = deque(maxlen=self.history_size)
+            recent.append(result)
+
+            # Same shape as HealthCheckResult.to_dict(), built inline
+            append({
+                "name": result.name,
+                "status": _STATUS_VALUES[result.status],
+                "message": result.message,
+                "details": result.details,
+                "latency_ms": result.latency_ms,
+                "timestamp": _iso_timestamp(result.timestamp),
+            })
+            worst = max(worst, rank[result.status])
 
         # Check dependencies
         for name, dep in self._dependencies.items():
-            checks_results.append({
+            dep_status = dep.status
+            append({
                 "name": f"dependency:{name}",
-                "status": dep.status.value,
+                "status": _STATUS_VALUES[dep_status],
                 "details": {
                     "response_time_ms": dep.response_time_ms,
                     "consecutive_failures": dep.consecutive_failures,
                     "error": dep.error_message,
                 },
-                "timestamp": dep.last_check.isoformat(),
+                "timestamp": _iso_timestamp(dep.last_check),
+            })
+            worst = max(worst, rank[dep_status])
+
+        # Open circuit breakers degrade readiness
+        for service, status in circuit_breakers.get_open_status().items():
+            worst = max(worst, rank[HealthStatus.DEGRADED])
+            append({
+                "name": f"circuit_breaker:{service}",
+                "status": _STATUS_VALUES[HealthStatus.DEGRADED],
+                "details": status,
             })
 
-            if dep.status == HealthStatus.UNHEALTHY:
-                overall_status = HealthStatus.UNHEALTHY
-            elif dep.status == HealthStatus.DEGRADED:
-                if overall_status == HealthStatus.HEALTHY:
-                    overall_status = HealthStatus.DEGRADED
-
-        # Check circuit breakers
-        cb_status = circuit_breakers.get_all_status()
-        for service, status in cb_status.items():
-            if status["state"] == "open":
-                overall_status = HealthStatus.DEGRADED
-                checks_results.append({
-                    "name": f"circuit_breaker:{service}",
-                    "status": HealthStatus.DEGRADED.value,
-                    "details": status,
-                })
-
-        result = {
-            "status": overall_status.value,
-            "service": self.service_name,
-            "version": self._version,
-            "environment": self._environment,
+        response = {
+            "status": _STATUS_VALUES[_RANKED_STATUSES[worst]],
+            **self._readiness_base,
             "checks": checks_results,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _iso_now(),
         }
 
         # Cache result
-        self._cached_readiness = result
-        self._cache_time = now
+        self._cache = (now, response)
 
-        return result
+        return response
 
     def startup(self) -> Dict[str, Any]:
         """Kubernetes startup probe.
@@ -312,44 +487,39 @@ class HealthCheckManager:
         status = HealthStatus.HEALTHY if self._initialized else HealthStatus.UNHEALTHY
 
         return {
-            "status": status.value,
+            "status": _STATUS_VALUES[status],
             "service": self.service_name,
             "initialized": self._initialized,
             "checks": initialization_status,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _iso_now(),
         }
 
     def _run_check(
         self,
         name: str,
         check_func: HealthCheckFunc,
+        is_async: bool,
     ) -> HealthCheckResult:
         """Run a health check with timing.
 
         Args:
             name: Check name
             check_func: Check function
+            is_async: Whether check_func is a coroutine function
 
         Returns:
             HealthCheckResult
         """
-        start = time.time()
+        start = time.perf_counter()
 
         try:
-            # Handle both sync and async checks
-            if asyncio.iscoroutinefunction(check_func):
-                # Run async check in event loop
-                try:
-                    loop = asyncio.get_running_loop()
-                    future = asyncio.ensure_future(check_func())
-                    status, details = loop.run_until_complete(future)
-                except RuntimeError:
-                    # No running loop, create one
-                    status, details = asyncio.run(check_func())
-            else:
-                status, details = check_func()
+            if is_async:
+                # A loop is already running in this thread, so the check
+                # cannot be awaited from sync code
+                raise RuntimeError("async health check requires readiness_async()")
+            status, details = check_func()
 
-            latency = (time.time() - start) * 1000
+            latency = (time.perf_counter() - start) * 1000
 
             return HealthCheckResult(
                 name=name,
@@ -359,7 +529,7 @@ class HealthCheckManager:
             )
 
         except Exception as e:
-            latency = (time.time() - start) * 1000
+            latency = (time.perf_counter() - start) * 1000
             logger.warning(f"Health check '{name}' failed: {e}")
 
             return HealthCheckResult(
@@ -376,89 +546,83 @@ class HealthCheckManager:
         Returns:
             Readiness status
         """
-        # Check cache
-        now = time.time()
-        if self._cached_readiness and (now - self._cache_time) < self.cache_ttl:
-            return self._cached_readiness
+        cached = self._fresh_readiness()
+        if cached is not None:
+            return cached
 
-        checks_results: List[Dict[str, Any]] = []
-        overall_status = HealthStatus.HEALTHY
-
-        # Run health checks concurrently
-        tasks = []
-        for name, check_func in self._checks.items():
-            tasks.append(self._run_check_async(name, check_func))
-
-        results = await asyncio.gather(*tasks)
-
-        for result in results:
-            checks_results.append(result.to_dict())
-
-            if result.status == HealthStatus.UNHEALTHY:
-                overall_status = HealthStatus.UNHEALTHY
-            elif result.status == HealthStatus.DEGRADED:
-                if overall_status == HealthStatus.HEALTHY:
-                    overall_status = HealthStatus.DEGRADED
-
-        # Add dependency checks (same as sync)
-        for name, dep in self._dependencies.items():
-            checks_results.append({
-                "name": f"dependency:{name}",
-                "status": dep.status.value,
-                "details": {
-                    "response_time_ms": dep.response_time_ms,
-                    "consecutive_failures": dep.consecutive_failures,
-                    "error": dep.error_message,
-                },
-                "timestamp": dep.last_check.isoformat(),
-            })
+        async with self._get_async_recompute_lock():
+            cached = self._fresh_readiness()
+            if cached is not None:
+                return cached
+            return await self._compute_readiness_async()
 
-            if dep.status == HealthStatus.UNHEALTHY:
-                overall_status = HealthStatus.UNHEALTHY
-            elif dep.status == HealthStatus.DEGRADED:
-                if overall_status == HealthStatus.HEALTHY:
-                    overall_status = HealthStatus.DEGRADED
+    def _get_async_recompute_lock(self) -> asyncio.Lock:
+        """Get the recompute lock for the running event loop.
 
-        result = {
-            "status": overall_status.value,
-            "service": self.service_name,
-            "version": self._version,
-            "environment": self._environment,
-            "checks": checks_results,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
+        Returns:
+            asyncio.Lock bound to the current loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_lock_loop is not loop:
+            self._async_recompute_lock = asyncio.Lock()
+            self._async_lock_loop = loop
+        return self._async_recompute_lock  # type: ignore[return-value]
 
-        # Cache result
-        self._cached_readiness = result
-        self._cache_time = now
+    async def _compute_readiness_async(self) -> Dict[str, Any]:
+        """Run all readiness checks concurrently and cache the result.
 
-        return result
+        Returns:
+            Readiness status
+        """
+        now = time.time()
+        tasks = [
+            asyncio.ensure_future(self._run_check_async(name, check_func, is_async))
+            for name, (check_func, is_async) in self._checks.items()
+        ]
+        results: List[HealthCheckResult] = []
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.overall_timeout)
+            for task in pending:
+                task.cancel()
+            for name, task in zip(self._checks, tasks):
+                if task in pending:
+                    results.append(self._timeout_result(name, self.overall_timeout))
+                else:
+                    results.append(task.result())
+        return self._finish_readiness(now, results)
 
     async def _run_check_async(
         self,
         name: str,
         check_func: HealthCheckFunc,
+        is_async: bool,
     ) -> HealthCheckResult:
         """Run health check asynchronously.
 
         Args:
             name: Check name
             check_func: Check function
+            is_async: Whether check_func is a coroutine function
 
         Returns:
             HealthCheckResult
         """
-        start = time.time()
+        start = time.perf_counter()
 
         try:
-            if asyncio.iscoroutinefunction(check_func):
-                status, details = await check_func()
+            # is_async tells which member of HealthCheckFunc this is, which
+            # mypy cannot narrow on, hence the casts
+            pending: _CheckAwaitable
+            if is_async:
+                pending = cast("_CheckAwaitable", check_func())
             else:
-                # Run sync function in executor
+                # Run sync function in executor; on timeout the worker
+                # thread finishes in the background but is no longer awaited
                 loop = asyncio.get_running_loop()
-                status, details = await loop.run_in_executor(None, check_func)
+                pending = cast("_CheckAwaitable", loop.run_in_executor(None, check_func))
+            status, details = await asyncio.wait_for(pending, timeout=self.per_check_timeout)
 
-            latency = (time.time() - start) * 1000
+            latency = (time.perf_counter() - start) * 1000
 
             return HealthCheckResult(
                 name=name,
@@ -467,8 +631,11 @@ class HealthCheckManager:
                 latency_ms=latency,
             )
 
+        except asyncio.TimeoutError:
+            return self._timeout_result(name, time.perf_counter() - start)
+
         except Exception as e:
-            latency = (time.time() - start) * 1000
+            latency = (time.perf_counter() - start) * 1000
             logger.warning(f"Health check '{name}' failed: {e}")
 
             return HealthCheckResult(
@@ -479,6 +646,26 @@ class HealthCheckManager:
                 latency_ms=latency,
             )
 
+    @staticmethod
+    def _timeout_result(name: str, elapsed: float) -> HealthCheckResult:
+        """Build the result for a check that ran out of time.
+
+        Args:
+            name: Check name
+            elapsed: Seconds spent before giving up
+
+        Returns:
+            HealthCheckResult
+        """
+        logger.warning("Health check '%s' timed out after %.2fs", name, elapsed)
+        return HealthCheckResult(
+            name=name,
+            status=HealthStatus.UNHEALTHY,
+            message="timeout",
+            details={"error": "timeout"},
+            latency_ms=elapsed * 1000,
+        )
+
 
 # Global health check manager
 health_manager = HealthCheckManager()
@@ -500,13 +687,21 @@ def check_ledger() -> tuple[HealthStatus, Dict[str, Any]]:
     return HealthStatus.HEALTHY, {"chain_length": 0}
 
 
+# Connection reused by check_database as (owning pid, connection); opened
+# on first use and reopened in a forked child, which must not share it
+_health_db: Optional[Tuple[int, sqlite3.Connection]] = None
+_health_db_lock = Lock()
+
+
 def check_database() -> tuple[HealthStatus, Dict[str, Any]]:
     """Check database connectivity."""
+    global _health_db
     try:
-        import sqlite3
-        conn = sqlite3.connect(":memory:")
-        conn.execute("SELECT 1")
-        conn.close()
+        with _health_db_lock:
+            pid = os.getpid()
+            if _health_db is None or _health_db[0] != pid:
+                _health_db = (pid, sqlite3.connect(":memory:", check_same_thread=False))
+            _health_db[1].execute("SELECT 1")
         return HealthStatus.HEALTHY, {"type": "sqlite", "connected": True}
     except Exception as e:
         return HealthStatus.UNHEALTHY, {"error": str(e)}
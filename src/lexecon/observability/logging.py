@@ -2,24 +2,72 @@
 
 import json
 import logging
+import os
 import sys
+import time
 import traceback
 from contextvars import ContextVar
-from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# Optional fast JSON encoder
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Capturing the caller's stack walks every frame, so ERROR records without
+# an exception only get one when explicitly enabled
+LOG_STACK_TRACES = os.getenv("LEXECON_LOG_STACK_TRACE", "false").lower() == "true"
 
 # Context variables for request tracking
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
+_get_request_id = request_id_var.get
+_get_user_id = user_id_var.get
+
+# Last formatted second as (epoch seconds, "YYYY-MM-DDTHH:MM:SS"); records
+# within one second only append their milliseconds
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float, msecs: float) -> str:
+    """Format a record creation time as an ISO 8601 UTC string.
+
+    Args:
+        created: Record creation time in seconds since the epoch
+        msecs: Millisecond part of the creation time, as set by logging
+
+    Returns:
+        Timestamp with millisecond resolution and a Z suffix
+    """
+    global _timestamp_cache
+    second = int(created)
+    cached = _timestamp_cache
+    if cached[0] != second:
+        cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+        _timestamp_cache = cached
+    return "%s.%03dZ" % (cached[1], msecs)
 
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    def __init__(self, *args: Any, stack_traces: bool = LOG_STACK_TRACES, **kwargs: Any) -> None:
+        """Initialize formatter.
+
+        Args:
+            stack_traces: Attach the caller's stack to ERROR records without
+                exception info
+        """
+        super().__init__(*args, **kwargs)
+        self.stack_traces = stack_traces
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _format_timestamp(record.created, record.msecs),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -29,11 +77,11 @@ class StructuredFormatter(logging.Formatter):
         }
 
         # Add request context if available
-        request_id = request_id_var.get()
+        request_id = _get_request_id()
         if request_id:
             log_data["request_id"] = request_id
 
-        user_id = user_id_var.get()
+        user_id = _get_user_id()
         if user_id:
             log_data["user_id"] = user_id
 
@@ -50,9 +98,11 @@ class StructuredFormatter(logging.Formatter):
             }
 
         # Add stack trace for errors
-        if record.levelno >= logging.ERROR and not record.exc_info:
+        if self.stack_traces and record.levelno >= logging.ERROR and not record.exc_info:
             log_data["stack_trace"] = traceback.format_stack()
 
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(log_data)
 
 
@@ -106,16 +156,17 @@ class LoggerAdapter(logging.LoggerAdapter):
 
     def process(self, msg: str, kwargs: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
         """Process log message with extra fields."""
-        if "extra" not in kwargs:
-            kwargs["extra"] = {}
+        extra = kwargs.get("extra")
+        if extra is None:
+            extra = kwargs["extra"] = {}
 
         # Add context from ContextVars
-        request_id = request_id_var.get()
+        request_id = _get_request_id()
         if request_id:
-            kwargs["extra"]["request_id"] = request_id
+            extra["request_id"] = request_id
 
-        user_id = user_id_var.get()
+        user_id = _get_user_id()
         if user_id:
-            kwargs["extra"]["user_id"] = user_id
+            extra["user_id"] = user_id
 
         return msg, kwargs
@@ -22,7 +22,9 @@ from lexecon.observability.metrics_v2 import (
     policies_loaded_total,
     policy_evaluation_errors_total,
     record_decision,
+    record_policies_loaded,
     record_policy_load,
+    record_tokens_issued,
     tokens_issued_total,
     tokens_verified_total,
 )
@@ -51,4 +53,6 @@ __all__ = [
     "metrics",
     "record_decision",
     "record_policy_load",
+    "record_policies_loaded",
+    "record_tokens_issued",
 ]
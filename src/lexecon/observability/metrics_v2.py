@@ -8,9 +8,13 @@ This module provides:
 - Proper histogram buckets for latency percentiles
 """
 
+import collections
+import os
 import time
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Callable
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
 
 from prometheus_client import (
     REGISTRY,
@@ -23,6 +27,18 @@ from prometheus_client import (
 
 from .context import hash_high_cardinality
 
+# Set LEXECON_METRICS_ENABLED=false to let hot paths skip metric recording
+METRICS_ENABLED = os.getenv("LEXECON_METRICS_ENABLED", "true").lower() == "true"
+
+# Upper bound on cached labelled metric children; label sets beyond it are
+# still recorded, just resolved through .labels() on every call
+LABEL_CHILD_CACHE_SIZE = 4096
+
+# Shared label value strings, indexed by bool and by (capped) risk level;
+# Prometheus convention is lowercase booleans
+_BOOL_LABELS = ("false", "true")
+_RISK_LABELS = ("0", "1", "2", "3", "4", "5")
+
 # SLI histogram buckets optimized for different latency profiles
 # Fast operations (cache hits, simple lookups): 1ms - 100ms
 FAST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1)
@@ -292,10 +308,42 @@ node_uptime_seconds = Gauge(
 class MetricsCollector:
     """Production metrics collection with cardinality management."""
 
-    def __init__(self) -> None:
-        """Initialize metrics collector."""
+    def __init__(self, enabled: bool = METRICS_ENABLED, export_ttl_seconds: float = 1.0) -> None:
+        """Initialize metrics collector.
+
+        Args:
+            enabled: Whether hot-path callers should record metrics
+            export_ttl_seconds: How long an exported scrape body is reused
+        """
+        self.enabled = enabled
+        self.export_ttl = export_ttl_seconds
+        # Last export as one (monotonic time, body) snapshot; the lock makes
+        # concurrent scrapes on a stale cache wait for a single export
+        self._export_cache: Optional[Tuple[float, bytes]] = None
+        self._export_lock = Lock()
         self.start_time = time.time()
         self._initialized = False
+        # (metric, label values) -> labelled child, so hot paths skip the
+        # validation and locking in .labels()
+        self._children: Dict[Tuple[Any, Tuple[str, ...]], Any] = {}
+
+    def _child(self, metric: Any, *label_values: str) -> Any:
+        """Get the labelled child of a metric, caching it for reuse.
+
+        Args:
+            metric: Labelled Prometheus metric
+            *label_values: Label values in the metric's label order
+
+        Returns:
+            Metric child for the label values
+        """
+        key = (metric, label_values)
+        child = self._children.get(key)
+        if child is None:
+            child = metric.labels(*label_values)
+            if len(self._children) < LABEL_CHILD_CACHE_SIZE:
+                self._children[key] = child
+        return child
 
     def initialize(
         self,
@@ -350,16 +398,28 @@ class MetricsCollector:
         endpoint_group = self._normalize_endpoint(endpoint)
         status_class = f"{status // 100}xx"
 
-        http_requests_total.labels(
-            method=method,
-            endpoint_group=endpoint_group,
-            status_class=status_class,
-        ).inc()
+        self._child(http_requests_total, method, endpoint_group, status_class).inc()
+        self._child(http_request_duration_seconds, method, endpoint_group).observe(duration)
 
-        http_request_duration_seconds.labels(
-            method=method,
-            endpoint_group=endpoint_group,
-        ).observe(duration)
+    @contextmanager
+    def time_request(self, method: str, endpoint: str) -> Iterator[None]:
+        """Time a block with perf_counter and record it as request duration.
+
+        Preferred over passing a duration computed with time.time(), which
+        follows wall-clock adjustments.
+
+        Args:
+            method: HTTP method
+            endpoint: Request endpoint
+        """
+        child = self._child(
+            http_request_duration_seconds, method, self._normalize_endpoint(endpoint)
+        )
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            child.observe(time.perf_counter() - start)
 
     def _normalize_endpoint(self, endpoint: str) -> str:
         """Normalize endpoint to prevent cardinality explosion.
@@ -413,25 +473,40 @@ class MetricsCollector:
             policy_mode: Policy evaluation mode
             complexity: Decision complexity
         """
+        allowed_label = _BOOL_LABELS[bool(allowed)]
+        # Cap risk level
+        risk_label = _RISK_LABELS[min(risk_level, 5)] if risk_level >= 0 else str(risk_level)
+
         # Main decision counter (low cardinality)
-        decisions_total.labels(
-            allowed=str(allowed),
-            risk_level=str(min(risk_level, 5)),  # Cap risk level
-            policy_mode=policy_mode,
-        ).inc()
+        self._child(decisions_total, allowed_label, risk_label, policy_mode).inc()
 
         # Duration histogram for SLI
-        decision_evaluation_duration_seconds.labels(
-            policy_mode=policy_mode,
-            complexity=complexity,
-        ).observe(duration)
+        self._child(decision_evaluation_duration_seconds, policy_mode, complexity).observe(
+            duration
+        )
 
         # Actor-specific counter with hashed ID
         actor_hash = hash_high_cardinality(actor, prefix="actor_")
-        decisions_by_actor_hash.labels(
-            actor_hash=actor_hash,
-            allowed=str(allowed),
-        ).inc()
+        self._child(decisions_by_actor_hash, actor_hash, allowed_label).inc()
+
+    @contextmanager
+    def time_decision(
+        self,
+        policy_mode: str = "strict",
+        complexity: str = "moderate",
+    ) -> Iterator[None]:
+        """Time a decision evaluation with perf_counter.
+
+        Args:
+            policy_mode: Policy evaluation mode
+            complexity: Decision complexity
+        """
+        child = self._child(decision_evaluation_duration_seconds, policy_mode, complexity)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            child.observe(time.perf_counter() - start)
 
     def record_denial(self, reason_category: str, actor: str) -> None:
         """Record decision denial.
@@ -440,7 +515,7 @@ class MetricsCollector:
             reason_category: Category of denial reason
             actor: Actor identifier (not used in metric, kept for logging)
         """
-        decisions_denied_total.labels(reason_category=reason_category).inc()
+        self._child(decisions_denied_total, reason_category).inc()
 
     def record_decision_error(self, error_type: str) -> None:
         """Record decision processing error (SLI).
@@ -448,7 +523,7 @@ class MetricsCollector:
         Args:
             error_type: Type of error
         """
-        decision_errors_total.labels(error_type=error_type).inc()
+        self._child(decision_errors_total, error_type).inc()
 
     # -------------------------------------------------------------------------
     # Dependency Metrics
@@ -547,10 +622,7 @@ class MetricsCollector:
             service: Service name
             result: Request result (success, failure, rejected)
         """
-        circuit_breaker_requests_total.labels(
-            service=service,
-            result=result,
-        ).inc()
+        self._child(circuit_breaker_requests_total, service, result).inc()
 
     # -------------------------------------------------------------------------
     # Utility Methods
@@ -563,9 +635,24 @@ class MetricsCollector:
         return uptime
 
     def export_metrics(self) -> bytes:
-        """Export metrics in Prometheus format."""
-        self.get_uptime()  # Update uptime before export
-        return generate_latest(REGISTRY)
+        """Export metrics in Prometheus format.
+
+        Scrapes within export_ttl of the last export reuse its output.
+        """
+        cached = self._export_cache
+        if cached is not None and time.monotonic() - cached[0] < self.export_ttl:
+            return cached[1]
+
+        with self._export_lock:
+            cached = self._export_cache
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < self.export_ttl:
+                return cached[1]
+
+            self.get_uptime()  # Update uptime before export
+            data = generate_latest(REGISTRY)
+            self._export_cache = (now, data)
+            return data
 
 
 # Global metrics instance
@@ -589,8 +676,33 @@ def record_decision(
 
 def record_policy_load(policy_name: str, version: str = "1.0") -> None:
     """Record a policy load metric."""
-    policies_loaded_total.labels(policy_version=version).inc()
-    active_policies.inc()
+    record_policies_loaded([policy_name], version)
+
+
+def record_policies_loaded(policy_names: Sequence[str], version: str = "1.0") -> None:
+    """Record a bulk policy load with one update per metric.
+
+    Args:
+        policy_names: Names of the loaded policies
+        version: Policy version shared by the batch
+    """
+    if not policy_names:
+        return
+    policies_loaded_total.labels(policy_version=version).inc(len(policy_names))
+    active_policies.inc(len(policy_names))
+
+
+def record_tokens_issued(scope_types: Sequence[str]) -> None:
+    """Record a batch of issued capability tokens.
+
+    Args:
+        scope_types: Grouped scope type of each issued token
+    """
+    if not scope_types:
+        return
+    for scope_type, count in collections.Counter(scope_types).items():
+        tokens_issued_total.labels(scope_type=scope_type).inc(count)
+    active_tokens.inc(len(scope_types))
 
 
 def timed_operation(metric_histogram: Histogram, **labels: str) -> Callable:
@@ -605,11 +717,11 @@ def timed_operation(metric_histogram: Histogram, **labels: str) -> Callable:
     """
     def decorator(func: Callable) -> Callable:
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start = time.time()
+            start = time.perf_counter()
             try:
                 return func(*args, **kwargs)
             finally:
-                duration = time.time() - start
+                duration = time.perf_counter() - start
                 metric_histogram.labels(**labels).observe(duration)
 
         return wrapper
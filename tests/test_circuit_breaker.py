@@ -0,0 +1,336 @@
+"""Tests for circuit breaker resilience patterns."""
+
+import asyncio
+import logging
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from lexecon.observability.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    CircuitBreakerRegistry,
+)
+from lexecon.observability.metrics_v2 import CircuitState
+
+
+def _fail():
+    raise RuntimeError("down")
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_success_keeps_circuit_closed(self):
+        """Test successful calls pass through a closed circuit."""
+        cb = CircuitBreaker("svc")
+
+        assert cb.call(lambda: 42) == 42
+        assert cb.is_closed
+
+    def test_closed_success_skips_lock(self):
+        """Test a successful call on a closed circuit never takes the lock."""
+        cb = CircuitBreaker("svc")
+        cb._lock = MagicMock()
+
+        assert cb.call(lambda: 42) == 42
+
+        cb._lock.__enter__.assert_not_called()
+        assert cb._state.success_count == 1
+
+    def test_state_read_skips_lock(self):
+        """Test state queries never take the lock."""
+        cb = CircuitBreaker("svc")
+        cb._lock = MagicMock()
+
+        assert cb.state is CircuitState.CLOSED
+        assert cb.is_closed and not cb.is_open and not cb.is_half_open
+
+        cb._lock.__enter__.assert_not_called()
+
+    def test_opens_after_threshold(self):
+        """Test the circuit opens once failures reach the threshold."""
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=2))
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                cb.call(_fail)
+
+        assert cb.is_open
+        with pytest.raises(CircuitBreakerError):
+            cb.call(lambda: 42)
+        assert cb.call(lambda: 42, fallback=lambda: "fallback") == "fallback"
+
+    def test_failures_outside_window_expire(self, monkeypatch):
+        """Test only failures inside the window count toward the threshold."""
+        from lexecon.observability import circuit_breaker as cb_module
+
+        now = [1000.0]
+        monkeypatch.setattr(cb_module.time, "time", lambda: now[0])
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=3, failure_window=10))
+
+        for step in (0, 5, 11):
+            now[0] = 1000.0 + step
+            with pytest.raises(RuntimeError):
+                cb.call(_fail)
+
+        # 1 failure in the current bucket + 2 in the previous one weighted 0.9
+        assert cb._state.failure_count == 2
+        assert cb.is_closed
+
+        now[0] = 1035.0
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+        assert cb._state.failure_count == 1
+
+    def test_recent_failures_in_previous_bucket_open(self, monkeypatch):
+        """Test failures straddling a bucket boundary still open the circuit."""
+        from lexecon.observability import circuit_breaker as cb_module
+
+        now = [1008.0]
+        monkeypatch.setattr(cb_module.time, "time", lambda: now[0])
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=3, failure_window=10))
+
+        for step in (0, 1, 2):
+            now[0] = 1008.0 + step
+            with pytest.raises(RuntimeError):
+                cb.call(_fail)
+
+        assert cb.is_open
+
+    def test_half_open_recovers(self):
+        """Test a half-open circuit closes after enough successes."""
+        cb = CircuitBreaker(
+            "svc",
+            CircuitBreakerConfig(failure_threshold=1, success_threshold=2, recovery_timeout=0),
+        )
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+
+        assert cb.call(lambda: 1) == 1
+        assert cb.is_half_open
+        assert cb.call(lambda: 2) == 2
+        assert cb.is_closed
+
+    def test_half_open_limits_requests(self):
+        """Test a half-open circuit admits at most half_open_max_requests calls."""
+        cb = CircuitBreaker(
+            "svc",
+            CircuitBreakerConfig(
+                failure_threshold=1,
+                success_threshold=2,
+                recovery_timeout=0,
+                half_open_max_requests=1,
+            ),
+        )
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+
+        assert cb.call(lambda: 1) == 1
+        assert cb.is_half_open
+        with pytest.raises(CircuitBreakerError):
+            cb.call(lambda: 2)
+
+    def test_protect_passes_arguments(self):
+        """Test decorated functions receive their arguments and fail the circuit."""
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=1))
+
+        @cb.protect
+        def divide(a, b=1):
+            return a / b
+
+        assert divide(6, b=3) == 2
+        with pytest.raises(ZeroDivisionError):
+            divide(1, b=0)
+        assert cb.is_open
+
+    def test_protect_with_fallback(self):
+        """Test the fallback is used once the circuit opens."""
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=1))
+
+        @cb.protect_with_fallback(lambda: "cached")
+        def fetch(key):
+            raise RuntimeError(key)
+
+        with pytest.raises(RuntimeError):
+            fetch("k")
+        assert fetch("k") == "cached"
+
+    def test_protect_async(self):
+        """Test async decorated functions receive their arguments."""
+        cb = CircuitBreaker("svc")
+
+        @cb.protect_async
+        async def add(a, b):
+            return a + b
+
+        assert asyncio.run(add(2, b=3)) == 5
+
+    def test_protect_async_with_fallback(self, monkeypatch):
+        """Test async fallbacks are inspected once, at decoration time."""
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=1))
+
+        async def cached():
+            return "cached"
+
+        @cb.protect_async_with_fallback(cached)
+        async def fetch(key):
+            raise RuntimeError(key)
+
+        inspect_calls = []
+        monkeypatch.setattr(
+            asyncio, "iscoroutinefunction", lambda f: inspect_calls.append(f) or True
+        )
+        with pytest.raises(RuntimeError):
+            asyncio.run(fetch("k"))
+
+        assert asyncio.run(fetch("k")) == "cached"
+        assert inspect_calls == []
+
+    def test_call_async_sync_fallback(self):
+        """Test ad-hoc async calls accept a sync fallback."""
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=1))
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+
+        async def work():
+            return "live"
+
+        assert asyncio.run(cb.call_async(work, fallback=lambda: "cached")) == "cached"
+
+    def test_call_async_closed_skips_fallback_inspection(self, monkeypatch):
+        """Test admitted async calls never inspect their fallback."""
+        cb = CircuitBreaker("svc")
+        inspect_calls = []
+        monkeypatch.setattr(
+            asyncio, "iscoroutinefunction", lambda f: inspect_calls.append(f) or True
+        )
+
+        async def work():
+            return "live"
+
+        assert asyncio.run(cb.call_async(work, fallback=lambda: "cached")) == "live"
+        assert inspect_calls == []
+
+    def test_exception_filters(self):
+        """Test excluded exceptions are ignored and triggers limit what counts."""
+        cb = CircuitBreaker(
+            "svc",
+            CircuitBreakerConfig(
+                trigger_exceptions=(OSError,),
+                exclude_exceptions=(FileNotFoundError,),
+            ),
+        )
+
+        assert cb._should_trigger(ConnectionError()) is True
+        assert cb._should_trigger(FileNotFoundError()) is False
+        assert cb._should_trigger(ValueError()) is False
+        assert CircuitBreaker("all")._should_trigger(ValueError()) is True
+
+    def test_disabled_metrics_not_recorded(self, monkeypatch):
+        """Test breakers created with metrics disabled never call the collector."""
+        from lexecon.observability import circuit_breaker as cb_module
+
+        collector = MagicMock(enabled=False)
+        monkeypatch.setattr(cb_module, "metrics", collector)
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=1))
+
+        cb.call(lambda: 1)
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+
+        assert cb.is_open
+        collector.record_circuit_request.assert_not_called()
+        collector.record_circuit_state_change.assert_not_called()
+
+    def test_enabled_metrics_recorded(self, monkeypatch):
+        """Test breakers record requests and transitions when metrics are enabled."""
+        from lexecon.observability import circuit_breaker as cb_module
+
+        collector = MagicMock(enabled=True)
+        monkeypatch.setattr(cb_module, "metrics", collector)
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=1))
+
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+
+        collector.record_circuit_request.assert_called_once_with("svc", "failure")
+        collector.record_circuit_state_change.assert_called_with(
+            "svc", CircuitState.CLOSED, CircuitState.OPEN
+        )
+
+    def test_transition_logged_lazily(self, caplog):
+        """Test transition messages are formatted from logging arguments."""
+        cb = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=1))
+
+        with caplog.at_level(logging.INFO, logger="lexecon.observability.circuit_breaker"):
+            with pytest.raises(RuntimeError):
+                cb.call(_fail)
+
+        (record,) = caplog.records
+        assert record.args == ("svc", "closed", "open")
+        assert record.getMessage() == "Circuit breaker [svc] transitioning from closed to open"
+
+
+class TestCircuitBreakerRegistry:
+    """Tests for CircuitBreakerRegistry lookups."""
+
+    def test_get_or_create_returns_same_breaker(self):
+        """Test repeated lookups return the registered breaker."""
+        registry = CircuitBreakerRegistry()
+
+        cb = registry.get_or_create("svc")
+
+        assert registry.get_or_create("svc") is cb
+        assert registry.get("svc") is cb
+        assert registry.get("missing") is None
+
+    def test_concurrent_creation_creates_one_breaker(self):
+        """Test racing first lookups register a single breaker."""
+        registry = CircuitBreakerRegistry()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(registry.get_or_create("svc"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(cb) for cb in results}) == 1
+
+    def test_open_status_skips_closed_breakers(self):
+        """Test only open breakers are reported, without building closed ones' status."""
+        registry = CircuitBreakerRegistry()
+        cb = registry.get_or_create("svc", CircuitBreakerConfig(failure_threshold=1))
+        closed = registry.get_or_create("other")
+        closed.get_status = MagicMock()
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+
+        status = registry.get_open_status()
+
+        assert list(status) == ["svc"]
+        assert status["svc"]["state"] == CircuitState.OPEN.value
+        closed.get_status.assert_not_called()
+
+    def test_status_and_reset_all(self):
+        """Test status covers every breaker and reset_all closes them."""
+        registry = CircuitBreakerRegistry()
+        cb = registry.get_or_create("svc", CircuitBreakerConfig(failure_threshold=1))
+        registry.get_or_create("other")
+        with pytest.raises(RuntimeError):
+            cb.call(_fail)
+
+        status = registry.get_all_status()
+        assert set(status) == {"svc", "other"}
+        assert status["svc"]["state"] == CircuitState.OPEN.value
+
+        registry.reset_all()
+        assert cb.is_closed
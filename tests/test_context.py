@@ -0,0 +1,200 @@
+"""Tests for observability context propagation."""
+
+import dataclasses
+import re
+import sys
+
+import pytest
+
+from lexecon.observability.context import (
+    ObservabilityContext,
+    SpanContext,
+    _generate_request_id,
+    _generate_span_id,
+    _generate_trace_id,
+    create_context,
+    get_current_context,
+    hash_high_cardinality,
+    observe,
+)
+
+
+class TestIdGeneration:
+    """Tests for trace, span and request ID generation."""
+
+    def test_id_formats(self):
+        """Test generated IDs have the W3C and request ID formats."""
+        assert re.fullmatch(r"[0-9a-f]{32}", _generate_trace_id())
+        assert re.fullmatch(r"[0-9a-f]{16}", _generate_span_id())
+        assert re.fullmatch(r"req_[0-9a-f]{24}", _generate_request_id())
+
+    def test_ids_unique(self):
+        """Test repeated generation does not repeat IDs."""
+        assert len({_generate_span_id() for _ in range(1000)}) == 1000
+
+
+class TestSpanContext:
+    """Tests for W3C Trace Context serialization."""
+
+    def test_traceparent_round_trip(self):
+        """Test a serialized traceparent parses back into a child span."""
+        ctx = SpanContext(trace_id="a" * 32, span_id="b" * 16, baggage={"tenant": "t1"})
+
+        parsed = SpanContext.from_traceparent(ctx.to_traceparent(), ctx.to_tracestate())
+
+        assert parsed.trace_id == ctx.trace_id
+        assert parsed.parent_span_id == ctx.span_id
+        assert parsed.is_sampled is True
+        assert parsed.baggage == {"tenant": "t1"}
+
+    def test_tracestate_entries(self):
+        """Test each baggage item becomes one lexecon= tracestate entry."""
+        one = SpanContext(trace_id="a" * 32, span_id="b" * 16, baggage={"k": "v"})
+        two = SpanContext(trace_id="a" * 32, span_id="b" * 16, baggage={"k": "v", "x": "y"})
+
+        assert one.to_tracestate() == "lexecon=k=v"
+        assert two.to_tracestate() == "lexecon=k=v,lexecon=x=y"
+
+    def test_headers_serialized_once(self):
+        """Test header values are fixed at construction and the context is frozen."""
+        ctx = SpanContext(trace_id="a" * 32, span_id="b" * 16, is_sampled=False)
+
+        assert ctx.to_traceparent() == f"00-{'a' * 32}-{'b' * 16}-00"
+        assert ctx.to_traceparent() is ctx.to_traceparent()
+        assert ctx.to_tracestate() == ""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ctx.span_id = "c" * 16
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_contexts_use_slots(self):
+        """Test per-request context objects carry no instance __dict__."""
+        span = SpanContext(trace_id="a" * 32, span_id="b" * 16)
+
+        assert not hasattr(span, "__dict__")
+        assert not hasattr(create_context("op"), "__dict__")
+
+    def test_traceparent_rejects_malformed(self):
+        """Test malformed traceparent headers are rejected."""
+        trace_id, span_id = "a" * 32, "b" * 16
+
+        assert SpanContext.from_traceparent(f"00-{trace_id}-{span_id}-00").is_sampled is False
+        for header in (
+            "",
+            f"01-{trace_id}-{span_id}-01",
+            f"00-{trace_id[:-1]}-{span_id}-01",
+            f"00-{trace_id}-{span_id}a-01",
+            f"00-{trace_id}-{span_id}-01-extra",
+            f"00-{trace_id}-{span_id}",
+        ):
+            assert SpanContext.from_traceparent(header) is None
+
+    def test_tracestate_ignores_foreign_entries(self):
+        """Test only lexecon= tracestate entries become baggage."""
+        header = f"00-{'a' * 32}-{'b' * 16}-01"
+
+        parsed = SpanContext.from_traceparent(header, "vendor=x,lexecon=k=v=w,lexecon=bad")
+
+        assert parsed.baggage == {"k": "v=w"}
+
+
+class TestCreateContext:
+    """Tests for context creation and nesting."""
+
+    def test_child_inherits_trace_and_request(self):
+        """Test nested contexts share the trace and request IDs."""
+        with observe("outer", request_id="req_1") as outer:
+            with observe("inner") as inner:
+                assert get_current_context() is inner
+                assert inner.trace_id == outer.trace_id
+                assert inner.span_context.parent_span_id == outer.span_id
+                assert inner.request_id == "req_1"
+            assert get_current_context() is outer
+        assert get_current_context() is None
+
+    def test_root_context_gets_request_id(self):
+        """Test a root context generates a request ID."""
+        ctx = create_context("op")
+
+        assert ctx.request_id.startswith("req_")
+        assert ctx.get_log_context()["operation"] == "op"
+
+    def test_unsampled_context_skips_ids(self):
+        """Test unsampled roots and their children generate no span or request IDs."""
+        root = create_context("op", is_sampled=False, user_id="u1")
+        child = create_context("child", parent_context=root)
+
+        for ctx in (root, child):
+            assert ctx.is_sampled is False
+            assert ctx.span_context is None
+            assert ctx.request_id is None
+            assert ctx.user_id == "u1"
+        assert child.get_log_context() == {"user_id": "u1", "operation": "child"}
+
+    def test_unsampled_traceparent_keeps_span(self):
+        """Test an incoming unsampled trace keeps its IDs for correlation."""
+        ctx = create_context("op", traceparent=f"00-{'a' * 32}-{'b' * 16}-00")
+
+        assert ctx.trace_id == "a" * 32
+        assert ctx.is_sampled is False
+
+    def test_empty_baggage_shared(self):
+        """Test spans without baggage share one read-only mapping."""
+        root = create_context("op")
+        child = create_context("child", parent_context=root)
+
+        assert child.span_context.baggage is root.span_context.baggage
+        with pytest.raises(TypeError):
+            child.span_context.baggage["k"] = "v"
+
+    def test_child_copies_parent_baggage(self):
+        """Test a child span gets its own copy of non-empty baggage."""
+        header = f"00-{'a' * 32}-{'b' * 16}-01"
+        span = SpanContext.from_traceparent(header, "lexecon=tenant=t1")
+        parent = ObservabilityContext(span_context=span)
+
+        child = create_context("child", parent_context=parent)
+
+        assert child.span_context.baggage == {"tenant": "t1"}
+        assert child.span_context.baggage is not parent.span_context.baggage
+
+    def test_log_context(self):
+        """Test log context combines correlation IDs with current attributes."""
+        ctx = create_context("op", request_id="req_1", user_id="u1", tenant="t1")
+        ctx.with_attribute("step", 2)
+
+        log_ctx = ctx.get_log_context()
+
+        assert log_ctx == {
+            "trace_id": ctx.trace_id,
+            "span_id": ctx.span_id,
+            "request_id": "req_1",
+            "user_id": "u1",
+            "operation": "op",
+            "tenant": "t1",
+            "step": 2,
+        }
+        assert dict(ctx.iter_log_items()) == log_ctx
+        log_ctx["extra"] = True
+        assert "extra" not in ctx.get_log_context()
+
+
+class TestHashHighCardinality:
+    """Tests for metric label hashing."""
+
+    def test_hash_is_short_stable_hex(self):
+        """Test labels are 8 stable hex characters with an optional prefix."""
+        h = hash_high_cardinality("user:123")
+
+        assert re.fullmatch(r"[0-9a-f]{8}", h)
+        assert hash_high_cardinality("user:123") == h
+        assert hash_high_cardinality("user:124") != h
+        assert hash_high_cardinality("user:123", prefix="actor_") == f"actor_{h}"
+
+    def test_hash_cached(self):
+        """Test repeated values are served from the cache."""
+        hash_high_cardinality.cache_clear()
+
+        hash_high_cardinality("10.0.0.1")
+        hash_high_cardinality("10.0.0.1")
+
+        assert hash_high_cardinality.cache_info().hits == 1
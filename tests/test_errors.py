@@ -0,0 +1,458 @@
+"""Tests for error correlation and telemetry."""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from lexecon.observability import errors as errors_module
+from lexecon.observability.context import observe
+from lexecon.observability.errors import (
+    ErrorCategory,
+    ErrorClassifier,
+    ErrorCorrelator,
+    ErrorRecord,
+    ErrorSeverity,
+    async_error_boundary,
+    error_boundary,
+)
+
+NS = 1_000_000_000
+
+
+@pytest.fixture
+def correlator():
+    """Create an isolated error correlator."""
+    return ErrorCorrelator(max_history=10, error_window_seconds=10)
+
+
+class TestErrorClassifier:
+    """Tests for ErrorClassifier.classify."""
+
+    @pytest.mark.parametrize(
+        "exception, category",
+        [
+            (ConnectionRefusedError(), ErrorCategory.DATABASE),
+            (TimeoutError(), ErrorCategory.TIMEOUT),
+            (FileNotFoundError(), ErrorCategory.NETWORK),
+            (PermissionError(), ErrorCategory.AUTHORIZATION),
+            (KeyError("k"), ErrorCategory.VALIDATION),
+            (RuntimeError("REDIS unavailable"), ErrorCategory.CACHE),
+            (RuntimeError("invalid connection string"), ErrorCategory.DATABASE),
+            (RuntimeError("something odd"), ErrorCategory.UNKNOWN),
+        ],
+    )
+    def test_classify(self, exception, category):
+        """Test the most specific type mapping wins, then the first listed pattern."""
+        assert ErrorClassifier().classify(exception) == (category, ErrorSeverity.ERROR)
+
+    def test_type_classification_cached(self):
+        """Test type lookups are cached while message patterns still apply."""
+        classifier = ErrorClassifier()
+
+        classifier.classify(ValueError("a"))
+        classifier.classify(RuntimeError("redis down"))
+
+        assert classifier._type_cache == {
+            ValueError: (ErrorCategory.VALIDATION, ErrorSeverity.ERROR),
+            RuntimeError: None,
+        }
+        assert classifier.classify(RuntimeError("sql error"))[0] is ErrorCategory.DATABASE
+
+    def test_register_mapping_clears_cache(self):
+        """Test registering a mapping takes effect for already-seen types."""
+        classifier = ErrorClassifier()
+        classifier.classify(ValueError("a"))
+
+        classifier.register_mapping(ValueError, ErrorCategory.BUSINESS_LOGIC)
+
+        assert classifier.classify(ValueError("a"))[0] is ErrorCategory.BUSINESS_LOGIC
+
+    def test_subclass_patterns(self):
+        """Test subclasses overriding PATTERN_MAPPINGS match their own patterns."""
+        class QueueClassifier(ErrorClassifier):
+            PATTERN_MAPPINGS = {"kafka": ErrorCategory.EXTERNAL_API}
+
+        assert QueueClassifier().classify(RuntimeError("Kafka lag")) == (
+            ErrorCategory.EXTERNAL_API,
+            ErrorSeverity.ERROR,
+        )
+        assert QueueClassifier().classify(RuntimeError("redis down"))[0] is ErrorCategory.UNKNOWN
+        assert ErrorClassifier().classify(RuntimeError("kafka lag"))[0] is ErrorCategory.UNKNOWN
+
+    def test_custom_mapping(self):
+        """Test registered mappings override the defaults."""
+        classifier = ErrorClassifier()
+        classifier.register_mapping(ValueError, ErrorCategory.BUSINESS_LOGIC, ErrorSeverity.WARNING)
+
+        assert classifier.classify(ValueError("invalid")) == (
+            ErrorCategory.BUSINESS_LOGIC,
+            ErrorSeverity.WARNING,
+        )
+
+
+class TestErrorRecord:
+    """Tests for ErrorRecord serialization."""
+
+    def test_to_dict(self):
+        """Test to_dict lists every field with enums and timestamp serialized."""
+        stamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        record = ErrorRecord(
+            error_id="err_1",
+            timestamp=stamp,
+            error_type="ValueError",
+            message="bad",
+            severity=ErrorSeverity.WARNING,
+            category=ErrorCategory.VALIDATION,
+            attributes={"field": "name"},
+        )
+
+        data = record.to_dict()
+
+        assert list(data) == [f.name for f in dataclasses.fields(ErrorRecord) if f.init]
+        assert data["timestamp"] == stamp.isoformat()
+        assert data["severity"] == "warning"
+        assert data["category"] == "validation"
+        assert data["attributes"] == {"field": "name"}
+        assert data["service_name"] == "lexecon"
+        json.dumps(data)
+        assert record.to_dict()["timestamp"] is data["timestamp"]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_record_uses_slots(self, correlator):
+        """Test error records carry no instance __dict__."""
+        assert not hasattr(correlator.record_error(ValueError("bad")), "__dict__")
+
+
+class TestErrorCorrelator:
+    """Tests for ErrorCorrelator recording and rates."""
+
+    def test_record_error_classifies(self, correlator):
+        """Test recorded errors are classified and kept in history."""
+        record = correlator.record_error(ValueError("bad input"), field="name")
+
+        assert record.category is ErrorCategory.VALIDATION
+        assert record.severity is ErrorSeverity.ERROR
+        assert record.attributes == {"field": "name"}
+        assert correlator.get_recent_errors() == [record]
+
+    def test_error_ids_unique(self, correlator):
+        """Test error IDs are unique err_-prefixed hex strings."""
+        ids = {correlator.record_error(ValueError("bad")).error_id for _ in range(10)}
+
+        assert len(ids) == 10
+        assert all(re.fullmatch(r"err_[0-9a-f]{16}", error_id) for error_id in ids)
+
+    def test_context_and_cause_recorded(self, correlator):
+        """Test records carry the active context and a chained cause."""
+        try:
+            try:
+                raise KeyError("k")
+            except KeyError as inner:
+                raise ValueError("bad") from inner
+        except ValueError as e:
+            with observe("lookup", user_id="u1") as ctx:
+                record = correlator.record_error(e)
+            bare = correlator.record_error(e)
+
+        assert record.trace_id == ctx.trace_id
+        assert record.span_id == ctx.span_id
+        assert record.user_id == "u1"
+        assert record.operation == "lookup"
+        assert record.cause == "KeyError: 'k'"
+        assert bare.trace_id is None and bare.operation is None
+
+    def test_repeated_names_interned(self, correlator):
+        """Test records share interned error type and operation strings."""
+        operation = "".join(["approve", "_loan"])
+        with observe(operation):
+            first = correlator.record_error(ValueError("a"))
+        with observe("".join(["approve", "_loan"])):
+            second = correlator.record_error(ValueError("b"))
+
+        assert first.operation is second.operation is sys.intern("approve_loan")
+        assert first.error_type is sys.intern("ValueError")
+
+    def test_stack_trace_formatted_for_raised_errors(self, correlator):
+        """Test warnings and above carry the recorded exception's traceback."""
+        try:
+            raise ValueError("bad input")
+        except ValueError as e:
+            record = correlator.record_error(e)
+            info = correlator.record_error(e, severity=ErrorSeverity.INFO)
+
+        assert "Traceback" in record.stack_trace
+        assert "ValueError: bad input" in record.stack_trace
+        assert info.stack_trace is None
+
+    def test_stack_trace_skipped_for_unraised_errors(self, correlator):
+        """Test exceptions that were never raised have no stack trace."""
+        try:
+            raise KeyError("handling")
+        except KeyError:
+            record = correlator.record_error(ValueError("bad input"))
+
+        assert record.stack_trace is None
+
+    def test_error_rate_window(self, correlator, monkeypatch):
+        """Test only errors inside the window count toward the rate."""
+        now = [1000 * NS]
+        monkeypatch.setattr(errors_module.time, "monotonic_ns", lambda: now[0])
+
+        for step in (0, 4, 8):
+            now[0] = (1000 + step) * NS
+            correlator.record_error(ValueError("bad"))
+        now[0] = 1012 * NS
+        correlator.record_error(TimeoutError("slow"))
+
+        assert correlator.get_error_rate(ErrorCategory.VALIDATION) == pytest.approx(0.3)
+        assert correlator.get_error_rate(ErrorCategory.TIMEOUT) == pytest.approx(0.1)
+        assert correlator.get_error_rate(ErrorCategory.CACHE) == 0.0
+        assert correlator.get_error_rate() == pytest.approx(0.4)
+
+        now[0] = 1015 * NS
+        correlator.record_error(ValueError("bad"))
+
+        assert correlator.get_error_rate(ErrorCategory.VALIDATION) == pytest.approx(0.2)
+        assert correlator.get_error_rate() == pytest.approx(0.3)
+
+    def test_concurrent_recording(self, correlator):
+        """Test errors recorded from many threads are all counted."""
+        barrier = threading.Barrier(8)
+
+        def worker(exc_type):
+            barrier.wait()
+            for _ in range(50):
+                correlator.record_error(exc_type("failed"))
+
+        threads = [
+            threading.Thread(target=worker, args=(exc_type,))
+            for exc_type in (ValueError, TimeoutError, PermissionError, RuntimeError) * 2
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert correlator.get_error_rate() == pytest.approx(400 / 10)
+        assert correlator.get_error_rate(ErrorCategory.TIMEOUT) == pytest.approx(100 / 10)
+
+    def test_error_logged_with_category_label(self, correlator, caplog):
+        """Test errors are logged at their severity with an upper-case category."""
+        with caplog.at_level(logging.DEBUG, logger="lexecon.observability.errors"):
+            correlator.record_error(TimeoutError("slow"), severity=ErrorSeverity.WARNING)
+
+        (log,) = caplog.records
+        assert log.levelno == logging.WARNING
+        assert log.getMessage() == "[TIMEOUT] TimeoutError: slow"
+        assert log.extra_fields["category"] == "timeout"
+
+    def test_recent_errors_filtered_and_limited(self, correlator):
+        """Test recent errors are the newest matches, oldest first."""
+        records = [
+            correlator.record_error(exc, severity=severity)
+            for exc, severity in [
+                (ValueError("v1"), ErrorSeverity.ERROR),
+                (TimeoutError("t1"), ErrorSeverity.ERROR),
+                (ValueError("v2"), ErrorSeverity.WARNING),
+                (ValueError("v3"), ErrorSeverity.ERROR),
+            ]
+        ]
+
+        assert correlator.get_recent_errors(limit=2) == records[2:]
+        assert correlator.get_recent_errors(category=ErrorCategory.VALIDATION) == [
+            records[0],
+            records[2],
+            records[3],
+        ]
+        assert correlator.get_recent_errors(
+            limit=1, category=ErrorCategory.VALIDATION, severity=ErrorSeverity.WARNING
+        ) == [records[2]]
+        assert correlator.get_recent_errors(limit=0) == []
+
+    def test_disabled_level_not_logged(self, correlator, caplog, monkeypatch):
+        """Test records below the logger's level skip building the log call."""
+        logged = []
+        monkeypatch.setattr(errors_module.logger, "log", lambda *a, **k: logged.append(a))
+
+        with caplog.at_level(logging.WARNING, logger="lexecon.observability.errors"):
+            correlator.record_error(ValueError("quiet"), severity=ErrorSeverity.INFO)
+            correlator.record_error(ValueError("loud"))
+
+        assert [args[0] for args in logged] == [logging.ERROR]
+
+    def test_history_keeps_newest(self, correlator):
+        """Test a full history overwrites the oldest records first."""
+        records = [correlator.record_error(ValueError(str(i))) for i in range(15)]
+
+        assert correlator.get_recent_errors() == records[5:]
+        assert correlator.get_recent_errors(limit=3) == records[12:]
+        assert correlator.get_error_summary()["total"] == 10
+
+    def test_history_disabled(self):
+        """Test max_history=0 keeps no records."""
+        correlator = ErrorCorrelator(max_history=0)
+
+        correlator.record_error(ValueError("bad"))
+
+        assert correlator.get_recent_errors() == []
+        assert correlator.get_error_summary()["total"] == 0
+
+    def test_error_summary(self, correlator):
+        """Test the summary counts history by category and severity."""
+        correlator.record_error(ValueError("bad"))
+        correlator.record_error(KeyError("k"), severity=ErrorSeverity.WARNING)
+
+        summary = correlator.get_error_summary()
+
+        assert summary["total"] == 2
+        assert summary["by_category"] == {"validation": 2}
+        assert summary["by_severity"] == {"error": 1, "warning": 1}
+
+
+class TestErrorCallbacks:
+    """Tests for error callback dispatch."""
+
+    def test_callbacks_run_on_background_thread(self, correlator):
+        """Test callbacks receive records off the recording thread."""
+        seen = []
+        correlator.register_callback(lambda r: seen.append((r, threading.get_ident())))
+
+        record = correlator.record_error(ValueError("bad"))
+
+        assert correlator.flush_callbacks(timeout=5)
+        assert seen == [(record, correlator._dispatcher.ident)]
+        assert correlator._dispatcher.ident != threading.get_ident()
+
+    def test_sync_callbacks_run_inline(self, correlator):
+        """Test sync=True runs callbacks before record_error returns."""
+        seen = []
+        correlator.register_callback(lambda r: seen.append(threading.get_ident()))
+
+        record = correlator.record_error(ValueError("bad"), sync=True)
+
+        assert seen == [threading.get_ident()]
+        assert "sync" not in record.attributes
+
+    def test_failing_callback_does_not_stop_others(self, correlator):
+        """Test a raising callback is logged and later callbacks still run."""
+        seen = []
+
+        def broken(record):
+            raise RuntimeError("callback bug")
+
+        correlator.register_callback(broken)
+        correlator.register_callback(seen.append)
+
+        correlator.record_error(ValueError("bad"))
+        correlator.record_error(ValueError("worse"), sync=True)
+
+        assert correlator.flush_callbacks(timeout=5)
+        assert sorted(r.message for r in seen) == ["bad", "worse"]
+
+    def test_full_queue_drops_and_counts(self, monkeypatch):
+        """Test records past the queue bound skip callbacks and are counted."""
+        monkeypatch.setattr(errors_module, "CALLBACK_QUEUE_SIZE", 1)
+        correlator = ErrorCorrelator(max_history=10)
+        seen = []
+        # Queue records before the dispatcher starts so none are consumed
+        correlator._callbacks.append(seen.append)
+
+        first = correlator.record_error(ValueError("queued"))
+        correlator.record_error(ValueError("dropped"))
+
+        assert correlator.dropped_callbacks == 1
+        assert correlator.get_error_summary()["dropped_callbacks"] == 1
+
+        correlator.register_callback(lambda r: None)
+        assert correlator.flush_callbacks(timeout=5)
+        assert seen == [first]
+
+    def test_no_thread_without_callbacks(self, correlator):
+        """Test correlators without callbacks start no dispatcher."""
+        correlator.record_error(ValueError("bad"))
+
+        assert correlator._dispatcher is None
+        assert correlator.flush_callbacks() is True
+
+
+class TestErrorBoundary:
+    """Tests for the error boundary decorators."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_correlator(self, correlator, monkeypatch):
+        monkeypatch.setattr(errors_module, "error_correlator", correlator)
+
+    def test_records_and_reraises(self, correlator):
+        """Test a boundary records the error with the function's name."""
+        @error_boundary(category=ErrorCategory.BUSINESS_LOGIC)
+        def approve(amount):
+            raise ValueError(amount)
+
+        with pytest.raises(ValueError):
+            approve(5)
+
+        (record,) = correlator.get_recent_errors()
+        assert record.category is ErrorCategory.BUSINESS_LOGIC
+        assert record.attributes == {"function": "approve", "module": __name__}
+        assert approve.__name__ == "approve"
+
+    def test_swallows_when_not_reraising(self, correlator):
+        """Test reraise=False records the error and returns None."""
+        @error_boundary(reraise=False)
+        def fail():
+            raise ValueError("bad")
+
+        assert fail() is None
+        assert len(correlator.get_recent_errors()) == 1
+
+    def test_nested_boundaries_record_once(self, correlator):
+        """Test an error crossing nested boundaries is recorded by the inner one only."""
+        @error_boundary()
+        def inner():
+            raise ValueError("bad")
+
+        @error_boundary(reraise=False)
+        def outer():
+            inner()
+
+        outer()
+        with pytest.raises(ValueError):
+            inner()
+
+        records = correlator.get_recent_errors()
+        assert [r.attributes["function"] for r in records] == ["inner", "inner"]
+
+    def test_error_handled_between_boundaries_recorded(self, correlator):
+        """Test an error caught before reaching the outer boundary is still recorded."""
+        @error_boundary()
+        def inner():
+            raise ValueError("bad")
+
+        @error_boundary()
+        def outer():
+            try:
+                inner()
+            except ValueError:
+                return "handled"
+
+        assert outer() == "handled"
+        (record,) = correlator.get_recent_errors()
+        assert record.attributes["function"] == "inner"
+
+    def test_async_boundary(self, correlator):
+        """Test the async boundary is a plain decorator factory."""
+        @async_error_boundary(reraise=False)
+        async def fetch():
+            raise TimeoutError("slow")
+
+        assert asyncio.run(fetch()) is None
+        (record,) = correlator.get_recent_errors()
+        assert record.category is ErrorCategory.TIMEOUT
+        assert record.attributes["function"] == "fetch"
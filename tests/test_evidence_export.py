@@ -0,0 +1,327 @@
+"""
+Tests for Evidence Export Service.
+
+Verifies the contents and packaging of compliance evidence bundles.
+"""
+
+import hashlib
+import io
+import json
+import sys
+import threading
+import zipfile
+import zlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from lexecon.evidence_export import service as evidence_export_module
+from lexecon.evidence_export.service import EvidenceBundle, EvidenceExportService
+from lexecon.ledger.chain import LedgerChain
+
+
+@pytest.fixture
+def decision_ledger():
+    """Create a ledger with a handful of decision events."""
+    ledger = LedgerChain()
+    for i, (decision, action, risk) in enumerate(
+        [
+            ("allow", "read", "low"),
+            ("allow", "read", "low"),
+            ("deny", "write", "high"),
+            ("escalate", "delete", "high"),
+        ]
+    ):
+        ledger.append(
+            "decision",
+            {
+                "request_id": f"req_{i}",
+                "decision": decision,
+                "action": action,
+                "actor": "model:test",
+                "risk_level": risk,
+                "policy_version_hash": f"{i % 2:x}" * 64,
+            },
+        )
+    return ledger
+
+
+def _open_bundle(zip_bytes):
+    return zipfile.ZipFile(io.BytesIO(zip_bytes))
+
+
+class TestEvidenceExportService:
+    """Tests for EvidenceExportService.export."""
+
+    def test_bundle_contains_expected_files(self, decision_ledger):
+        """Bundle includes every documented file."""
+        service = EvidenceExportService(decision_ledger)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            assert sorted(zf.namelist()) == [
+                "ledger_events.json",
+                "manifest.json",
+                "policies.json",
+                "summary.md",
+                "verification_report.json",
+            ]
+
+    def test_ledger_events_match_ledger(self, decision_ledger):
+        """ledger_events.json mirrors the ledger entries."""
+        service = EvidenceExportService(decision_ledger)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            events = json.loads(zf.read("ledger_events.json"))["events"]
+
+        assert len(events) == len(decision_ledger.entries)
+        assert [e["entry_hash"] for e in events] == [
+            e.entry_hash for e in decision_ledger.entries
+        ]
+
+    def test_all_files_deflated(self, decision_ledger):
+        """Every file in the bundle is deflated, including ledger events."""
+        service = EvidenceExportService(decision_ledger)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            infos = zf.infolist()
+
+        assert {info.compress_type for info in infos} == {zipfile.ZIP_DEFLATED}
+        ledger_info = next(i for i in infos if i.filename == "ledger_events.json")
+        assert ledger_info.compress_size < ledger_info.file_size
+
+    def test_repeated_fields_interned(self, decision_ledger):
+        """Repeated decision fields share a single string object."""
+        service = EvidenceExportService(decision_ledger)
+
+        entries, _ = service._filter_entries(None, None, limit=1000)
+
+        allows = [e["data"]["decision"] for e in entries if e["data"].get("decision") == "allow"]
+        assert len(allows) == 2
+        assert allows[0] is allows[1] is sys.intern("allow")
+        assert entries[1]["event_type"] is sys.intern("decision")
+
+    def test_unverified_export_visits_only_window(self, decision_ledger):
+        """Without verification only the most recent ``limit`` entries are read."""
+
+        class WindowOnlyEntries(list):
+            def __iter__(self):
+                raise AssertionError("walked the whole ledger")
+
+        decision_ledger.entries = WindowOnlyEntries(decision_ledger.entries)
+        service = EvidenceExportService(decision_ledger)
+
+        entries, report = service._filter_entries(None, None, limit=2)
+
+        assert [e["entry_id"] for e in entries] == ["entry_3", "entry_4"]
+        assert report == {}
+
+    def test_manifest_hashes_match_files(self, decision_ledger):
+        """Manifest records the SHA-256 of every other file in the bundle."""
+        service = EvidenceExportService(decision_ledger)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+            for f in manifest["bundle_files"]:
+                assert hashlib.sha256(zf.read(f["path"])).hexdigest() == f["sha256"]
+
+        assert manifest["signature"] is None
+        assert manifest["signing_key_id"] is None
+
+    def test_manifest_signed(self, decision_ledger):
+        """A signature service signs the bundle hash."""
+        signer = MagicMock()
+        signer.sign.return_value = "c2lnbmF0dXJl"
+        service = EvidenceExportService(decision_ledger, signature_service=signer)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+
+        signer.sign.assert_called_once_with(manifest["bundle_hash"])
+        assert manifest["signature"] == "c2lnbmF0dXJl"
+        assert manifest["signing_key_id"] == "lexecon_root_001"
+
+    def test_manifest_signing_failure_leaves_unsigned(self, decision_ledger):
+        """A failing signature service produces an unsigned manifest."""
+        signer = MagicMock()
+        signer.sign.side_effect = RuntimeError("no key")
+        service = EvidenceExportService(decision_ledger, signature_service=signer)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+
+        assert manifest["signature"] is None
+        assert manifest["signing_key_id"] is None
+
+    def test_exported_at_shared_across_files(self, decision_ledger):
+        """A caller-supplied export timestamp is used by every file."""
+        service = EvidenceExportService(decision_ledger)
+        stamp = "2026-01-01T00:00:00+00:00"
+
+        with _open_bundle(service.export(tenant_id="tenant_a", exported_at=stamp)) as zf:
+            for name in ("ledger_events.json", "verification_report.json", "manifest.json"):
+                assert json.loads(zf.read(name))["exported_at"] == stamp
+            assert f"**Exported:** {stamp}" in zf.read("summary.md").decode()
+
+    def test_zipfile_zlib_untouched(self, decision_ledger):
+        """Exporting leaves the global zipfile compressor as it found it."""
+        service = EvidenceExportService(decision_ledger)
+
+        service.export(tenant_id="tenant_a")
+
+        assert zipfile.zlib is zlib
+
+    def test_isal_bundle_readable_by_stdlib(self, decision_ledger):
+        """A bundle deflated through the ISA-L shim reads back with stdlib zlib."""
+        pytest.importorskip("isal")
+        assert evidence_export_module.ISAL_AVAILABLE
+        service = EvidenceExportService(decision_ledger)
+        compressors = []
+        real_compressobj = evidence_export_module.isal_zlib.compressobj
+
+        def spy(*args, **kwargs):
+            compressors.append(args[0])
+            return real_compressobj(*args, **kwargs)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(evidence_export_module.isal_zlib, "compressobj", spy)
+            zip_bytes = service.export(tenant_id="tenant_a")
+
+        assert compressors, "ISA-L compressor was not used"
+        assert zipfile.zlib is zlib
+        with _open_bundle(zip_bytes) as zf:
+            assert zf.testzip() is None
+            events = json.loads(zf.read("ledger_events.json"))["events"]
+        assert len(events) == len(decision_ledger.entries)
+
+    def test_isal_scoped_to_exporting_thread(self):
+        """Other threads keep stdlib zlib while an export holds the shim."""
+        pytest.importorskip("isal")
+        seen = []
+
+        with evidence_export_module._isal_deflate():
+            assert zipfile.zlib is evidence_export_module._isal_shim
+            worker = threading.Thread(
+                target=lambda: seen.append(type(zipfile.zlib.compressobj(6, zlib.DEFLATED, -15)))
+            )
+            worker.start()
+            worker.join()
+
+        assert seen == [type(zlib.compressobj())]
+        assert zipfile.zlib is zlib
+
+
+class TestEvidenceBundle:
+    """Tests for EvidenceBundle rendering."""
+
+    def test_summary_counts(self, decision_ledger):
+        """summary.md reports totals and outcome distribution."""
+        entries = [e.to_dict() for e in decision_ledger.entries]
+        bundle = EvidenceBundle(tenant_id="tenant_a", ledger_entries=entries)
+
+        summary = bundle._generate_summary_md()
+
+        assert "| Total Ledger Entries | 5 |" in summary
+        assert "| Decision Events | 4 |" in summary
+        assert "| ALLOW | 2 | 50.0% |" in summary
+        assert "| DENY | 1 | 25.0% |" in summary
+        assert "| read | 2 |" in summary
+        assert "| HIGH | 2 |" in summary
+
+    def test_summary_lists_policy_hash_prefixes(self, decision_ledger):
+        """summary.md lists each policy hash by its 16-character prefix."""
+        entries = [e.to_dict() for e in decision_ledger.entries]
+        bundle = EvidenceBundle(tenant_id="tenant_a", ledger_entries=entries)
+
+        summary = bundle._generate_summary_md()
+        policies = json.loads(bundle._generate_policies_json())["policy_versions"]
+
+        assert [p["policy_version_hash"] for p in policies] == ["0" * 64, "1" * 64]
+        assert f"- `{'0' * 16}...`\n" in summary
+        assert f"- `{'1' * 16}...`\n" in summary
+
+
+class TestEvidenceVerification:
+    """Tests for the chain verification fused into entry filtering."""
+
+    def test_verification_report_valid(self, decision_ledger):
+        """An untouched ledger verifies cleanly."""
+        service = EvidenceExportService(decision_ledger)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            report = json.loads(zf.read("verification_report.json"))
+            summary = zf.read("summary.md").decode()
+
+        assert report["verified"] is True
+        assert report["checked_count"] == len(decision_ledger.entries)
+        assert report["failed_count"] == 0
+        assert report["failures"] == []
+        assert "✅ VERIFIED" in summary
+
+    def test_verification_matches_verify_integrity(self, decision_ledger):
+        """The fused pass agrees with LedgerChain.verify_integrity."""
+        service = EvidenceExportService(decision_ledger)
+        expected = decision_ledger.verify_integrity()
+
+        _, report = service._filter_entries(None, None, limit=1000, verify=True)
+
+        assert report["valid"] == expected["valid"]
+        assert report["entries_checked"] == expected["entries_checked"]
+        assert report["entries_verified"] == expected["entries_verified"]
+
+    def test_verification_detects_tampering(self, decision_ledger):
+        """A modified entry is reported as a hash mismatch."""
+        decision_ledger.entries[2].data["decision"] = "deny"
+        service = EvidenceExportService(decision_ledger)
+
+        with _open_bundle(service.export(tenant_id="tenant_a")) as zf:
+            report = json.loads(zf.read("verification_report.json"))
+
+        assert report["verified"] is False
+        assert report["failed_count"] == 1
+        assert report["failures"] == [
+            {"entry_id": "entry_2", "error": "Hash mismatch at entry 2"}
+        ]
+
+    def test_verification_covers_entries_outside_window(self, decision_ledger):
+        """Tampering before the exported window still fails verification."""
+        decision_ledger.entries[1].data["decision"] = "deny"
+        service = EvidenceExportService(decision_ledger)
+
+        with _open_bundle(service.export(tenant_id="tenant_a", limit=2)) as zf:
+            report = json.loads(zf.read("verification_report.json"))
+            events = json.loads(zf.read("ledger_events.json"))["events"]
+
+        assert len(events) == 2
+        assert report["verified"] is False
+        assert report["checked_count"] == len(decision_ledger.entries)
+        assert report["failures"][0]["entry_id"] == "entry_1"
+
+    def test_verification_detects_chain_break(self, decision_ledger):
+        """A re-hashed entry with a wrong previous_hash is a chain break."""
+        decision_ledger.entries[3].previous_hash = "0" * 64
+        decision_ledger.entries[3].entry_hash = decision_ledger.entries[3].calculate_hash()
+        service = EvidenceExportService(decision_ledger)
+
+        _, report = service._filter_entries(None, None, limit=2, verify=True)
+
+        assert report["failures"][0] == {
+            "entry_id": "entry_3",
+            "error": "Chain break at entry 3",
+        }
+
+    def test_verification_skipped(self, decision_ledger):
+        """include_verification=False reports the check as skipped."""
+        decision_ledger.entries[2].data["decision"] = "deny"
+        service = EvidenceExportService(decision_ledger)
+
+        zip_bytes = service.export(tenant_id="tenant_a", include_verification=False)
+
+        with _open_bundle(zip_bytes) as zf:
+            report = json.loads(zf.read("verification_report.json"))
+            summary = zf.read("summary.md").decode()
+
+        assert report["verified"] is None
+        assert report["checked_count"] == 0
+        assert report["failed_count"] == 0
+        assert report["failures"] == []
+        assert "⏭️ SKIPPED" in summary
@@ -3,6 +3,7 @@ Tests for feature flag service.
 """
 
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,6 +19,7 @@ class TestFeatureFlagService:
         """Test initialization without LaunchDarkly SDK."""
         service = FeatureFlagService()
         assert service.client is None
+        assert service._use_ld is False
 
     def test_is_enabled_env_fallback_true(self, monkeypatch):
         """Test is_enabled with environment variable fallback (true)."""
@@ -84,12 +86,65 @@ class TestFeatureFlagService:
 
         for true_val in ["true", "True", "TRUE", "1", "yes", "YES", "on", "ON"]:
             monkeypatch.setenv("FEATURE_FLAG_TEST", true_val)
+            service.reload_env()
             assert service.is_enabled("test", default=False) is True
 
         for false_val in ["false", "False", "FALSE", "0", "no", "NO", "off", "OFF"]:
             monkeypatch.setenv("FEATURE_FLAG_TEST", false_val)
+            service.reload_env()
             assert service.is_enabled("test", default=True) is False
 
+    def test_env_lookup_cached(self, monkeypatch):
+        """Test env values are cached until reload_env is called."""
+        monkeypatch.setenv("FEATURE_FLAG_TEST", "true")
+        service = FeatureFlagService()
+        assert service.is_enabled("test") is True
+
+        monkeypatch.setenv("FEATURE_FLAG_TEST", "false")
+        assert service.is_enabled("test") is True
+
+        service.reload_env()
+        assert service.is_enabled("test") is False
+
+    def test_env_snapshot_ignores_other_variables(self, monkeypatch):
+        """Test only FEATURE_FLAG_* variables are kept in the snapshot."""
+        monkeypatch.setenv("FEATURE_FLAG_SNAPSHOT", "on")
+        monkeypatch.setenv("UNRELATED_SETTING", "1")
+        service = FeatureFlagService()
+
+        assert service._env_view["FEATURE_FLAG_SNAPSHOT"] == "on"
+        assert "UNRELATED_SETTING" not in service._env_view
+        assert service.is_enabled("snapshot") is True
+
+    def test_env_cache_respects_default(self, monkeypatch):
+        """Test a cached unset or invalid flag still returns each call's default."""
+        monkeypatch.setenv("FEATURE_FLAG_RATE_LIMIT", "invalid")
+        service = FeatureFlagService()
+
+        assert service.is_enabled("missing", default=True) is True
+        assert service.is_enabled("missing", default=False) is False
+        assert service.get_number("rate_limit", default=100) == 100
+        assert service.get_number("rate_limit", default=250) == 250
+
+    def test_env_cache_keyed_by_default_type(self, monkeypatch):
+        """Test the same flag read with a different default type is re-parsed."""
+        monkeypatch.setenv("FEATURE_FLAG_LIMIT", "5")
+        service = FeatureFlagService()
+
+        assert service.get_string("limit", default="") == "5"
+        assert service.get_number("limit", default=0) == 5
+
+    def test_is_enabled_many(self, monkeypatch):
+        """Test evaluating several flags at once matches is_enabled."""
+        monkeypatch.setenv("FEATURE_FLAG_ALPHA", "true")
+        monkeypatch.setenv("FEATURE_FLAG_BETA", "off")
+        service = FeatureFlagService()
+
+        result = service.is_enabled_many(["alpha", "beta", "gamma"], default=True)
+
+        assert result == {"alpha": True, "beta": False, "gamma": True}
+        assert result == {k: service.is_enabled(k, default=True) for k in result}
+
     def test_launchdarkly_integration(self, monkeypatch):
         """Test LaunchDarkly integration when SDK is available."""
         monkeypatch.setenv("LAUNCHDARKLY_SDK_KEY", "sdk-test-key")
@@ -108,6 +163,7 @@ class TestFeatureFlagService:
 
             # Even without SDK, environment variable fallback should work
             monkeypatch.setenv("FEATURE_FLAG_TEST_FLAG", "true")
+            service.reload_env()
             result = service.is_enabled("test_flag", user_id="user:123")
             assert result is True
 
@@ -124,6 +180,230 @@ class TestFeatureFlagService:
         assert instance1 is instance2
 
 
+class TestFeatureFlagSingleton:
+    """Test concurrent creation of the global feature flag service."""
+
+    def test_concurrent_first_call_creates_one_instance(self, monkeypatch):
+        """Test racing first calls construct the service only once."""
+        from lexecon.features import service as service_module
+
+        monkeypatch.setattr(service_module, "_feature_flags", None)
+        created = []
+        original_init = service_module.FeatureFlagService.__init__
+
+        def counting_init(self, *args, **kwargs):
+            created.append(self)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(service_module.FeatureFlagService, "__init__", counting_init)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_feature_flags()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(created) == 1
+        assert all(r is created[0] for r in results)
+
+
+class TestLaunchDarklyEvaluation:
+    """Test LaunchDarkly evaluation path with a mocked client."""
+
+    @pytest.fixture
+    def ld_service(self):
+        """Service wired to a mock LaunchDarkly client."""
+        pytest.importorskip("ldclient")
+        service = FeatureFlagService()
+        service.client = MagicMock()
+        service.client.variation.return_value = True
+        service._use_ld = True
+        return service
+
+    def test_repeated_evaluation_cached(self, ld_service):
+        """Test identical evaluations hit the client once."""
+        assert ld_service.is_enabled("flag", user_id="user:1") is True
+        assert ld_service.is_enabled("flag", user_id="user:1") is True
+
+        assert ld_service.client.variation.call_count == 1
+
+    def test_cache_key_includes_user_and_attributes(self, ld_service):
+        """Test different users, attributes or default types are evaluated separately."""
+        ld_service.is_enabled("flag", user_id="user:1")
+        ld_service.is_enabled("flag", user_id="user:2")
+        ld_service.is_enabled("flag", user_id="user:1", user_attributes={"role": "admin"})
+        ld_service.get_string("flag", user_id="user:1")
+
+        assert ld_service.client.variation.call_count == 4
+
+    def test_context_reused_per_user(self, ld_service):
+        """Test the LaunchDarkly context is built once per user and attributes."""
+        ld_service.is_enabled("flag_a", user_id="user:1", user_attributes={"role": "admin"})
+        ld_service.is_enabled("flag_b", user_id="user:1", user_attributes={"role": "admin"})
+        ld_service.is_enabled("flag_a", user_id="user:2")
+
+        contexts = [c.args[1] for c in ld_service.client.variation.call_args_list]
+        assert contexts[0] is contexts[1]
+        assert contexts[0].key == "user:1"
+        assert contexts[0].get("role") == "admin"
+        assert contexts[2].key == "user:2"
+
+    def test_clear_evaluation_cache(self, ld_service):
+        """Test clearing the cache forces a fresh evaluation."""
+        ld_service.is_enabled("flag")
+        ld_service.clear_evaluation_cache()
+        ld_service.is_enabled("flag")
+
+        assert ld_service.client.variation.call_count == 2
+
+    def test_is_enabled_many_uses_client(self, ld_service):
+        """Test batched evaluation goes through the cached client path."""
+        result = ld_service.is_enabled_many(["a", "b"], user_id="user:1")
+        ld_service.is_enabled_many(["a", "b"], user_id="user:1")
+
+        assert result == {"a": True, "b": True}
+        assert ld_service.client.variation.call_count == 2
+
+    def test_client_error_falls_back_to_env(self, ld_service, monkeypatch):
+        """Test evaluation errors fall back to environment variables."""
+        from ldclient.impl.evaluator_common import EvaluationException
+
+        monkeypatch.setenv("FEATURE_FLAG_FLAG", "true")
+        ld_service.reload_env()
+        ld_service.client.variation.side_effect = EvaluationException("boom")
+
+        assert ld_service.is_enabled("flag", default=False) is True
+
+    def test_unexpected_error_propagates(self, ld_service):
+        """Test errors other than SDK evaluation errors are not masked."""
+        ld_service.client.variation.side_effect = RuntimeError("bug")
+
+        with pytest.raises(RuntimeError):
+            ld_service.is_enabled("flag")
+
+
+@pytest.fixture
+def fake_ld(monkeypatch):
+    """Patch the LaunchDarkly SDK so get() blocks until released."""
+    pytest.importorskip("ldclient")
+    from lexecon.features import service as service_module
+
+    release = threading.Event()
+    client = MagicMock()
+    client.is_initialized.return_value = True
+    client.variation.return_value = False
+    sdk = MagicMock()
+    sdk.get.side_effect = lambda: release.wait(5) and client
+
+    monkeypatch.setattr(service_module, "FEATURE_FLAGS_ENV_MODE", False)
+    monkeypatch.setattr(service_module, "ldclient", sdk)
+    monkeypatch.setattr(service_module, "Config", MagicMock())
+    return release, client
+
+
+class TestBackgroundInitialization:
+    """Test LaunchDarkly is initialized off the constructing thread."""
+
+    def test_env_fallback_until_initialized(self, fake_ld, monkeypatch):
+        """Test flags come from env while the SDK connects, then from LaunchDarkly."""
+        release, client = fake_ld
+        monkeypatch.setenv("FEATURE_FLAG_BACKGROUND", "true")
+        service = FeatureFlagService(sdk_key="sdk-test-key")
+
+        assert service.is_enabled("background") is True
+        assert service.client is None
+
+        release.set()
+        assert service.wait_for_initialization(timeout=5) is True
+        assert service.client is client
+        assert service.is_enabled("background") is False
+
+    def test_failed_initialization_keeps_env_fallback(self, fake_ld):
+        """Test an uninitialized client leaves the service on env fallback."""
+        release, client = fake_ld
+        client.is_initialized.return_value = False
+        release.set()
+        service = FeatureFlagService(sdk_key="sdk-test-key")
+
+        assert service.wait_for_initialization(timeout=5) is False
+        assert service.client is None
+
+
+class TestFlagDiskCache:
+    """Test last-known LaunchDarkly values persisted for cold starts."""
+
+    def test_values_survive_restart(self, tmp_path):
+        """Test values written by one cache are loaded by the next."""
+        from lexecon.features.service import _MISS, _FlagDiskCache
+
+        path = str(tmp_path / "cache" / "flags.sqlite")
+        cache = _FlagDiskCache(path, flush_interval=60)
+        cache.set("flag", "user:1", {"limit": 5})
+        cache.close()
+
+        reopened = _FlagDiskCache(path, flush_interval=60)
+        assert reopened.get("flag", "user:1") == {"limit": 5}
+        assert reopened.get("flag", "user:2") is _MISS
+        reopened.close()
+
+    def test_served_until_client_ready(self, fake_ld, monkeypatch, tmp_path):
+        """Test a cold start serves cached values, then records live ones."""
+        release, client = fake_ld
+        monkeypatch.setenv("FEATURE_FLAG_DISK_CACHE", str(tmp_path / "flags.sqlite"))
+        monkeypatch.setenv("FEATURE_FLAG_CACHED", "false")
+
+        warm = FeatureFlagService(sdk_key="sdk-test-key")
+        release.set()
+        client.variation.return_value = True
+        assert warm.wait_for_initialization(timeout=5) is True
+        assert warm.is_enabled_many(["cached"], user_id="user:1") == {"cached": True}
+        warm.close()
+
+        release.clear()
+        cold = FeatureFlagService(sdk_key="sdk-test-key")
+        assert cold.client is None
+        assert cold.is_enabled("cached", user_id="user:1") is True
+        assert cold.is_enabled("cached", user_id="user:2") is False
+        release.set()
+        cold.close()
+
+
+class TestTTLCache:
+    """Test the evaluation cache used in front of LaunchDarkly."""
+
+    def test_entries_expire(self, monkeypatch):
+        """Test entries are dropped once their TTL elapses."""
+        from lexecon.features import service as service_module
+
+        now = [100.0]
+        monkeypatch.setattr(service_module.time, "monotonic", lambda: now[0])
+        cache = service_module._TTLCache(max_size=10, ttl_seconds=3)
+
+        cache.set("key", False)
+        assert cache.get("key") is False
+
+        now[0] += 3
+        assert cache.get("key") is service_module._MISS
+
+    def test_least_recently_used_evicted(self):
+        """Test the least recently used entry is evicted at capacity."""
+        from lexecon.features import service as service_module
+
+        cache = service_module._TTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is service_module._MISS
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+
 class TestFeatureFlags:
     """Test feature flag enum and defaults."""
 
@@ -133,11 +413,38 @@ class TestFeatureFlags:
         assert FeatureFlag.MFA_REQUIRED == "mfa_required"
         assert FeatureFlag.RATE_LIMITING_STRICT == "rate_limiting_strict"
 
+    def test_flag_key_constants(self):
+        """Test module-level flag keys match the enum values."""
+        from lexecon.features import flags as flags_module
+
+        for flag in FeatureFlag:
+            key = getattr(flags_module, flag.name)
+            assert type(key) is str
+            assert key == flag.value
+
+    def test_flag_key_constant_evaluation(self, monkeypatch):
+        """Test plain string keys evaluate the same flag as the enum."""
+        from lexecon.features.flags import NEW_DECISION_ENGINE
+
+        monkeypatch.setenv("FEATURE_FLAG_NEW_DECISION_ENGINE", "true")
+        service = FeatureFlagService()
+
+        assert service.is_enabled(NEW_DECISION_ENGINE) is True
+        assert service.is_enabled(FeatureFlag.NEW_DECISION_ENGINE) is True
+
     def test_default_flags_exist(self):
         """Test all flags have default values."""
         for flag in FeatureFlag:
             assert flag in DEFAULT_FLAGS, f"Missing default for {flag}"
 
+    def test_default_flags_keyed_by_value(self):
+        """Test defaults are keyed by plain flag key strings and read-only."""
+        assert all(type(key) is str for key in DEFAULT_FLAGS)
+        assert DEFAULT_FLAGS["mfa_required"] is DEFAULT_FLAGS[FeatureFlag.MFA_REQUIRED]
+
+        with pytest.raises(TypeError):
+            DEFAULT_FLAGS["mfa_required"] = True
+
     def test_default_flag_types(self):
         """Test default flag value types are correct."""
         assert isinstance(DEFAULT_FLAGS[FeatureFlag.MFA_REQUIRED], bool)
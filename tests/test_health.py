@@ -1,5 +1,6 @@
 """Tests for health check and observability functionality."""
 
+import threading
 import time
 
 from lexecon.observability.health import (
@@ -381,6 +382,127 @@ class TestHealthCheckEdgeCases:
         assert result["status"] == HealthStatus.HEALTHY
         assert duration >= 0.2
 
+    def test_checks_run_concurrently(self):
+        """Test readiness latency is the slowest check, not the sum."""
+        hc = HealthCheck()
+        hc.checks = {}
+
+        def slow_check():
+            time.sleep(0.2)
+            return HealthStatus.HEALTHY, {}
+
+        for i in range(4):
+            hc.add_check(f"slow{i}", slow_check)
+
+        start = time.time()
+        result = hc.readiness()
+        duration = time.time() - start
+
+        assert result["status"] == HealthStatus.HEALTHY
+        assert [c["name"] for c in result["checks"]] == ["slow0", "slow1", "slow2", "slow3"]
+        assert duration < 0.6
+
+    def test_check_timeout_is_unhealthy(self, monkeypatch):
+        """Test a check that outlives the timeout is reported unhealthy."""
+        from lexecon.observability import health as health_module
+
+        monkeypatch.setattr(health_module, "READINESS_CHECK_TIMEOUT", 0.05)
+        hc = HealthCheck()
+        hc.checks = {}
+        release = threading.Event()
+
+        hc.add_check("hung", lambda: release.wait(5) and (HealthStatus.HEALTHY, {}))
+        hc.add_check("fast", lambda: (HealthStatus.HEALTHY, {}))
+
+        try:
+            result = hc.readiness()
+        finally:
+            release.set()
+
+        assert result["status"] == HealthStatus.UNHEALTHY
+        assert result["checks"][0] == {
+            "name": "hung",
+            "status": HealthStatus.UNHEALTHY,
+            "details": {"error": "timeout"},
+        }
+        assert result["checks"][1]["status"] == HealthStatus.HEALTHY
+
+    def test_hung_check_runs_once_on_daemon_thread(self, monkeypatch):
+        """Test a hung check cannot block exit and is not restarted by later probes."""
+        from lexecon.observability import health as health_module
+
+        monkeypatch.setattr(health_module, "READINESS_CHECK_TIMEOUT", 0.05)
+        monkeypatch.setattr(health_module, "READINESS_CACHE_TTL", 0)
+        hc = HealthCheck()
+        hc.checks = {}
+        release = threading.Event()
+        threads = []
+
+        def hung():
+            threads.append(threading.current_thread())
+            release.wait(5)
+            return HealthStatus.HEALTHY, {}
+
+        hc.add_check("hung", hung)
+        try:
+            first = hc.readiness()
+            second = hc.readiness()
+        finally:
+            release.set()
+
+        assert first["status"] == second["status"] == HealthStatus.UNHEALTHY
+        assert len(threads) == 1
+        assert threads[0].daemon
+
+    def test_readiness_cached_briefly(self, monkeypatch):
+        """Test readiness reuses a fresh result and reruns once it expires."""
+        from lexecon.observability import health as health_module
+
+        hc = HealthCheck()
+        hc.checks = {}
+        calls = []
+        hc.add_check("counted", lambda: calls.append(1) or (HealthStatus.HEALTHY, {}))
+
+        first = hc.readiness()
+        assert hc.readiness() is first
+        assert len(calls) == 1
+
+        monkeypatch.setattr(health_module, "READINESS_CACHE_TTL", 0)
+        assert hc.readiness() is not first
+        assert len(calls) == 2
+
+    def test_add_check_invalidates_cache(self):
+        """Test a newly added check is included in the next readiness result."""
+        hc = HealthCheck()
+        hc.checks = {}
+        hc.readiness()
+
+        hc.add_check("new", lambda: (HealthStatus.DEGRADED, {}))
+
+        assert hc.readiness()["status"] == HealthStatus.DEGRADED
+
+    def test_concurrent_probes_share_one_run(self):
+        """Test probes racing on a cache miss run the checks once."""
+        hc = HealthCheck()
+        hc.checks = {}
+        calls = []
+
+        def slow_check():
+            calls.append(1)
+            time.sleep(0.1)
+            return HealthStatus.HEALTHY, {}
+
+        hc.add_check("slow", slow_check)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(hc.readiness())) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
     def test_many_checks(self):
         """Test with many health checks."""
         hc = HealthCheck()
@@ -0,0 +1,384 @@
+"""Tests for dependency-aware health checks."""
+
+import asyncio
+import sys
+import threading
+import time
+import warnings
+
+import pytest
+
+from lexecon.observability import health_v2 as health_module
+from lexecon.observability.health_v2 import (
+    DependencyHealth,
+    HealthCheckManager,
+    HealthCheckResult,
+    HealthStatus,
+)
+
+
+@pytest.fixture
+def manager():
+    """Create a health check manager with no registered checks."""
+    return HealthCheckManager(service_name="test", cache_ttl_seconds=60)
+
+
+def _counting_check(calls, delay=0.0):
+    def check():
+        calls.append(1)
+        time.sleep(delay)
+        return HealthStatus.HEALTHY, {}
+
+    return check
+
+
+class TestReadiness:
+    """Tests for readiness aggregation and caching."""
+
+    def test_aggregates_worst_status(self, manager):
+        """Test readiness reports the worst check and dependency status."""
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+        manager.add_check("slow", lambda: (HealthStatus.DEGRADED, {"p99_ms": 900}))
+
+        result = manager.readiness()
+
+        assert result["status"] == "degraded"
+        assert [c["name"] for c in result["checks"]] == ["ok", "slow"]
+        assert list(result) == [
+            "status", "service", "version", "environment", "checks", "timestamp"
+        ]
+
+    def test_failing_dependency_unhealthy(self, manager):
+        """Test a dependency failing three times in a row makes readiness unhealthy."""
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+        for _ in range(3):
+            manager.update_dependency_health("db", healthy=False, error_message="down")
+
+        result = manager.readiness()
+        assert result["status"] == "unhealthy"
+        dependency = result["checks"][1]
+        assert dependency["name"] == "dependency:db"
+        assert isinstance(manager._dependencies["db"].last_check, float)
+        assert dependency["timestamp"].endswith("+00:00")
+
+    def test_open_circuit_does_not_mask_unhealthy(self, manager, monkeypatch):
+        """Test an open circuit breaker cannot lower an unhealthy status to degraded."""
+        monkeypatch.setattr(
+            health_module.circuit_breakers,
+            "get_open_status",
+            lambda: {"payments": {"state": "open"}},
+        )
+        manager.add_check("down", lambda: (HealthStatus.UNHEALTHY, {}))
+        manager.add_check("unknown", lambda: (HealthStatus.UNKNOWN, {}))
+
+        result = manager.readiness()
+
+        assert result["status"] == "unhealthy"
+        assert result["checks"][-1]["name"] == "circuit_breaker:payments"
+
+    def test_unknown_check_does_not_change_status(self, manager):
+        """Test a check reporting unknown leaves an otherwise healthy service healthy."""
+        manager.add_check("unknown", lambda: (HealthStatus.UNKNOWN, {}))
+
+        assert manager.readiness()["status"] == "healthy"
+
+    def test_result_cached_within_ttl(self, manager):
+        """Test sync and async readiness share one cached result."""
+        calls = []
+        manager.add_check("counted", _counting_check(calls))
+
+        first = manager.readiness()
+
+        assert manager.readiness() is first
+        assert asyncio.run(manager.readiness_async()) is first
+        assert len(calls) == 1
+
+    def test_concurrent_sync_probes_share_one_run(self, manager):
+        """Test probes racing on a cache miss run the checks once."""
+        calls = []
+        manager.add_check("slow", _counting_check(calls, delay=0.1))
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(manager.readiness()))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_concurrent_async_probes_share_one_run(self, manager):
+        """Test concurrent async probes on a cache miss run the checks once."""
+        calls = []
+
+        async def slow_check():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return HealthStatus.HEALTHY, {}
+
+        manager.add_check("slow", slow_check)
+
+        async def probe_storm():
+            return await asyncio.gather(*(manager.readiness_async() for _ in range(5)))
+
+        results = asyncio.run(probe_storm())
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_sync_readiness_runs_async_checks(self):
+        """Test sync readiness outside an event loop awaits async checks."""
+        manager = HealthCheckManager(cache_ttl_seconds=0)
+
+        async def ping():
+            return HealthStatus.DEGRADED, {"pong": True}
+
+        manager.add_check("ping", ping)
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+
+        result = manager.readiness()
+
+        assert result["status"] == "degraded"
+        assert result["checks"][0]["details"] == {"pong": True}
+
+    def test_sync_readiness_inside_loop_reports_async_checks(self):
+        """Test sync readiness inside a running loop flags async checks without hanging."""
+        manager = HealthCheckManager(cache_ttl_seconds=0)
+
+        async def ping():
+            return HealthStatus.HEALTHY, {}
+
+        manager.add_check("ping", ping)
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+
+        async def probe():
+            return manager.readiness()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = asyncio.run(probe())
+
+        ping_result, ok_result = result["checks"]
+        assert ping_result["status"] == "unhealthy"
+        assert "readiness_async" in ping_result["message"]
+        assert ok_result["status"] == "healthy"
+
+    def test_checks_classified_at_registration(self, monkeypatch):
+        """Test readiness does not inspect check functions on each run."""
+        manager = HealthCheckManager(cache_ttl_seconds=0)
+
+        async def ping():
+            return HealthStatus.HEALTHY, {}
+
+        manager.add_check("ping", ping)
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+        inspect_calls = []
+        monkeypatch.setattr(
+            asyncio, "iscoroutinefunction", lambda f: inspect_calls.append(f) or False
+        )
+
+        manager.readiness()
+        asyncio.run(manager.readiness_async())
+
+        assert inspect_calls == []
+
+    def test_async_readiness_across_event_loops(self):
+        """Test async readiness works from successive event loops."""
+        manager = HealthCheckManager(cache_ttl_seconds=0)
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+
+        for _ in range(2):
+            assert asyncio.run(manager.readiness_async())["status"] == "healthy"
+
+    def test_hung_check_times_out(self):
+        """Test a check exceeding its budget is reported unhealthy without blocking others."""
+        manager = HealthCheckManager(cache_ttl_seconds=0, per_check_timeout_seconds=0.05)
+
+        async def hung():
+            await asyncio.sleep(10)
+
+        manager.add_check("hung", hung)
+        manager.add_check("blocking", lambda: time.sleep(0.5))
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+
+        async def probe():
+            start = time.monotonic()
+            result = await manager.readiness_async()
+            return result, time.monotonic() - start
+
+        result, elapsed = asyncio.run(probe())
+
+        assert elapsed < 0.4
+        hung_result, blocking_result, ok_result = result["checks"]
+        assert hung_result["status"] == "unhealthy"
+        assert hung_result["message"] == "timeout"
+        assert blocking_result["message"] == "timeout"
+        assert ok_result["status"] == "healthy"
+        assert result["status"] == "unhealthy"
+
+    def test_overall_budget_bounds_readiness(self):
+        """Test checks still running at the overall deadline are reported as timed out."""
+        manager = HealthCheckManager(
+            cache_ttl_seconds=0, per_check_timeout_seconds=10, overall_timeout_seconds=0.05
+        )
+
+        async def slow():
+            await asyncio.sleep(10)
+            return HealthStatus.HEALTHY, {}
+
+        async def fast():
+            return HealthStatus.HEALTHY, {}
+
+        manager.add_check("slow", slow)
+        manager.add_check("fast", fast)
+
+        result = asyncio.run(manager.readiness_async())
+
+        slow_result, fast_result = result["checks"]
+        assert slow_result["name"] == "slow"
+        assert slow_result["message"] == "timeout"
+        assert fast_result["status"] == "healthy"
+
+
+class TestLiveness:
+    """Tests for the liveness probe."""
+
+    def test_liveness_skips_checks(self, manager):
+        """Test liveness reports identity and uptime without running checks."""
+        calls = []
+        manager.add_check("counted", _counting_check(calls))
+
+        result = manager.liveness()
+
+        assert calls == []
+        assert list(result) == ["status", "service", "version", "uptime_seconds", "timestamp"]
+        assert result["status"] == "healthy"
+        assert result["service"] == "test"
+
+    def test_timestamp_formatted_once_per_second(self, manager, monkeypatch):
+        """Test probes within one second share a single formatted timestamp."""
+        now = [1_700_000_000.25]
+        monkeypatch.setattr(health_module.time, "time", lambda: now[0])
+
+        first = manager.liveness()["timestamp"]
+        now[0] += 0.5
+        second = manager.liveness()["timestamp"]
+        now[0] += 0.5
+
+        assert first == "2023-11-14T22:13:20+00:00"
+        assert second is first
+        assert manager.liveness()["timestamp"] == "2023-11-14T22:13:21+00:00"
+
+    def test_service_info_updates_probes(self, manager):
+        """Test set_service_info is reflected in liveness and readiness."""
+        manager.readiness()
+
+        manager.set_service_info("gateway", "2.0.0", "production")
+
+        assert manager.liveness()["service"] == "gateway"
+        assert manager.liveness()["version"] == "2.0.0"
+        assert manager.readiness()["environment"] == "production"
+
+
+class TestResults:
+    """Tests for health result records."""
+
+    def test_latency_uses_monotonic_clock(self, monkeypatch):
+        """Test check latency comes from perf_counter, unaffected by wall-clock jumps."""
+        manager = HealthCheckManager(cache_ttl_seconds=0)
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {}))
+        ticks = iter([10.0, 10.25])
+        monkeypatch.setattr(health_module.time, "perf_counter", lambda: next(ticks))
+
+        result = manager._run_check("ok", *manager._checks["ok"])
+
+        assert result.latency_ms == 250.0
+
+    def test_readiness_entries_match_to_dict(self, manager):
+        """Test inlined readiness entries match HealthCheckResult.to_dict()."""
+        manager.add_check("ok", lambda: (HealthStatus.HEALTHY, {"pool": 4}))
+        result = manager._run_check("ok", *manager._checks["ok"])
+
+        (entry,) = manager.readiness()["checks"]
+
+        assert entry.keys() == result.to_dict().keys()
+        assert entry["details"] == {"pool": 4}
+
+    def test_statuses_are_plain_strings(self, manager):
+        """Test responses carry plain status strings rather than enum members."""
+        manager.add_check("slow", lambda: (HealthStatus.DEGRADED, {}))
+        manager.update_dependency_health("db", healthy=True)
+        manager.mark_initialized()
+
+        result = manager.readiness()
+        statuses = [result["status"], manager.startup()["status"]]
+        statuses += [check["status"] for check in result["checks"]]
+
+        assert statuses == ["degraded", "healthy", "degraded", "healthy"]
+        assert all(type(status) is str for status in statuses)
+
+    def test_history_keeps_recent_results(self):
+        """Test each check keeps only its most recent results, oldest first."""
+        manager = HealthCheckManager(cache_ttl_seconds=0, history_size=2)
+        statuses = iter([HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.UNHEALTHY])
+        manager.add_check("flaky", lambda: (next(statuses), {}))
+
+        for _ in range(3):
+            manager.readiness()
+
+        history = manager.get_history("flaky")
+        assert [r.status for r in history] == [HealthStatus.DEGRADED, HealthStatus.UNHEALTHY]
+        assert manager.get_history("missing") == []
+
+    def test_history_records_timeouts(self):
+        """Test checks cut off by the overall budget still enter the history."""
+        manager = HealthCheckManager(cache_ttl_seconds=0, overall_timeout_seconds=0.05)
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        manager.add_check("slow", slow)
+
+        asyncio.run(manager.readiness_async())
+
+        (result,) = manager.get_history("slow")
+        assert result.message == "timeout"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_records_use_slots(self):
+        """Test per-check records carry no instance __dict__."""
+        result = HealthCheckResult(name="ok", status=HealthStatus.HEALTHY)
+        dep = DependencyHealth(name="db", healthy=True, response_time_ms=0.0, last_check=0.0)
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(dep, "__dict__")
+
+
+class TestDefaultChecks:
+    """Tests for the built-in health checks."""
+
+    def test_database_check_reuses_connection(self, monkeypatch):
+        """Test the database check opens one connection per process."""
+        monkeypatch.setattr(health_module, "_health_db", None)
+
+        assert health_module.check_database()[0] == HealthStatus.HEALTHY
+        first = health_module._health_db
+        assert health_module.check_database()[0] == HealthStatus.HEALTHY
+
+        assert health_module._health_db is first
+
+    def test_database_check_reconnects_after_fork(self, monkeypatch):
+        """Test a connection opened by another process is not reused."""
+        monkeypatch.setattr(health_module, "_health_db", None)
+        health_module.check_database()
+        parent_conn = health_module._health_db[1]
+        monkeypatch.setattr(health_module.os, "getpid", lambda: -1)
+
+        health_module.check_database()
+
+        assert health_module._health_db[0] == -1
+        assert health_module._health_db[1] is not parent_conn
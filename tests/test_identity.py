@@ -112,6 +112,20 @@ class TestKeyManager:
         decoded = base64.b64decode(signature)
         assert len(decoded) > 0
 
+    def test_signature_base64_interop(self):
+        """Signatures match the stdlib base64 encoding and have no newline."""
+        import base64
+
+        km = KeyManager.generate()
+        data = {"message": "test"}
+
+        signature = km.sign(data)
+        raw = km.private_key.sign(b'{"message":"test"}')
+
+        assert signature == base64.b64encode(raw).decode()
+        assert len(signature) == 88
+        assert KeyManager.verify(data, base64.b64encode(raw).decode(), km.public_key)
+
     def test_sign_creates_deterministic_signature(self):
         """Test that signing same data twice gives same signature."""
         km = KeyManager.generate()
@@ -189,6 +203,41 @@ class TestKeyManager:
 
         assert is_valid is False
 
+    def test_verify_batch(self):
+        """Test batch verification reports each item independently."""
+        km1 = KeyManager.generate()
+        km2 = KeyManager.generate()
+        data = [{"decision": "allow", "n": i} for i in range(3)]
+        sigs = [km1.sign(d) for d in data]
+
+        results = KeyManager.verify_batch(
+            [
+                (data[0], sigs[0], km1.public_key),
+                (data[1], sigs[1], km2.public_key),  # wrong key
+                ({"decision": "deny", "n": 2}, sigs[2], km1.public_key),  # tampered
+                (data[2], "not-base64!", km1.public_key),
+                (data[2], sigs[2], km1.public_key),
+            ]
+        )
+
+        assert results == [True, False, False, False, True]
+        assert KeyManager.verify_batch([]) == []
+
+    def test_sign_bytes_matches_sign(self):
+        """sign_bytes on canonical bytes equals sign on the dict."""
+        from lexecon.identity.signing import canonical_json_bytes
+
+        km = KeyManager.generate()
+        data = {"b": 2, "a": 1}
+        message = canonical_json_bytes(data)
+
+        signature = km.sign_bytes(message)
+
+        assert signature == km.sign(data)
+        assert KeyManager.verify_bytes(message, signature, km.public_key) is True
+        assert KeyManager.verify_bytes(message + b" ", signature, km.public_key) is False
+        assert KeyManager.verify_bytes(message, "not-base64!", km.public_key) is False
+
     def test_sign_without_private_key_raises_error(self):
         """Test that signing without private key raises error."""
         km = KeyManager()  # No key
@@ -213,12 +262,27 @@ class TestKeyManager:
 
         fingerprint = km.get_public_key_fingerprint()
 
-        # Should be 16 character hex string (first 16 chars of SHA256)
+        # Should be 16 character hex string (8-byte BLAKE2b digest)
         assert isinstance(fingerprint, str)
         assert len(fingerprint) == 16
         # Should be valid hex
         int(fingerprint, 16)
 
+    def test_fingerprint_is_blake2b_of_raw_key(self):
+        """Test fingerprint is the 8-byte BLAKE2b digest of the raw public key."""
+        import hashlib
+
+        from cryptography.hazmat.primitives import serialization
+
+        km = KeyManager.generate()
+        raw = km.public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw,
+        )
+
+        assert len(raw) == 32
+        assert km.get_public_key_fingerprint() == hashlib.blake2b(raw, digest_size=8).hexdigest()
+
     def test_fingerprint_is_deterministic(self):
         """Test that fingerprint is deterministic for same key."""
         km = KeyManager.generate()
@@ -228,6 +292,17 @@ class TestKeyManager:
 
         assert fp1 == fp2
 
+    def test_fingerprint_memoized_per_key(self):
+        """Test fingerprint is computed once and follows a replaced public key."""
+        km = KeyManager.generate()
+        fp = km.get_public_key_fingerprint()
+
+        assert km._fingerprint == (km.public_key, fp)
+
+        other = KeyManager.generate()
+        km.public_key = other.public_key
+        assert km.get_public_key_fingerprint() == other.get_public_key_fingerprint()
+
     def test_get_fingerprint_without_public_key_raises_error(self):
         """Test that getting fingerprint without key raises error."""
         km = KeyManager()
@@ -248,6 +323,19 @@ class TestKeyManager:
 
         assert sig1 == sig2
 
+    def test_canonical_json_matches_json_dumps(self):
+        """Test the shared canonical encoder matches the original json.dumps form."""
+        from lexecon.identity.signing import canonical_json_bytes
+
+        data = {
+            "z": [1, 2.5, None, True],
+            "a": {"nested": "caf\u00e9", "n": 1e-07},
+            "m": "\u2603",
+        }
+        expected = json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+        assert canonical_json_bytes(data) == expected
+
     def test_sign_handles_nested_data(self):
         """Test signing complex nested data structures."""
         km = KeyManager.generate()
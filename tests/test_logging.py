@@ -146,8 +146,8 @@ class TestStructuredFormatter:
         assert "traceback" in data["exception"]
 
     def test_format_error_without_exception(self):
-        """Test that errors without exc_info include stack trace."""
-        formatter = StructuredFormatter()
+        """Test that errors without exc_info include stack trace when enabled."""
+        formatter = StructuredFormatter(stack_traces=True)
 
         record = logging.LogRecord(
             name="test",
@@ -165,6 +165,43 @@ class TestStructuredFormatter:
         assert "stack_trace" in data
         assert isinstance(data["stack_trace"], list)
 
+    def test_format_error_stack_trace_off_by_default(self):
+        """Test that errors without exc_info skip the stack trace by default."""
+        formatter = StructuredFormatter()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.ERROR,
+            pathname="test.py",
+            lineno=1,
+            msg="Error without exception",
+            args=(),
+            exc_info=None,
+        )
+
+        data = json.loads(formatter.format(record))
+
+        assert "stack_trace" not in data
+
+    def test_format_timestamp_from_record(self):
+        """Test that the timestamp is the record creation time in UTC."""
+        formatter = StructuredFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1_700_000_000.25
+        record.msecs = 250.0
+
+        data = json.loads(formatter.format(record))
+
+        assert data["timestamp"] == "2023-11-14T22:13:20.250Z"
+
     def test_format_warning_no_stack_trace(self):
         """Test that warnings don't include stack trace."""
         formatter = StructuredFormatter()
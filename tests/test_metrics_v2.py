@@ -0,0 +1,176 @@
+"""Tests for cardinality-managed Prometheus metrics."""
+
+import importlib
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from lexecon.observability.metrics_v2 import MetricsCollector
+
+# The package re-exports the collector instance as ``metrics_v2``
+metrics_module = importlib.import_module("lexecon.observability.metrics_v2")
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestLabelChildren:
+    """Tests for cached labelled metric children."""
+
+    def test_child_resolved_once(self):
+        """Test repeated records for one label set call .labels() once."""
+        collector = MetricsCollector()
+        metric = MagicMock()
+
+        first = collector._child(metric, "GET", "/health")
+        second = collector._child(metric, "GET", "/health")
+
+        assert first is second
+        metric.labels.assert_called_once_with("GET", "/health")
+
+    def test_cache_bounded(self, monkeypatch):
+        """Test label sets past the cache limit are recorded without being cached."""
+        monkeypatch.setattr(metrics_module, "LABEL_CHILD_CACHE_SIZE", 1)
+        collector = MetricsCollector()
+        metric = MagicMock()
+
+        collector._child(metric, "a")
+        collector._child(metric, "b")
+        collector._child(metric, "b")
+
+        assert len(collector._children) == 1
+        assert metric.labels.call_count == 3
+
+    def test_record_request_updates_metrics(self):
+        """Test cached children update the registered metrics."""
+        collector = MetricsCollector()
+        labels = {"method": "GET", "endpoint_group": "/children/{id}", "status_class": "2xx"}
+        before = _sample("lexecon_http_requests_total", **labels)
+
+        collector.record_request("GET", "/children/1", 200, 0.01)
+        collector.record_request("GET", "/children/2", 204, 0.01)
+
+        assert _sample("lexecon_http_requests_total", **labels) == before + 2
+        assert (
+            _sample(
+                "lexecon_http_request_duration_seconds_count",
+                method="GET",
+                endpoint_group="/children/{id}",
+            )
+            >= 2
+        )
+
+    def test_record_decision_labels(self):
+        """Test decision metrics keep their label mapping."""
+        collector = MetricsCollector()
+        labels = {"allowed": "false", "risk_level": "5", "policy_mode": "children"}
+        before = _sample("lexecon_decisions_total", **labels)
+
+        collector.record_decision(False, "actor:1", 9, 0.01, policy_mode="children")
+
+        assert _sample("lexecon_decisions_total", **labels) == before + 1
+
+    def test_record_decision_shares_label_strings(self):
+        """Test bool and risk labels reuse the module's label constants."""
+        collector = MetricsCollector()
+        collector._child = MagicMock()
+
+        collector.record_decision(True, "actor:1", 3, 0.01)
+
+        _, allowed_label, risk_label, _ = collector._child.call_args_list[0].args
+        assert allowed_label is metrics_module._BOOL_LABELS[1]
+        assert risk_label is metrics_module._RISK_LABELS[3]
+
+
+class TestTiming:
+    """Tests for perf_counter-based timing helpers."""
+
+    def test_time_request_observes_block(self, monkeypatch):
+        """Test the timed block's perf_counter duration is observed once."""
+        collector = MetricsCollector()
+        collector._child = MagicMock()
+        ticks = iter([5.0, 5.5])
+        monkeypatch.setattr(metrics_module.time, "perf_counter", lambda: next(ticks))
+
+        with collector.time_request("GET", "/items/42"):
+            pass
+
+        collector._child.assert_called_once_with(
+            metrics_module.http_request_duration_seconds, "GET", "/items/{id}"
+        )
+        collector._child.return_value.observe.assert_called_once_with(0.5)
+
+    def test_time_decision_observes_on_error(self):
+        """Test a failing decision is still timed."""
+        collector = MetricsCollector()
+        collector._child = MagicMock()
+
+        with pytest.raises(RuntimeError):
+            with collector.time_decision(policy_mode="permissive"):
+                raise RuntimeError("boom")
+
+        collector._child.assert_called_once_with(
+            metrics_module.decision_evaluation_duration_seconds, "permissive", "moderate"
+        )
+        collector._child.return_value.observe.assert_called_once()
+
+
+class TestBulkRecording:
+    """Tests for batched policy and token metrics."""
+
+    def test_policies_loaded_in_bulk(self):
+        """Test a bulk policy load updates the counter and gauge by the batch size."""
+        before_loaded = _sample("lexecon_policies_loaded_total", policy_version="bulk")
+        before_active = _sample("lexecon_active_policies")
+
+        metrics_module.record_policies_loaded(["a", "b", "c"], version="bulk")
+        metrics_module.record_policy_load("d", version="bulk")
+
+        assert _sample("lexecon_policies_loaded_total", policy_version="bulk") == before_loaded + 4
+        assert _sample("lexecon_active_policies") == before_active + 4
+
+    def test_tokens_issued_grouped_by_scope(self):
+        """Test issued tokens are counted per scope type in one update each."""
+        before_read = _sample("lexecon_tokens_issued_total", scope_type="bulk_read")
+        before_active = _sample("lexecon_active_tokens")
+
+        metrics_module.record_tokens_issued(["bulk_read", "bulk_write", "bulk_read"])
+
+        assert _sample("lexecon_tokens_issued_total", scope_type="bulk_read") == before_read + 2
+        assert _sample("lexecon_tokens_issued_total", scope_type="bulk_write") == 1
+        assert _sample("lexecon_active_tokens") == before_active + 3
+
+
+class TestExport:
+    """Tests for the cached scrape body."""
+
+    def test_export_reused_within_ttl(self, monkeypatch):
+        """Test scrapes inside the TTL reuse one exposition."""
+        collector = MetricsCollector(export_ttl_seconds=60)
+        exports = []
+        monkeypatch.setattr(
+            metrics_module, "generate_latest", lambda registry: exports.append(1) or b"body"
+        )
+
+        assert collector.export_metrics() == b"body"
+        assert collector.export_metrics() == b"body"
+        assert len(exports) == 1
+
+    def test_export_refreshed_after_ttl(self, monkeypatch):
+        """Test a zero TTL exports on every scrape."""
+        collector = MetricsCollector(export_ttl_seconds=0)
+        exports = []
+        monkeypatch.setattr(
+            metrics_module, "generate_latest", lambda registry: exports.append(1) or b"body"
+        )
+
+        collector.export_metrics()
+        collector.export_metrics()
+
+        assert len(exports) == 2
+
+    def test_export_is_prometheus_text(self):
+        """Test the exported body contains registered metrics."""
+        assert b"lexecon_node_uptime_seconds" in MetricsCollector().export_metrics()
@@ -0,0 +1,85 @@
+"""
+Tests for the lexecon.observability package exports.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import lexecon.observability as observability
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy loading of submodule exports."""
+
+    def test_import_defers_submodules(self):
+        """Importing the package loads no observability submodules."""
+        loaded = _run(
+            """
+            import sys
+            import lexecon.observability
+            print(sorted(m for m in sys.modules if m.startswith("lexecon.observability.")))
+            """
+        )
+
+        assert loaded == "[]"
+
+    def test_get_logger_loads_only_logging(self):
+        """Accessing get_logger imports the logging submodule alone."""
+        loaded = _run(
+            """
+            import sys
+            from lexecon.observability import get_logger
+            print(sorted(m for m in sys.modules if m.startswith("lexecon.observability.")))
+            """
+        )
+
+        assert loaded == "['lexecon.observability.logging']"
+
+    def test_metrics_not_shadowed_by_submodule(self):
+        """Importing the metrics submodules keeps the exported instances."""
+        names = _run(
+            """
+            import lexecon.observability.metrics
+            import lexecon.observability.metrics_v2
+            from lexecon.observability import metrics, metrics_v2
+            print(type(metrics).__name__, type(metrics_v2).__name__)
+            """
+        )
+
+        assert names == "MetricsCollector MetricsCollector"
+
+    def test_aliases_resolve(self):
+        """Renamed v2 exports resolve to the submodule objects."""
+        from lexecon.observability import health_v2, tracing_v2
+
+        assert observability.HealthStatusV2 is health_v2.HealthStatus
+        assert observability.tracer_v2 is tracing_v2.tracer
+
+    def test_all_is_single_tuple(self):
+        """__all__ is an immutable tuple listing each lazy export once."""
+        assert isinstance(observability.__all__, tuple)
+        assert len(set(observability.__all__)) == len(observability.__all__)
+        assert set(observability.__all__) == set(observability._LAZY)
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ is reachable."""
+        for name in observability.__all__:
+            assert getattr(observability, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            observability.does_not_exist